@@ -0,0 +1,104 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Short-lived in-process cache for read-only RDS API results."""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire a fixed number of seconds after being stored.
+
+    Entries are kept in insertion order so the oldest one is evicted once the cache is full.
+    Values are copied on the way in and out, so callers can never modify a cached result.
+
+    Every clear() starts a new generation. A caller that fetches a value while a clear() may
+    run takes generation() before fetching and passes it to set(); the value is dropped if
+    the cache was cleared in the meantime, so a result read before a write is never cached
+    after it.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept at once
+        """
+        self._maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for a key, or None if it is missing or expired.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            A copy of the cached value, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expiration_time = entry
+            if expiration_time < time.monotonic():
+                del self._entries[key]
+                return None
+        return copy.deepcopy(value)
+
+    def generation(self) -> int:
+        """Return the number of times the cache has been cleared.
+
+        Returns:
+            The current generation
+        """
+        return self._generation
+
+    def set(self, key: Hashable, value: Any, ttl: float, generation: Optional[int] = None) -> None:
+        """Store a value for ttl seconds.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            ttl: Lifetime of the entry in seconds; values <= 0 are not stored
+            generation: The generation() taken before the value was fetched; the value is
+                not stored if the cache has been cleared since
+        """
+        if ttl <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries.pop(key, None)
+            while len(self._entries) >= self._maxsize:
+                self._entries.popitem(last=False)
+            self._entries[key] = (value, time.monotonic() + ttl)
+
+    def clear(self) -> None:
+        """Remove every entry and start a new generation."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+# results of DescribeDBClusters calls and the cluster list resource; cleared by every
+# mutating tool so that a change is visible on the next read
+describe_cache = TTLCache()
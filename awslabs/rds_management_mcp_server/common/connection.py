@@ -14,10 +14,8 @@
 
 """Connection management for AWS services used by Amazon RDS Management MCP Server."""
 
-import boto3
 import os
-from botocore.config import Config
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class BaseConnectionManager:
@@ -27,6 +25,58 @@ class BaseConnectionManager:
     _service_name: str = ''
     _env_prefix: str = ''
 
+    # set from the CLI; when unset the AWS_PROFILE / AWS_REGION environment is used
+    _profile_name: Optional[str] = None
+    _region_name: Optional[str] = None
+
+    # sessions shared by every service client, so credentials resolve once per profile;
+    # close_connection drops the session so that changed credentials are picked up again
+    _sessions: Dict[Tuple[str, str], Any] = {}
+
+    # the (profile, region) of the session the current client was created from
+    _session_key: Optional[Tuple[str, str]] = None
+
+    @staticmethod
+    def configure(profile_name: Optional[str] = None, region_name: Optional[str] = None):
+        """Set the AWS profile and region used for new clients.
+
+        Args:
+            profile_name: The AWS credential profile; None falls back to AWS_PROFILE
+            region_name: The AWS region; None falls back to AWS_REGION
+        """
+        BaseConnectionManager._profile_name = profile_name
+        BaseConnectionManager._region_name = region_name
+
+    @staticmethod
+    def get_session(profile_name: str, region_name: str) -> Any:
+        """Get or create the boto3 session for a profile and region.
+
+        Args:
+            profile_name: The AWS credential profile
+            region_name: The AWS region
+
+        Returns:
+            boto3.Session: A session whose resolved credentials are reused by later clients
+            until a client created from it is closed
+        """
+        key = (profile_name, region_name)
+        session = BaseConnectionManager._sessions.get(key)
+        if session is None:
+            import boto3
+
+            session = boto3.Session(profile_name=profile_name, region_name=region_name)
+            BaseConnectionManager._sessions[key] = session
+        return session
+
+    @classmethod
+    def max_pool_connections(cls) -> int:
+        """Get the size of the client's HTTP connection pool.
+
+        Returns:
+            The <prefix>_MAX_POOL_CONNECTIONS environment variable, 50 when it is unset
+        """
+        return int(os.environ.get(f'{cls._env_prefix}_MAX_POOL_CONNECTIONS', '50'))
+
     @classmethod
     def get_connection(cls) -> Any:
         """Get or create an AWS service client connection with retry capabilities.
@@ -35,38 +85,52 @@ class BaseConnectionManager:
             boto3.client: An AWS service client configured with retries
         """
         if cls._client is None:
-            # get AWS configuration from environment
-            aws_profile = os.environ.get('AWS_PROFILE', 'default')
-            aws_region = os.environ.get('AWS_REGION', 'us-east-1')
+            # boto3 and botocore take a noticeable share of server start-up to import; only
+            # pay for them once a client is actually needed
+            from botocore.config import Config
+
+            # get AWS configuration from the CLI, falling back to the environment
+            aws_profile = cls._profile_name or os.environ.get('AWS_PROFILE', 'default')
+            aws_region = cls._region_name or os.environ.get('AWS_REGION', 'us-east-1')
 
             # configuration retry settings
             max_retries = int(os.environ.get(f'{cls._env_prefix}_MAX_RETRIES', '3'))
             retry_mode = os.environ.get(f'{cls._env_prefix}_RETRY_MODE', 'standard')
             connect_timeout = int(os.environ.get(f'{cls._env_prefix}_CONNECT_TIMEOUT', '5'))
             read_timeout = int(os.environ.get(f'{cls._env_prefix}_READ_TIMEOUT', '10'))
+            # keep-alive pool shared by every tool call running in worker threads
+            max_pool_connections = cls.max_pool_connections()
 
             # create boto3 config with retry settings
             config = Config(
                 retries={'max_attempts': max_retries, 'mode': retry_mode},
                 connect_timeout=connect_timeout,
                 read_timeout=read_timeout,
+                max_pool_connections=max_pool_connections,
                 # configuration custom user agent to identify requests from LLM/MCP
                 user_agent_extra='MCP/AmazonRDSManagementMCPServer',
             )
 
-            # init AWS client with session and config
-            # if user changes credential, it will be reflected immediately in the next call
-            session = boto3.Session(profile_name=aws_profile, region_name=aws_region)
+            # init AWS client with the shared session and config
+            session = cls.get_session(aws_profile, aws_region)
             cls._client = session.client(service_name=cls._service_name, config=config)
+            cls._session_key = (aws_profile, aws_region)
 
         return cls._client
 
     @classmethod
     def close_connection(cls) -> None:
-        """Close the AWS service client connection."""
+        """Close the AWS service client connection.
+
+        The session the client was created from is discarded as well, so the next
+        connection resolves credentials again and picks up any that have changed.
+        """
         if cls._client is not None:
             cls._client.close()
             cls._client = None
+        if cls._session_key is not None:
+            BaseConnectionManager._sessions.pop(cls._session_key, None)
+            cls._session_key = None
 
 
 class RDSConnectionManager(BaseConnectionManager):
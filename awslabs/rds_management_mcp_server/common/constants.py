@@ -27,6 +27,9 @@ SUCCESS_REBOOTED = 'Successfully rebooted {}'
 SUCCESS_RESTORED = 'Successfully restored {}'
 SUCCESS_RESET = 'Successfully reset {}'
 
+# Upper bound on RDS describe calls a single resource read fans out at once
+MAX_CONCURRENT_DESCRIBE_CALLS = 10
+
 # Engine port mapping
 ENGINE_PORT_MAP = {
     'aurora': 3306,
@@ -22,17 +22,20 @@ class RDSContext:
 
     _readonly = True
     _max_items = 100
+    _cache_ttl = 0.0
 
     @classmethod
-    def initialize(cls, readonly: bool = True, max_items: int = 100):
+    def initialize(cls, readonly: bool = True, max_items: int = 100, cache_ttl: float = 0.0):
         """Initialize the context.
 
         Args:
             readonly (bool): Whether to run in readonly mode. Defaults to True.
             max_items (int): Maximum number of items returned from API responses. Defaults to 100.
+            cache_ttl (float): Seconds to cache read-only cluster listings. Defaults to 0 (off).
         """
         cls._readonly = readonly
         cls._max_items = max_items
+        cls._cache_ttl = cache_ttl
 
     @classmethod
     def readonly_mode(cls) -> bool:
@@ -52,6 +55,15 @@ class RDSContext:
         """
         return cls._max_items
 
+    @classmethod
+    def cache_ttl(cls) -> float:
+        """Get the lifetime of cached read-only results.
+
+        Returns:
+            The cache lifetime in seconds; 0 disables caching
+        """
+        return cls._cache_ttl
+
     @classmethod
     def get_pagination_config(cls) -> Dict[str, Any]:
         """Get the pagination config needed for API responses.
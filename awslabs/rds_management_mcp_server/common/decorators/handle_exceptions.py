@@ -18,13 +18,45 @@ from botocore.exceptions import ClientError
 from functools import wraps
 from inspect import iscoroutinefunction
 from loguru import logger
-from typing import Any, Callable
+from typing import Any, Callable, Dict
 
 
 ERROR_CLIENT = 'Client error: {}. Please check the error details and try again.'
 ERROR_UNEXPECTED = 'Unexpected error: {}. Please try again or check the logs for more information.'
 
 
+def format_exception(error: BaseException, operation: str) -> Dict[str, Any]:
+    """Convert an exception into the standardized error response.
+
+    Args:
+        error: The exception raised by the operation
+        operation: The name of the failed operation
+
+    Returns:
+        Dictionary describing the error
+    """
+    if isinstance(error, ClientError):
+        error_code = error.response['Error']['Code']
+        error_message = error.response['Error']['Message']
+        logger.error('Failed with client error {}: {}', error_code, error_message)
+
+        return {
+            'error': ERROR_CLIENT.format(error_code),
+            'error_code': error_code,
+            'error_message': error_message,
+            'operation': operation,
+        }
+
+    logger.exception('Failed with unexpected error: {}', error)
+
+    return {
+        'error': ERROR_UNEXPECTED.format(str(error)),
+        'error_type': type(error).__name__,
+        'error_message': str(error),
+        'operation': operation,
+    }
+
+
 def handle_exceptions(func: Callable) -> Callable:
     """Decorator to handle exceptions in MCP operations.
 
@@ -48,25 +80,6 @@ def handle_exceptions(func: Callable) -> Callable:
                 return await func(*args, **kwargs)
             return func(*args, **kwargs)
         except Exception as error:
-            if isinstance(error, ClientError):
-                error_code = error.response['Error']['Code']
-                error_message = error.response['Error']['Message']
-                logger.error(f'Failed with client error {error_code}: {error_message}')
-
-                return {
-                    'error': ERROR_CLIENT.format(error_code),
-                    'error_code': error_code,
-                    'error_message': error_message,
-                    'operation': func.__name__,
-                }
-            else:
-                logger.exception(f'Failed with unexpected error: {str(error)}')
-
-                return {
-                    'error': ERROR_UNEXPECTED.format(str(error)),
-                    'error_type': type(error).__name__,
-                    'error_message': str(error),
-                    'operation': func.__name__,
-                }
+            return format_exception(error, func.__name__)
 
     return wrapper
@@ -14,6 +14,7 @@
 
 """Read-only mode check decorator for the RDS Management MCP Server."""
 
+from ..cache import describe_cache
 from ..context import RDSContext
 from functools import wraps
 from inspect import iscoroutinefunction
@@ -29,7 +30,8 @@ def readonly_check(func: Callable) -> Callable:
 
     This decorator automatically checks if the server is in readonly mode
     and blocks write operations by returning a standardized JSON response.
-    It determines the operation type from the function name.
+    It determines the operation type from the function name. Once a permitted
+    operation finishes, cached describe results are discarded.
 
     Args:
         func: The function to wrap
@@ -37,21 +39,27 @@ def readonly_check(func: Callable) -> Callable:
     Returns:
         The wrapped function that checks readonly mode
     """
+    # the blocked response only depends on the decorated function, so build its parts once
+    operation = func.__name__
+    error_message = f"Operation '{operation}' requires write access. The server is currently in read-only mode."
+    is_coroutine = iscoroutinefunction(func)
 
     @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any):
         if RDSContext.readonly_mode():
-            operation = func.__name__
-            error_message = f"Operation '{operation}' requires write access. The server is currently in read-only mode."
-            logger.warning(f'Operation blocked in readonly mode: {operation}')
+            logger.warning('Operation blocked in readonly mode: {}', operation)
             return {
                 'error': ERROR_READONLY_MODE,
                 'operation': operation,
                 'message': error_message,
             }
 
-        if iscoroutinefunction(func):
-            return await func(*args, **kwargs)
-        return func(*args, **kwargs)
+        try:
+            if is_coroutine:
+                return await func(*args, **kwargs)
+            return func(*args, **kwargs)
+        finally:
+            # a write may have changed what cached describe results report
+            describe_cache.clear()
 
     return wrapper
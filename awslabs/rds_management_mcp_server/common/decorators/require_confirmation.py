@@ -14,8 +14,9 @@
 
 """Confirmation and permission management for the RDS Management MCP Server."""
 
+import secrets
+import threading
 import time
-import uuid
 from functools import wraps
 from inspect import iscoroutinefunction, signature
 from loguru import logger
@@ -25,6 +26,9 @@ from typing import Any, Callable, Dict, Optional, Tuple
 # Expiration time for pending operations (in seconds)
 EXPIRATION_TIME = 300  # 5 minutes
 
+# Upper bound on outstanding confirmation tokens; the oldest is evicted first
+MAX_PENDING_OPERATIONS = 1024
+
 STANDARD_CONFIRMATION_MESSAGE = """
 WARNING: You are about to perform an operation that may have significant impact.
 
@@ -61,6 +65,13 @@ OPERATION_IMPACTS = {
         'reversible': 'Yes - can change status again',
         'estimated_time': '2-8 minutes',
     },
+    'ChangeDBClustersStatus': {
+        'risk': 'high',
+        'downtime': 'Varies by action (complete for stop, brief for reboot) on every listed cluster',
+        'data_loss': 'None expected',
+        'reversible': 'Yes - can change status again',
+        'estimated_time': '2-8 minutes',
+    },
     'ChangeDBInstanceStatus': {
         'risk': 'high',
         'downtime': 'Varies by action (complete for stop, brief for reboot)',
@@ -102,12 +113,33 @@ RESOURCE_MAPPINGS = {
     'db_cluster_identifier': 'DB cluster',
     'db_instance_identifier': 'DB instance',
     'db_snapshot_identifier': 'DB snapshot',
+    'db_cluster_identifiers': 'DB clusters',
 }
 
+# parameters that are never stored with a pending operation
+_EXCLUDED_PARAMS = frozenset({'ctx', 'confirmation_token'})
+
+# parameters that must match between the pending operation and the confirmed call
+_RESOURCE_ID_KEYS = (
+    'db_cluster_identifier',
+    'db_instance_identifier',
+    'db_snapshot_identifier',
+    'db_cluster_identifiers',
+)
+
 # dictionary to store pending operations
-# key: confirmation_token, value: (operation_type, params, expiration_time)
+# key: confirmation_token, value: (operation_type, params, expiration_time on the monotonic clock)
 _pending_operations = {}
 
+# guards writes to _pending_operations; lookups by token stay lock-free
+_pending_operations_lock = threading.Lock()
+
+_CONFIRMATION_INSTRUCTIONS = 'To confirm, please call this function again with the confirmation_token parameter set to this token.'
+
+_INVALID_TOKEN_ERROR = {
+    'error': 'Invalid or expired confirmation token. Please request a new token by calling this tool without the confirmation token set.'
+}
+
 
 def _get_operation_impact(operation: str) -> Dict[str, Any]:
     """Get detailed impact information for an operation.
@@ -119,34 +151,46 @@ def _get_operation_impact(operation: str) -> Dict[str, Any]:
     Raises:
         ValueError: If operation is not defined in OPERATION_IMPACTS
     """
-    if operation not in OPERATION_IMPACTS:
+    impact = OPERATION_IMPACTS.get(operation)
+    if impact is None:
         raise ValueError(f"Operation '{operation}' is not defined in OPERATION_IMPACTS")
 
-    return OPERATION_IMPACTS[operation]
+    return impact
 
 
 def _get_resource_info(params: Dict[str, Any]) -> Tuple[str, str]:
     """Extract resource type and identifier from parameters."""
     for param_name, resource_type in RESOURCE_MAPPINGS.items():
-        if param_name in params and params[param_name]:
-            return resource_type, params[param_name]
+        identifier = params.get(param_name)
+        if identifier:
+            if isinstance(identifier, list):
+                identifier = ', '.join(identifier)
+            return resource_type, identifier
     return 'resource', 'unknown'
 
 
 def _cleanup_expired_operations() -> None:
-    """Remove expired operations from the pending operations dictionary."""
-    current_time = time.time()
-    expired_tokens = [
-        token
-        for token, (_, _, expiration_time) in _pending_operations.items()
-        if expiration_time < current_time
-    ]
-    for token in expired_tokens:
-        del _pending_operations[token]
+    """Remove expired operations from the pending operations dictionary.
+
+    Every token gets the same lifetime on the monotonic clock, so insertion order is
+    expiration order and the scan can stop at the first live token.
+    """
+    current_time = time.monotonic()
+    with _pending_operations_lock:
+        expired_tokens = []
+        for token, (_, _, expiration_time) in _pending_operations.items():
+            if expiration_time >= current_time:
+                break
+            expired_tokens.append(token)
+        for token in expired_tokens:
+            del _pending_operations[token]
 
 
 def _validate_confirmation_token(
-    token: str, operation_type: str, params: Dict[str, Any]
+    token: str,
+    operation_type: str,
+    params: Dict[str, Any],
+    id_keys: Tuple[str, ...],
 ) -> Optional[Dict[str, str]]:
     """Validate a confirmation token.
 
@@ -154,6 +198,7 @@ def _validate_confirmation_token(
         token: The confirmation token to validate
         operation_type: The expected operation type
         params: The current operation parameters
+        id_keys: The resource identifier parameters in the operation signature
 
     Returns:
         Error dict if validation fails, None if validation succeeds
@@ -161,9 +206,7 @@ def _validate_confirmation_token(
     # Validate token
     pending_op = _pending_operations.get(token)
     if not pending_op:
-        return {
-            'error': 'Invalid or expired confirmation token. Please request a new token by calling this tool without the confirmation token set.'
-        }
+        return dict(_INVALID_TOKEN_ERROR)
 
     op_type, stored_params, _ = pending_op
 
@@ -171,9 +214,11 @@ def _validate_confirmation_token(
     if op_type != operation_type:
         return {'error': f'Invalid operation type. Expected "{operation_type}", got "{op_type}".'}
 
-    # Validate resource identifiers
-    for key in ['db_cluster_identifier', 'db_instance_identifier', 'db_snapshot_identifier']:
-        if key in stored_params and key in params and stored_params[key] != params[key]:
+    # Validate resource identifiers; the token must name the same kind of resource
+    if tuple(key for key in _RESOURCE_ID_KEYS if key in stored_params) != id_keys:
+        return {'error': 'Parameter mismatch. The confirmation token is for a different resource.'}
+    for key in id_keys:
+        if stored_params[key] != params[key]:
             return {
                 'error': f'Parameter mismatch. The confirmation token is for a different {key}.'
             }
@@ -190,60 +235,72 @@ def require_confirmation(operation_type: str) -> Callable:
     Returns:
         Decorator function
     """
+    # invariant for every call of the decorated function
+    operation_name = operation_type.replace('_', ' ').title()
+    warning_template = STANDARD_CONFIRMATION_MESSAGE.replace('{operation}', operation_name)
 
     def decorator(func: Callable) -> Callable:
+        sig = signature(func)
+        is_coroutine = iscoroutinefunction(func)
+        id_keys = tuple(key for key in _RESOURCE_ID_KEYS if key in sig.parameters)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any):
             confirmation_token = kwargs.get('confirmation_token')
 
             _cleanup_expired_operations()
 
-            sig = signature(func)
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
             params = {}
             for param_name, param_value in bound_args.arguments.items():
-                if param_name not in ['ctx', 'confirmation_token']:
+                if param_name not in _EXCLUDED_PARAMS:
                     params[param_name] = param_value
 
             if not confirmation_token:
                 impact = _get_operation_impact(operation_type)
                 resource_type, identifier = _get_resource_info(params)
-                operation_name = operation_type.replace('_', ' ').title()
-
-                token = str(uuid.uuid4())
-                _pending_operations[token] = (
-                    operation_type,
-                    params,
-                    time.time() + EXPIRATION_TIME,
-                )
 
-                warning_message = STANDARD_CONFIRMATION_MESSAGE.format(
-                    operation=operation_name,
+                token = secrets.token_hex(16)
+                with _pending_operations_lock:
+                    while len(_pending_operations) >= MAX_PENDING_OPERATIONS:
+                        del _pending_operations[next(iter(_pending_operations))]
+                    _pending_operations[token] = (
+                        operation_type,
+                        params,
+                        time.monotonic() + EXPIRATION_TIME,
+                    )
+
+                warning_message = warning_template.format(
                     resource_type=resource_type,
                     identifier=identifier,
                     risk_level=impact.get('risk', 'Unknown'),
                 )
 
-                logger.info(f'Confirmation required for operation: {operation_type}')
+                logger.info('Confirmation required for operation: {}', operation_type)
                 return {
                     'requires_confirmation': True,
                     'warning': warning_message,
                     'impact': impact,
                     'confirmation_token': token,
-                    'message': 'To confirm, please call this function again with the confirmation_token parameter set to this token.',
+                    'message': _CONFIRMATION_INSTRUCTIONS,
                 }
 
-            error = _validate_confirmation_token(confirmation_token, operation_type, params)
+            error = _validate_confirmation_token(
+                confirmation_token, operation_type, params, id_keys
+            )
             if error:
                 return error
 
-            # Remove the pending operation
-            del _pending_operations[confirmation_token]
+            # Consume the token; a concurrent call that already used it loses the race
+            with _pending_operations_lock:
+                consumed = _pending_operations.pop(confirmation_token, None) is not None
+            if not consumed:
+                return dict(_INVALID_TOKEN_ERROR)
 
             # Execute the function
-            if iscoroutinefunction(func):
+            if is_coroutine:
                 return await func(*args, **kwargs)
             return func(*args, **kwargs)
 
@@ -0,0 +1,33 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared tool parameter types for the RDS Management MCP Server."""
+
+from pydantic import Field
+from typing import Optional
+from typing_extensions import Annotated
+
+
+DBClusterIdentifier = Annotated[str, Field(description='The identifier for the DB cluster')]
+
+DBInstanceIdentifier = Annotated[str, Field(description='The identifier for the DB instance')]
+
+IncludeFormattedCluster = Annotated[
+    bool,
+    Field(description='Whether to add a simplified formatted_cluster summary to the response'),
+]
+
+PaginationMarker = Annotated[Optional[str], Field(description='Pagination token')]
+
+MaxRecords = Annotated[Optional[int], Field(description='Maximum number of records to return')]
@@ -14,7 +14,14 @@
 
 """Common MCP server configuration."""
 
+import asyncio
+import weakref
+from .connection import RDSConnectionManager
 from .constants import MCP_SERVER_VERSION
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from loguru import logger
 from mcp.server.fastmcp import FastMCP
 
 
@@ -35,10 +42,43 @@ Always verify resource identifiers and understand the impact of operations befor
 
 SERVER_DEPENDENCIES = ['boto3', 'botocore', 'pydantic', 'loguru', 'mypy-boto3-rds']
 
+_executor_loops: 'weakref.WeakSet[asyncio.AbstractEventLoop]' = weakref.WeakSet()
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Give the server's event loop a dedicated, bounded default executor.
+
+    The loop shuts the executor down when it closes. The shared RDS client is also built
+    here, so the first tool call does not pay for loading botocore's service model.
+
+    Args:
+        server: The FastMCP server being started
+    """
+    loop = asyncio.get_running_loop()
+    # the lifespan runs once per session, so only the first one installs the executor
+    if loop not in _executor_loops:
+        # one worker thread per connection in the RDS client's HTTP connection pool
+        loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=RDSConnectionManager.max_pool_connections(),
+                thread_name_prefix='rds-io',
+            )
+        )
+        _executor_loops.add(loop)
+        try:
+            await asyncio.to_thread(RDSConnectionManager.get_connection)
+        except Exception as e:
+            # tools report the same error when they ask for the client
+            logger.warning('Could not create the RDS client at startup: {}', e)
+    yield
+
+
 # FastMCP instance
 mcp = FastMCP(
     'awslabs.rds-management-mcp-server',
     version=MCP_SERVER_VERSION,
     instructions=SERVER_INSTRUCTIONS,
     dependencies=SERVER_DEPENDENCIES,
+    lifespan=server_lifespan,
 )
@@ -14,16 +14,44 @@
 
 """General utility functions for the RDS Management MCP Server."""
 
+import datetime
+import re
 from ..common.constants import MCP_SERVER_VERSION as SERVER_VERSION
-from botocore.client import BaseClient
-from typing import Any, Callable, Dict, List, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
 
 
 T = TypeVar('T', bound=object)
 
+# tags added to every resource created by the MCP server, as (key, value) pairs
+_MCP_TAGS = (
+    ('mcp_server_version', SERVER_VERSION),
+    ('created_by', 'rds-management-mcp-server'),
+)
+
+
+# RDS identifiers: 1-63 letters, digits or hyphens, starting with a letter, with no
+# trailing hyphen and no two consecutive hyphens
+_DB_IDENTIFIER_RE = re.compile(r'[A-Za-z](?!.*--)[A-Za-z0-9-]{0,62}(?<!-)')
+
+
+def validate_db_identifier(identifier: str) -> bool:
+    """Check whether a string is a valid RDS DB cluster or instance identifier.
+
+    Args:
+        identifier: The identifier to validate
+
+    Returns:
+        True if the identifier follows the RDS naming rules, False otherwise
+    """
+    return _DB_IDENTIFIER_RE.fullmatch(identifier) is not None
+
 
 def handle_paginated_aws_api_call(
-    client: BaseClient,
+    client: 'BaseClient',
     paginator_name: str,
     operation_parameters: Dict[str, Any],
     format_function: Callable[[Any], T],
@@ -48,15 +76,37 @@ def handle_paginated_aws_api_call(
     }
     page_iterator = paginator.paginate(**operation_parameters)
     for page in page_iterator:
-        for item in page.get(result_key, []):
-            results.append(format_function(item))
+        results.extend(map(format_function, page.get(result_key, [])))
 
     return results
 
 
+def select_optional_params(
+    spec: Sequence[Tuple[str, bool]], values: Sequence[Any]
+) -> Dict[str, Any]:
+    """Select the optional AWS API parameters that were provided.
+
+    Args:
+        spec: (AWS parameter name, keep_falsy) pairs. With keep_falsy the value is sent
+            whenever it is not None, otherwise only when it is truthy
+        values: The argument values, in the same order as spec
+
+    Returns:
+        Dictionary of AWS parameter names to the provided values
+    """
+    return {
+        key: value
+        for (key, keep_falsy), value in zip(spec, values)
+        if (value is not None if keep_falsy else value)
+    }
+
+
 def format_rds_api_response(response: Dict[str, Any]) -> Dict[str, Any]:
     """Format AWS API response for MCP.
 
+    The result is returned as a plain dict rather than a JSON string; FastMCP encodes tool
+    results with pydantic-core, so no intermediate serialization round trip is needed here.
+
     Args:
         response: Raw AWS API response
 
@@ -64,11 +114,10 @@ def format_rds_api_response(response: Dict[str, Any]) -> Dict[str, Any]:
         Formatted response dictionary
     """
     # remove ResponseMetadata as it's not useful for LLMs
-    if 'ResponseMetadata' in response:
-        del response['ResponseMetadata']
+    response.pop('ResponseMetadata', None)
 
-    # convert datetime objects to strings
-    return convert_datetime_to_string(response)
+    # convert datetime objects to strings without copying the response
+    return _convert_datetime_in_place(response)
 
 
 def convert_datetime_to_string(obj: Any) -> Any:
@@ -80,17 +129,60 @@ def convert_datetime_to_string(obj: Any) -> Any:
     Returns:
         Object with datetime objects converted to strings
     """
-    import datetime
-
-    if isinstance(obj, datetime.datetime):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: convert_datetime_to_string(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetime_to_string(item) for item in obj]
+    converter = _CONVERTERS.get(type(obj))
+    return obj if converter is None else converter(obj)
+
+
+def _convert_datetime_in_place(obj: Any) -> Any:
+    """Convert datetime objects to ISO format strings, mutating dicts and lists in place.
+
+    Unlike convert_datetime_to_string, no parallel copy of the object tree is built.
+
+    Args:
+        obj: Object to convert
+
+    Returns:
+        The same object with datetime objects converted to strings
+    """
+    converter = _IN_PLACE_CONVERTERS.get(type(obj))
+    return obj if converter is None else converter(obj)
+
+
+def _convert_dict(obj: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: convert_datetime_to_string(v) for k, v in obj.items()}
+
+
+def _convert_list(obj: List[Any]) -> List[Any]:
+    return [convert_datetime_to_string(item) for item in obj]
+
+
+def _convert_dict_in_place(obj: Dict[str, Any]) -> Dict[str, Any]:
+    for key, value in obj.items():
+        obj[key] = _convert_datetime_in_place(value)
+    return obj
+
+
+def _convert_list_in_place(obj: List[Any]) -> List[Any]:
+    for index, item in enumerate(obj):
+        obj[index] = _convert_datetime_in_place(item)
     return obj
 
 
+# dispatch on the exact type: boto3 only produces plain dicts, lists and datetimes,
+# and an identity lookup is cheaper than a chain of isinstance checks per node
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    datetime.datetime: datetime.datetime.isoformat,
+    dict: _convert_dict,
+    list: _convert_list,
+}
+
+_IN_PLACE_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    datetime.datetime: datetime.datetime.isoformat,
+    dict: _convert_dict_in_place,
+    list: _convert_list_in_place,
+}
+
+
 def add_mcp_tags(params: Dict[str, Any]) -> Dict[str, Any]:
     """Add MCP server version tag to resource creation parameters.
 
@@ -100,8 +192,9 @@ def add_mcp_tags(params: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Parameters with MCP tags added
     """
-    tags = params.get('Tags', [])
-    tags.append({'Key': 'mcp_server_version', 'Value': SERVER_VERSION})
-    tags.append({'Key': 'created_by', 'Value': 'rds-management-mcp-server'})
-    params['Tags'] = tags
+    # build a new list and new tag dicts so no call shares tags with a caller or another call
+    params['Tags'] = [
+        *(params.get('Tags') or ()),
+        *({'Key': key, 'Value': value} for key, value in _MCP_TAGS),
+    ]
     return params
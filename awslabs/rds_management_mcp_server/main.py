@@ -17,6 +17,7 @@
 import argparse
 import awslabs.rds_management_mcp_server.resources  # noqa: F401 - imported for side effects to register resources
 import awslabs.rds_management_mcp_server.tools  # noqa: F401 - imported for side effects to register tools
+from awslabs.rds_management_mcp_server.common.connection import RDSConnectionManager
 from awslabs.rds_management_mcp_server.common.constants import MCP_SERVER_VERSION
 from awslabs.rds_management_mcp_server.common.context import RDSContext
 from awslabs.rds_management_mcp_server.common.server import mcp
@@ -38,17 +39,28 @@ def main():
     )
     parser.add_argument(
         '--readonly',
-        default='true',
+        default=True,
         action=argparse.BooleanOptionalAction,
         help='Prevents the MCP server from performing mutating operations',
     )
+    parser.add_argument(
+        '--cache-ttl',
+        default=10.0,
+        type=float,
+        help='Seconds to cache DB cluster listings between calls (0 disables caching)',
+    )
+    parser.add_argument('--region', help='AWS region for RDS operations (default: AWS_REGION)')
+    parser.add_argument(
+        '--profile', help='AWS profile to use for credentials (default: AWS_PROFILE)'
+    )
 
     args = parser.parse_args()
 
     mcp.settings.port = args.port
-    RDSContext.initialize(args.readonly, args.max_items)
+    RDSContext.initialize(args.readonly, args.max_items, args.cache_ttl)
+    RDSConnectionManager.configure(args.profile, args.region)
 
-    logger.info(f'Starting RDS Management MCP Server v{MCP_SERVER_VERSION}')
+    logger.info('Starting RDS Management MCP Server v{}', MCP_SERVER_VERSION)
 
     # default streamable HTTP transport
     mcp.run()
@@ -14,12 +14,14 @@
 
 """Resource for getting backup information across all RDS DB Clusters."""
 
+import asyncio
 from ...common.connection import RDSConnectionManager
+from ...common.constants import MAX_CONCURRENT_DESCRIBE_CALLS
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
 from loguru import logger
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 GET_ALL_CLUSTER_BACKUPS_RESOURCE_DESCRIPTION = """List all backups (snapshots and automated backups) across all DB clusters.
@@ -80,6 +82,90 @@ class BackupListModel(BaseModel):
     resource_uri: str = Field(description='The resource URI for the backups')
 
 
+async def _describe_automated_backups(rds_client: Any) -> Dict[str, List[AutomatedBackupModel]]:
+    """Fetch the account's cluster automated backups once, grouped by cluster.
+
+    Args:
+        rds_client: The RDS client
+
+    Returns:
+        Automated backups keyed by DB cluster identifier; empty if the call fails
+    """
+    try:
+        response = await asyncio.to_thread(rds_client.describe_db_cluster_automated_backups)
+    except Exception as e:
+        logger.error('Error fetching automated backups for clusters: {}', e)
+        return {}
+
+    backups_by_cluster: Dict[str, List[AutomatedBackupModel]] = {}
+    for backup in response.get('DBClusterAutomatedBackups', []):
+        backups_by_cluster.setdefault(backup.get('DBClusterIdentifier'), []).append(
+            AutomatedBackupModel(
+                backup_id=backup.get('DBClusterAutomatedBackupArn'),
+                cluster_id=backup.get('DBClusterIdentifier'),
+                earliest_time=str(backup.get('RestoreWindow', {}).get('EarliestTime'))
+                if backup.get('RestoreWindow', {}).get('EarliestTime')
+                else None,
+                latest_time=str(backup.get('RestoreWindow', {}).get('LatestTime'))
+                if backup.get('RestoreWindow', {}).get('LatestTime')
+                else None,
+                status=backup.get('Status'),
+                engine=backup.get('Engine'),
+                engine_version=backup.get('EngineVersion'),
+                resource_uri='aws-rds://db-cluster/backups',
+            )
+        )
+    return backups_by_cluster
+
+
+async def _describe_snapshots(
+    rds_client: Any, cluster_id: str, semaphore: asyncio.Semaphore
+) -> List[SnapshotModel]:
+    """Fetch the snapshots of one DB cluster.
+
+    Args:
+        rds_client: The RDS client
+        cluster_id: The DB cluster identifier
+        semaphore: Limits how many snapshot calls are in flight at once
+
+    Returns:
+        The cluster's snapshots; empty if the call fails
+    """
+    async with semaphore:
+        try:
+            response = await asyncio.to_thread(
+                rds_client.describe_db_cluster_snapshots, DBClusterIdentifier=cluster_id
+            )
+        except Exception as e:
+            logger.error('Error fetching snapshots for cluster {}: {}', cluster_id, e)
+            return []
+
+    snapshots = []
+    for snapshot in response.get('DBClusterSnapshots', []):
+        # Convert tags from AWS format to dict
+        tags = {}
+        for tag in snapshot.get('TagList', []):
+            tags[tag.get('Key')] = tag.get('Value')
+
+        snapshots.append(
+            SnapshotModel(
+                snapshot_id=snapshot.get('DBClusterSnapshotIdentifier'),
+                cluster_id=snapshot.get('DBClusterIdentifier'),
+                creation_time=str(snapshot.get('SnapshotCreateTime'))
+                if snapshot.get('SnapshotCreateTime')
+                else None,
+                status=snapshot.get('Status'),
+                engine=snapshot.get('Engine'),
+                engine_version=snapshot.get('EngineVersion'),
+                port=snapshot.get('Port'),
+                vpc_id=snapshot.get('VpcId'),
+                tags=tags,
+                resource_uri='aws-rds://db-cluster/backups',
+            )
+        )
+    return snapshots
+
+
 @mcp.resource(
     uri='aws-rds://db-cluster/backups',
     name='DescribeAllDBClusterBackups',
@@ -90,6 +176,9 @@ class BackupListModel(BaseModel):
 async def describe_all_cluster_backups() -> BackupListModel:
     """Get all backups across all DB clusters.
 
+    The automated backups are listed once for the account, and the per-cluster snapshot
+    calls run concurrently, up to MAX_CONCURRENT_DESCRIBE_CALLS at a time.
+
     Returns:
         BackupListModel: Object containing lists of snapshots and automated backups
     """
@@ -97,69 +186,21 @@ async def describe_all_cluster_backups() -> BackupListModel:
     rds_client = RDSConnectionManager.get_connection()
 
     # Get all clusters first
-    clusters_response = rds_client.describe_db_clusters()
-    all_snapshots = []
-    all_automated_backups = []
-
-    # For each cluster, get its backups
-    for cluster in clusters_response.get('DBClusters', []):
-        cluster_id = cluster.get('DBClusterIdentifier')
-
-        # Get automated backups
-        try:
-            auto_backups_response = rds_client.describe_db_cluster_automated_backups()
-
-            for backup in auto_backups_response.get('DBClusterAutomatedBackups', []):
-                if backup.get('DBClusterIdentifier') == cluster_id:
-                    all_automated_backups.append(
-                        AutomatedBackupModel(
-                            backup_id=backup.get('DBClusterAutomatedBackupArn'),
-                            cluster_id=backup.get('DBClusterIdentifier'),
-                            earliest_time=str(backup.get('RestoreWindow', {}).get('EarliestTime'))
-                            if backup.get('RestoreWindow', {}).get('EarliestTime')
-                            else None,
-                            latest_time=str(backup.get('RestoreWindow', {}).get('LatestTime'))
-                            if backup.get('RestoreWindow', {}).get('LatestTime')
-                            else None,
-                            status=backup.get('Status'),
-                            engine=backup.get('Engine'),
-                            engine_version=backup.get('EngineVersion'),
-                            resource_uri='aws-rds://db-cluster/backups',
-                        )
-                    )
-        except Exception as e:
-            logger.error(f'Error fetching automated backups for cluster {cluster_id}: {e}')
-
-        # Get snapshots
-        try:
-            snapshots_response = rds_client.describe_db_cluster_snapshots(
-                DBClusterIdentifier=cluster_id
-            )
+    clusters_response = await asyncio.to_thread(rds_client.describe_db_clusters)
+    cluster_ids = [
+        cluster.get('DBClusterIdentifier') for cluster in clusters_response.get('DBClusters', [])
+    ]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DESCRIBE_CALLS)
+    backups_by_cluster, *snapshots_by_cluster = await asyncio.gather(
+        _describe_automated_backups(rds_client),
+        *(_describe_snapshots(rds_client, cluster_id, semaphore) for cluster_id in cluster_ids),
+    )
 
-            for snapshot in snapshots_response.get('DBClusterSnapshots', []):
-                # Convert tags from AWS format to dict
-                tags = {}
-                for tag in snapshot.get('TagList', []):
-                    tags[tag.get('Key')] = tag.get('Value')
-
-                all_snapshots.append(
-                    SnapshotModel(
-                        snapshot_id=snapshot.get('DBClusterSnapshotIdentifier'),
-                        cluster_id=snapshot.get('DBClusterIdentifier'),
-                        creation_time=str(snapshot.get('SnapshotCreateTime'))
-                        if snapshot.get('SnapshotCreateTime')
-                        else None,
-                        status=snapshot.get('Status'),
-                        engine=snapshot.get('Engine'),
-                        engine_version=snapshot.get('EngineVersion'),
-                        port=snapshot.get('Port'),
-                        vpc_id=snapshot.get('VpcId'),
-                        tags=tags,
-                        resource_uri='aws-rds://db-cluster/backups',
-                    )
-                )
-        except Exception as e:
-            logger.error(f'Error fetching snapshots for cluster {cluster_id}: {e}')
+    all_automated_backups = [
+        backup for cluster_id in cluster_ids for backup in backups_by_cluster.get(cluster_id, [])
+    ]
+    all_snapshots = [snapshot for snapshots in snapshots_by_cluster for snapshot in snapshots]
 
     # Create the combined backup list model
     backup_list = BackupListModel(
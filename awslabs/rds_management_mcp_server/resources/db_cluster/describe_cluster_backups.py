@@ -14,6 +14,7 @@
 
 """Resource for getting backup information for a specific RDS DB Cluster."""
 
+import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
@@ -99,14 +100,14 @@ async def describe_cluster_backups(
     Returns:
         BackupListModel: Object containing lists of snapshots and automated backups
     """
-    logger.info(f'Getting backups for RDS cluster: {cluster_id}')
+    logger.info('Getting backups for RDS cluster: {}', cluster_id)
     rds_client = RDSConnectionManager.get_connection()
 
     # Get automated backups
     automated_backups = []
     try:
-        auto_backups_response = rds_client.describe_db_cluster_automated_backups(
-            DBClusterIdentifier=cluster_id
+        auto_backups_response = await asyncio.to_thread(
+            rds_client.describe_db_cluster_automated_backups, DBClusterIdentifier=cluster_id
         )
 
         for backup in auto_backups_response.get('DBClusterAutomatedBackups', []):
@@ -127,13 +128,13 @@ async def describe_cluster_backups(
                 )
             )
     except Exception as e:
-        logger.error(f'Error fetching automated backups for cluster {cluster_id}: {e}')
+        logger.error('Error fetching automated backups for cluster {}: {}', cluster_id, e)
 
     # Get snapshots
     snapshots = []
     try:
-        snapshots_response = rds_client.describe_db_cluster_snapshots(
-            DBClusterIdentifier=cluster_id
+        snapshots_response = await asyncio.to_thread(
+            rds_client.describe_db_cluster_snapshots, DBClusterIdentifier=cluster_id
         )
 
         for snapshot in snapshots_response.get('DBClusterSnapshots', []):
@@ -159,7 +160,7 @@ async def describe_cluster_backups(
                 )
             )
     except Exception as e:
-        logger.error(f'Error fetching snapshots for cluster {cluster_id}: {e}')
+        logger.error('Error fetching snapshots for cluster {}: {}', cluster_id, e)
 
     # Create the combined backup list model
     backup_list = BackupListModel(
@@ -154,7 +154,7 @@ async def describe_cluster_detail(
     if not cluster_id:
         raise ValueError('Cluster identifier cannot be empty')
 
-    logger.info(f'Getting cluster detail resource for {cluster_id}')
+    logger.info('Getting cluster detail resource for {}', cluster_id)
     rds_client = RDSConnectionManager.get_connection()
     response = await asyncio.to_thread(
         rds_client.describe_db_clusters, DBClusterIdentifier=cluster_id
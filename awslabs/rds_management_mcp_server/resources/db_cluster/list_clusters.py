@@ -14,7 +14,10 @@
 
 """Resource for listing available RDS DB Clusters."""
 
+import asyncio
+from ...common.cache import describe_cache
 from ...common.connection import RDSConnectionManager
+from ...common.context import RDSContext
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import handle_paginated_aws_api_call
@@ -120,10 +123,18 @@ async def list_clusters() -> ClusterSummaryList:
         ClusterSummaryList: Object containing list of formatted cluster summaries,
         total count, and resource URI
     """
+    cached = describe_cache.get('ListDBClusters')
+    if cached is not None:
+        return cached
+
+    # a write that finishes while this call is in flight makes its result stale
+    generation = describe_cache.generation()
+
     logger.info('Listing RDS clusters')
     rds_client = RDSConnectionManager.get_connection()
 
-    clusters = handle_paginated_aws_api_call(
+    clusters = await asyncio.to_thread(
+        handle_paginated_aws_api_call,
         client=rds_client,
         paginator_name='describe_db_clusters',
         operation_parameters={},
@@ -135,4 +146,5 @@ async def list_clusters() -> ClusterSummaryList:
         clusters=clusters, count=len(clusters), resource_uri='aws-rds://db-cluster'
     )
 
+    describe_cache.set('ListDBClusters', result, RDSContext.cache_ttl(), generation)
     return result
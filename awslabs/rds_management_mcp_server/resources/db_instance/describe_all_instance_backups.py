@@ -14,11 +14,14 @@
 
 """Resource for getting backup information across all RDS DB Instances."""
 
+import asyncio
 from ...common.connection import RDSConnectionManager
+from ...common.constants import MAX_CONCURRENT_DESCRIBE_CALLS
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
 from .describe_instance_backups import AutomatedBackupModel, BackupListModel, SnapshotModel
 from loguru import logger
+from typing import Any, Dict, List
 
 
 GET_ALL_INSTANCE_BACKUPS_RESOURCE_DESCRIPTION = """List all backups (snapshots and automated backups) across all DB instances.
@@ -36,6 +39,90 @@ This includes both manual snapshots and automated backups.
 """
 
 
+async def _describe_automated_backups(rds_client: Any) -> Dict[str, List[AutomatedBackupModel]]:
+    """Fetch the account's instance automated backups once, grouped by instance.
+
+    Args:
+        rds_client: The RDS client
+
+    Returns:
+        Automated backups keyed by DB instance identifier; empty if the call fails
+    """
+    try:
+        response = await asyncio.to_thread(rds_client.describe_db_instance_automated_backups)
+    except Exception as e:
+        logger.error('Error fetching automated backups for instances: {}', e)
+        return {}
+
+    backups_by_instance: Dict[str, List[AutomatedBackupModel]] = {}
+    for backup in response.get('DBInstanceAutomatedBackups', []):
+        backups_by_instance.setdefault(backup.get('DBInstanceIdentifier'), []).append(
+            AutomatedBackupModel(
+                backup_id=backup.get('DBInstanceAutomatedBackupsArn'),
+                instance_id=backup.get('DBInstanceIdentifier'),
+                earliest_time=str(backup.get('RestorableTime'))
+                if backup.get('RestorableTime')
+                else None,
+                latest_time=str(backup.get('LatestRestorableTime'))
+                if backup.get('LatestRestorableTime')
+                else None,
+                status=backup.get('Status'),
+                engine=backup.get('Engine'),
+                engine_version=backup.get('EngineVersion'),
+                resource_uri='aws-rds://db-instance/backups',
+            )
+        )
+    return backups_by_instance
+
+
+async def _describe_snapshots(
+    rds_client: Any, instance_id: str, semaphore: asyncio.Semaphore
+) -> List[SnapshotModel]:
+    """Fetch the snapshots of one DB instance.
+
+    Args:
+        rds_client: The RDS client
+        instance_id: The DB instance identifier
+        semaphore: Limits how many snapshot calls are in flight at once
+
+    Returns:
+        The instance's snapshots; empty if the call fails
+    """
+    async with semaphore:
+        try:
+            response = await asyncio.to_thread(
+                rds_client.describe_db_snapshots, DBInstanceIdentifier=instance_id
+            )
+        except Exception as e:
+            logger.error('Error fetching snapshots for instance {}: {}', instance_id, e)
+            return []
+
+    snapshots = []
+    for snapshot in response.get('DBSnapshots', []):
+        # Convert tags from AWS format to dict
+        tags = {}
+        for tag in snapshot.get('TagList', []):
+            tags[tag.get('Key')] = tag.get('Value')
+
+        snapshots.append(
+            SnapshotModel(
+                snapshot_id=snapshot.get('DBSnapshotIdentifier'),
+                instance_id=snapshot.get('DBInstanceIdentifier'),
+                creation_time=str(snapshot.get('SnapshotCreateTime'))
+                if snapshot.get('SnapshotCreateTime')
+                else None,
+                status=snapshot.get('Status'),
+                engine=snapshot.get('Engine'),
+                engine_version=snapshot.get('EngineVersion'),
+                port=snapshot.get('Port'),
+                vpc_id=snapshot.get('VpcId'),
+                tags=tags,
+                resource_uri='aws-rds://db-instance/backups',
+            )
+        )
+    return snapshots
+
+
 @mcp.resource(
     uri='aws-rds://db-instance/backups',
     name='DescribeAllDBInstanceBackups',
@@ -46,6 +133,9 @@ This includes both manual snapshots and automated backups.
 async def describe_all_instance_backups() -> BackupListModel:
     """Get all backups across all DB instances.
 
+    The automated backups are listed once for the account, and the per-instance snapshot
+    calls run concurrently, up to MAX_CONCURRENT_DESCRIBE_CALLS at a time.
+
     Returns:
         BackupListModel: Object containing lists of snapshots and automated backups
     """
@@ -53,67 +143,24 @@ async def describe_all_instance_backups() -> BackupListModel:
     rds_client = RDSConnectionManager.get_connection()
 
     # Get all instances first
-    instances_response = rds_client.describe_db_instances()
-    all_snapshots = []
-    all_automated_backups = []
-
-    # For each instance, get its backups
-    for instance in instances_response.get('DBInstances', []):
-        instance_id = instance.get('DBInstanceIdentifier')
-
-        # Get automated backups
-        try:
-            auto_backups_response = rds_client.describe_db_instance_automated_backups()
-
-            for backup in auto_backups_response.get('DBInstanceAutomatedBackups', []):
-                if backup.get('DBInstanceIdentifier') == instance_id:
-                    all_automated_backups.append(
-                        AutomatedBackupModel(
-                            backup_id=backup.get('DBInstanceAutomatedBackupsArn'),
-                            instance_id=backup.get('DBInstanceIdentifier'),
-                            earliest_time=str(backup.get('RestorableTime'))
-                            if backup.get('RestorableTime')
-                            else None,
-                            latest_time=str(backup.get('LatestRestorableTime'))
-                            if backup.get('LatestRestorableTime')
-                            else None,
-                            status=backup.get('Status'),
-                            engine=backup.get('Engine'),
-                            engine_version=backup.get('EngineVersion'),
-                            resource_uri='aws-rds://db-instance/backups',
-                        )
-                    )
-        except Exception as e:
-            logger.error(f'Error fetching automated backups for instance {instance_id}: {e}')
+    instances_response = await asyncio.to_thread(rds_client.describe_db_instances)
+    instance_ids = [
+        instance.get('DBInstanceIdentifier')
+        for instance in instances_response.get('DBInstances', [])
+    ]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DESCRIBE_CALLS)
+    backups_by_instance, *snapshots_by_instance = await asyncio.gather(
+        _describe_automated_backups(rds_client),
+        *(_describe_snapshots(rds_client, instance_id, semaphore) for instance_id in instance_ids),
+    )
 
-        # Get snapshots
-        try:
-            snapshots_response = rds_client.describe_db_snapshots(DBInstanceIdentifier=instance_id)
-
-            for snapshot in snapshots_response.get('DBSnapshots', []):
-                # Convert tags from AWS format to dict
-                tags = {}
-                for tag in snapshot.get('TagList', []):
-                    tags[tag.get('Key')] = tag.get('Value')
-
-                all_snapshots.append(
-                    SnapshotModel(
-                        snapshot_id=snapshot.get('DBSnapshotIdentifier'),
-                        instance_id=snapshot.get('DBInstanceIdentifier'),
-                        creation_time=str(snapshot.get('SnapshotCreateTime'))
-                        if snapshot.get('SnapshotCreateTime')
-                        else None,
-                        status=snapshot.get('Status'),
-                        engine=snapshot.get('Engine'),
-                        engine_version=snapshot.get('EngineVersion'),
-                        port=snapshot.get('Port'),
-                        vpc_id=snapshot.get('VpcId'),
-                        tags=tags,
-                        resource_uri='aws-rds://db-instance/backups',
-                    )
-                )
-        except Exception as e:
-            logger.error(f'Error fetching snapshots for instance {instance_id}: {e}')
+    all_automated_backups = [
+        backup
+        for instance_id in instance_ids
+        for backup in backups_by_instance.get(instance_id, [])
+    ]
+    all_snapshots = [snapshot for snapshots in snapshots_by_instance for snapshot in snapshots]
 
     # Create the combined backup list model
     backup_list = BackupListModel(
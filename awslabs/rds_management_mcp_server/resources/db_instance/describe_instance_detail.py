@@ -177,7 +177,7 @@ async def describe_instance_detail(
     Raises:
         ValueError: If the specified instance is not found
     """
-    logger.info(f'Getting instance detail resource for {instance_id}')
+    logger.info('Getting instance detail resource for {}', instance_id)
     rds_client = RDSConnectionManager.get_connection()
 
     response = await asyncio.to_thread(
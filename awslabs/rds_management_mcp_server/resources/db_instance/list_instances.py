@@ -14,6 +14,7 @@
 
 """Resource for listing available RDS DB Instances."""
 
+import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
@@ -177,7 +178,8 @@ async def list_instances() -> InstanceSummaryList:
     logger.info('Listing RDS instances')
     rds_client = RDSConnectionManager.get_connection()
 
-    instances = handle_paginated_aws_api_call(
+    instances = await asyncio.to_thread(
+        handle_paginated_aws_api_call,
         client=rds_client,
         paginator_name='describe_db_instances',
         operation_parameters={},
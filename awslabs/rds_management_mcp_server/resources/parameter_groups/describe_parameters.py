@@ -116,7 +116,7 @@ async def describe_cluster_parameters(
     Returns:
         ParameterListModel: A model containing the list of parameters
     """
-    logger.info(f'Getting parameters for DB cluster parameter group: {parameter_group_name}')
+    logger.info('Getting parameters for DB cluster parameter group: {}', parameter_group_name)
     rds_client = RDSConnectionManager.get_connection()
 
     # Prepare parameters for API call
@@ -207,7 +207,7 @@ async def describe_instance_parameters(
     Returns:
         ParameterListModel: A model containing the list of parameters
     """
-    logger.info(f'Getting parameters for DB instance parameter group: {parameter_group_name}')
+    logger.info('Getting parameters for DB instance parameter group: {}', parameter_group_name)
     rds_client = RDSConnectionManager.get_connection()
 
     # Prepare parameters for API call
@@ -20,55 +20,60 @@ from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
 from .describe_parameters import ParameterGroupListModel, ParameterGroupModel, ParameterModel
 from loguru import logger
-
-
-LIST_CLUSTER_PARAMETER_GROUPS_DESCRIPTION = """List all DB cluster parameter groups in your AWS account.
-
-<use_case>
-Use this resource to discover all available DB cluster parameter groups.
-Parameter groups are used to apply specific configuration settings to your RDS clusters.
-</use_case>
-
-<important_notes>
-1. This resource lists all cluster parameter groups in the current AWS region
-2. Each parameter group contains metadata including family, description, and tags
-3. A sample of parameters from each group is included (limited to improve performance)
-</important_notes>
-"""
-
-
-@mcp.resource(
-    uri='aws-rds://db-cluster/parameter-groups',
-    name='GetDBClusterParameterGroups',
-    description=LIST_CLUSTER_PARAMETER_GROUPS_DESCRIPTION,
-    mime_type='application/json',
-)
-@handle_exceptions
-async def list_cluster_parameter_groups() -> ParameterGroupListModel:
-    """List all DB cluster parameter groups.
+from typing import Any, Callable, Dict, List
+
+
+# per group type: (response list key, name key, ARN key, resource URI)
+# the name key doubles as the describe parameters argument for the group
+_GROUP_KEYS = {
+    'cluster': (
+        'DBClusterParameterGroups',
+        'DBClusterParameterGroupName',
+        'DBClusterParameterGroupArn',
+        'aws-rds://db-cluster/parameter-groups',
+    ),
+    'instance': (
+        'DBParameterGroups',
+        'DBParameterGroupName',
+        'DBParameterGroupArn',
+        'aws-rds://db-instance/parameter-groups',
+    ),
+}
+
+
+def _collect_parameter_groups(
+    describe_groups: Callable[..., Dict[str, Any]],
+    describe_parameters: Callable[..., Dict[str, Any]],
+    group_type: str,
+) -> List[ParameterGroupModel]:
+    """Page through parameter groups and sample the parameters of each group.
+
+    This runs entirely in one worker thread so that listing N groups costs a single
+    thread hop instead of one per page plus one per group.
+
+    Args:
+        describe_groups: The boto3 describe parameter groups method
+        describe_parameters: The boto3 describe parameters method
+        group_type: Either 'cluster' or 'instance'
 
     Returns:
-        ParameterGroupListModel: A model containing the list of parameter groups
+        List of parameter group models
     """
-    logger.info('Listing DB cluster parameter groups')
-    rds_client = RDSConnectionManager.get_connection()
-
-    # Get parameter groups
-    response = await asyncio.to_thread(rds_client.describe_db_cluster_parameter_groups)
+    list_key, name_key, arn_key, base_uri = _GROUP_KEYS[group_type]
 
     parameter_groups = []
-    for pg in response.get('DBClusterParameterGroups', []):
-        # Get a sample of parameters for each group
-        try:
-            params_response = await asyncio.to_thread(
-                rds_client.describe_db_cluster_parameters,
-                DBClusterParameterGroupName=pg.get('DBClusterParameterGroupName'),
-                MaxRecords=20,  # Limit to 20 parameters for performance
-            )
+    response = describe_groups()
+    while True:
+        for pg in response.get(list_key, []):
+            name = pg.get(name_key)
 
-            parameters = []
-            for param in params_response.get('Parameters', []):
-                parameters.append(
+            # Get a sample of parameters for each group
+            try:
+                params_response = describe_parameters(
+                    **{name_key: name},
+                    MaxRecords=20,  # Limit to 20 parameters for performance
+                )
+                parameters = [
                     ParameterModel(
                         name=param.get('ParameterName'),
                         value=param.get('ParameterValue'),
@@ -79,66 +84,10 @@ async def list_cluster_parameter_groups() -> ParameterGroupListModel:
                         data_type=param.get('DataType'),
                         is_modifiable=param.get('IsModifiable', False),
                     )
-                )
-        except Exception as e:
-            logger.error(
-                f'Error getting parameters for group {pg.get("DBClusterParameterGroupName")}: {str(e)}'
-            )
-            parameters = []
-
-        # Extract tags
-        tags = {}
-        if 'Tags' in pg:
-            tags = {tag.get('Key'): tag.get('Value') for tag in pg.get('Tags', [])}
-
-        # Create parameter group model
-        parameter_groups.append(
-            ParameterGroupModel(
-                name=pg.get('DBClusterParameterGroupName'),
-                description=pg.get('Description'),
-                family=pg.get('DBParameterGroupFamily'),
-                type='cluster',
-                parameters=parameters,
-                arn=pg.get('DBClusterParameterGroupArn'),
-                tags=tags,
-                resource_uri=f'aws-rds://db-cluster/parameter-groups/{pg.get("DBClusterParameterGroupName")}',
-            )
-        )
-
-    # Pagination handling
-    marker = response.get('Marker')
-    while marker:
-        response = await asyncio.to_thread(
-            rds_client.describe_db_cluster_parameter_groups, Marker=marker
-        )
-
-        for pg in response.get('DBClusterParameterGroups', []):
-            # Get a sample of parameters for each group
-            try:
-                params_response = await asyncio.to_thread(
-                    rds_client.describe_db_cluster_parameters,
-                    DBClusterParameterGroupName=pg.get('DBClusterParameterGroupName'),
-                    MaxRecords=20,  # Limit to 20 parameters for performance
-                )
-
-                parameters = []
-                for param in params_response.get('Parameters', []):
-                    parameters.append(
-                        ParameterModel(
-                            name=param.get('ParameterName'),
-                            value=param.get('ParameterValue'),
-                            description=param.get('Description'),
-                            allowed_values=param.get('AllowedValues'),
-                            source=param.get('Source'),
-                            apply_type=param.get('ApplyType'),
-                            data_type=param.get('DataType'),
-                            is_modifiable=param.get('IsModifiable', False),
-                        )
-                    )
+                    for param in params_response.get('Parameters', [])
+                ]
             except Exception as e:
-                logger.error(
-                    f'Error getting parameters for group {pg.get("DBClusterParameterGroupName")}: {str(e)}'
-                )
+                logger.error('Error getting parameters for group {}: {}', name, e)
                 parameters = []
 
             # Extract tags
@@ -146,21 +95,63 @@ async def list_cluster_parameter_groups() -> ParameterGroupListModel:
             if 'Tags' in pg:
                 tags = {tag.get('Key'): tag.get('Value') for tag in pg.get('Tags', [])}
 
-            # Create parameter group model
             parameter_groups.append(
                 ParameterGroupModel(
-                    name=pg.get('DBClusterParameterGroupName'),
+                    name=name,
                     description=pg.get('Description'),
                     family=pg.get('DBParameterGroupFamily'),
-                    type='cluster',
+                    type=group_type,
                     parameters=parameters,
-                    arn=pg.get('DBClusterParameterGroupArn'),
+                    arn=pg.get(arn_key),
                     tags=tags,
-                    resource_uri=f'aws-rds://db-cluster/parameter-groups/{pg.get("DBClusterParameterGroupName")}',
+                    resource_uri=f'{base_uri}/{name}',
                 )
             )
 
+        # Pagination handling
         marker = response.get('Marker')
+        if not marker:
+            return parameter_groups
+        response = describe_groups(Marker=marker)
+
+
+LIST_CLUSTER_PARAMETER_GROUPS_DESCRIPTION = """List all DB cluster parameter groups in your AWS account.
+
+<use_case>
+Use this resource to discover all available DB cluster parameter groups.
+Parameter groups are used to apply specific configuration settings to your RDS clusters.
+</use_case>
+
+<important_notes>
+1. This resource lists all cluster parameter groups in the current AWS region
+2. Each parameter group contains metadata including family, description, and tags
+3. A sample of parameters from each group is included (limited to improve performance)
+</important_notes>
+"""
+
+
+@mcp.resource(
+    uri='aws-rds://db-cluster/parameter-groups',
+    name='GetDBClusterParameterGroups',
+    description=LIST_CLUSTER_PARAMETER_GROUPS_DESCRIPTION,
+    mime_type='application/json',
+)
+@handle_exceptions
+async def list_cluster_parameter_groups() -> ParameterGroupListModel:
+    """List all DB cluster parameter groups.
+
+    Returns:
+        ParameterGroupListModel: A model containing the list of parameter groups
+    """
+    logger.info('Listing DB cluster parameter groups')
+    rds_client = RDSConnectionManager.get_connection()
+
+    parameter_groups = await asyncio.to_thread(
+        _collect_parameter_groups,
+        rds_client.describe_db_cluster_parameter_groups,
+        rds_client.describe_db_cluster_parameters,
+        'cluster',
+    )
 
     return ParameterGroupListModel(
         parameter_groups=parameter_groups,
@@ -200,112 +191,12 @@ async def list_instance_parameter_groups() -> ParameterGroupListModel:
     logger.info('Listing DB instance parameter groups')
     rds_client = RDSConnectionManager.get_connection()
 
-    # Get parameter groups
-    response = await asyncio.to_thread(rds_client.describe_db_parameter_groups)
-
-    parameter_groups = []
-    for pg in response.get('DBParameterGroups', []):
-        # Get a sample of parameters for each group
-        try:
-            params_response = await asyncio.to_thread(
-                rds_client.describe_db_parameters,
-                DBParameterGroupName=pg.get('DBParameterGroupName'),
-                MaxRecords=20,  # Limit to 20 parameters for performance
-            )
-
-            parameters = []
-            for param in params_response.get('Parameters', []):
-                parameters.append(
-                    ParameterModel(
-                        name=param.get('ParameterName'),
-                        value=param.get('ParameterValue'),
-                        description=param.get('Description'),
-                        allowed_values=param.get('AllowedValues'),
-                        source=param.get('Source'),
-                        apply_type=param.get('ApplyType'),
-                        data_type=param.get('DataType'),
-                        is_modifiable=param.get('IsModifiable', False),
-                    )
-                )
-        except Exception as e:
-            logger.error(
-                f'Error getting parameters for group {pg.get("DBParameterGroupName")}: {str(e)}'
-            )
-            parameters = []
-
-        # Extract tags
-        tags = {}
-        if 'Tags' in pg:
-            tags = {tag.get('Key'): tag.get('Value') for tag in pg.get('Tags', [])}
-
-        # Create parameter group model
-        parameter_groups.append(
-            ParameterGroupModel(
-                name=pg.get('DBParameterGroupName'),
-                description=pg.get('Description'),
-                family=pg.get('DBParameterGroupFamily'),
-                type='instance',
-                parameters=parameters,
-                arn=pg.get('DBParameterGroupArn'),
-                tags=tags,
-                resource_uri=f'aws-rds://db-instance/parameter-groups/{pg.get("DBParameterGroupName")}',
-            )
-        )
-
-    # Pagination handling
-    marker = response.get('Marker')
-    while marker:
-        response = await asyncio.to_thread(rds_client.describe_db_parameter_groups, Marker=marker)
-
-        for pg in response.get('DBParameterGroups', []):
-            # Get a sample of parameters for each group
-            try:
-                params_response = await asyncio.to_thread(
-                    rds_client.describe_db_parameters,
-                    DBParameterGroupName=pg.get('DBParameterGroupName'),
-                    MaxRecords=20,  # Limit to 20 parameters for performance
-                )
-
-                parameters = []
-                for param in params_response.get('Parameters', []):
-                    parameters.append(
-                        ParameterModel(
-                            name=param.get('ParameterName'),
-                            value=param.get('ParameterValue'),
-                            description=param.get('Description'),
-                            allowed_values=param.get('AllowedValues'),
-                            source=param.get('Source'),
-                            apply_type=param.get('ApplyType'),
-                            data_type=param.get('DataType'),
-                            is_modifiable=param.get('IsModifiable', False),
-                        )
-                    )
-            except Exception as e:
-                logger.error(
-                    f'Error getting parameters for group {pg.get("DBParameterGroupName")}: {str(e)}'
-                )
-                parameters = []
-
-            # Extract tags
-            tags = {}
-            if 'Tags' in pg:
-                tags = {tag.get('Key'): tag.get('Value') for tag in pg.get('Tags', [])}
-
-            # Create parameter group model
-            parameter_groups.append(
-                ParameterGroupModel(
-                    name=pg.get('DBParameterGroupName'),
-                    description=pg.get('Description'),
-                    family=pg.get('DBParameterGroupFamily'),
-                    type='instance',
-                    parameters=parameters,
-                    arn=pg.get('DBParameterGroupArn'),
-                    tags=tags,
-                    resource_uri=f'aws-rds://db-instance/parameter-groups/{pg.get("DBParameterGroupName")}',
-                )
-            )
-
-        marker = response.get('Marker')
+    parameter_groups = await asyncio.to_thread(
+        _collect_parameter_groups,
+        rds_client.describe_db_parameter_groups,
+        rds_client.describe_db_parameters,
+        'instance',
+    )
 
     return ParameterGroupListModel(
         parameter_groups=parameter_groups,
@@ -17,7 +17,7 @@
 from .create_cluster import create_db_cluster
 from .modify_cluster import modify_db_cluster
 from .delete_cluster import delete_db_cluster
-from .change_cluster_status import status_db_cluster
+from .change_cluster_status import status_db_cluster, status_db_clusters
 from .failover_cluster import failover_db_cluster
 from .create_snapshot import create_db_cluster_snapshot
 from .delete_snapshot import delete_db_cluster_snapshot
@@ -29,6 +29,7 @@ __all__ = [
     'modify_db_cluster',
     'delete_db_cluster',
     'status_db_cluster',
+    'status_db_clusters',
     'failover_db_cluster',
     'create_db_cluster_snapshot',
     'delete_db_cluster_snapshot',
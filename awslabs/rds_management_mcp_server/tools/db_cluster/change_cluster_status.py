@@ -16,17 +16,16 @@
 
 import asyncio
 from ...common.connection import RDSConnectionManager
-from ...common.decorators.handle_exceptions import handle_exceptions
+from ...common.constants import SUCCESS_REBOOTED, SUCCESS_STARTED, SUCCESS_STOPPED
+from ...common.decorators.handle_exceptions import format_exception, handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
 from ...common.decorators.require_confirmation import require_confirmation
+from ...common.schemas import DBClusterIdentifier, IncludeFormattedCluster
 from ...common.server import mcp
-from ...common.utils import (
-    format_rds_api_response,
-)
-from .utils import format_cluster_info
+from .utils import format_cluster_response
 from loguru import logger
 from pydantic import Field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from typing_extensions import Annotated
 
 
@@ -41,8 +40,53 @@ This tool changes the operational status of an Amazon RDS database cluster:
 <warning>
 These operations affect database availability and billing. A confirmation token is required.
 </warning>
+
+## Response structure
+If called with valid confirmation:
+- `message`: Success message for the action
+- `DBCluster`: The cluster as returned by the action, including its new `Status`
+- `formatted_cluster`: A simplified representation of `DBCluster` (unless include_formatted is false)
+
+The response already reflects the cluster's state after the action, so a separate
+DescribeDBClusters call is not needed to observe the transition.
 """
 
+# action -> (RDS client method, progress verb, success message template)
+# the templates are specialised for DB clusters up front, leaving one format per call
+_ACTION_DISPATCH = {
+    'start': ('start_db_cluster', 'Starting', SUCCESS_STARTED.format('DB cluster {}')),
+    'stop': ('stop_db_cluster', 'Stopping', SUCCESS_STOPPED.format('DB cluster {}')),
+    'reboot': ('reboot_db_cluster', 'Rebooting', SUCCESS_REBOOTED.format('DB cluster {}')),
+}
+
+
+async def _change_cluster_status(
+    rds_client: Any,
+    db_cluster_identifier: str,
+    dispatch: Tuple[str, str, str],
+    include_formatted: bool,
+) -> Dict[str, Any]:
+    """Run a validated status action against one DB cluster.
+
+    Args:
+        rds_client: The RDS client
+        db_cluster_identifier: The identifier for the DB cluster
+        dispatch: The _ACTION_DISPATCH entry for the action
+        include_formatted: Whether to add the formatted_cluster summary
+
+    Returns:
+        Dict[str, Any]: The formatted response from the AWS API
+    """
+    method_name, verb, success_template = dispatch
+    logger.info('{} DB cluster {}', verb, db_cluster_identifier)
+    response = await asyncio.to_thread(
+        getattr(rds_client, method_name), DBClusterIdentifier=db_cluster_identifier
+    )
+    message = success_template.format(db_cluster_identifier)
+    logger.success(message)
+
+    return format_cluster_response(response, message, include_formatted)
+
 
 @mcp.tool(
     name='ChangeDBClusterStatus',
@@ -52,8 +96,9 @@ These operations affect database availability and billing. A confirmation token
 @readonly_check
 @require_confirmation('ChangeDBClusterStatus')
 async def status_db_cluster(
-    db_cluster_identifier: Annotated[str, Field(description='The identifier for the DB cluster')],
+    db_cluster_identifier: DBClusterIdentifier,
     action: Annotated[str, Field(description='Action to perform: "start", "stop", or "reboot"')],
+    include_formatted: IncludeFormattedCluster = True,
     confirmation_token: Annotated[
         Optional[str], Field(description='Confirmation token for destructive operations')
     ] = None,
@@ -63,50 +108,105 @@ async def status_db_cluster(
     Args:
         db_cluster_identifier: The identifier for the DB cluster
         action: Action to perform: "start", "stop", or "reboot"
+        include_formatted: Whether to add a simplified formatted_cluster summary to the response
         confirmation_token: Confirmation token for destructive operations
 
     Returns:
         Dict[str, Any]: The response from the AWS API
     """
+    action = action.lower()
+
+    dispatch = _ACTION_DISPATCH.get(action)
+    if dispatch is None:
+        return {'error': f'Invalid action: {action}. Must be one of: start, stop, reboot'}
+
     # Get RDS client
     rds_client = RDSConnectionManager.get_connection()
 
-    action = action.lower()
+    return await _change_cluster_status(
+        rds_client, db_cluster_identifier, dispatch, include_formatted
+    )
 
-    if action not in ['start', 'stop', 'reboot']:
-        return {'error': f'Invalid action: {action}. Must be one of: start, stop, reboot'}
 
-    if action == 'start':
-        logger.info(f'Starting DB cluster {db_cluster_identifier}')
-        response = await asyncio.to_thread(
-            rds_client.start_db_cluster, DBClusterIdentifier=db_cluster_identifier
-        )
-        logger.success(f'Successfully started DB cluster {db_cluster_identifier}')
+CHANGE_CLUSTERS_STATUS_TOOL_DESCRIPTION = """Manage the status of several RDS database clusters at once.
 
-        result = format_rds_api_response(response)
-        result['message'] = f'DB cluster {db_cluster_identifier} has been started successfully.'
+This tool applies the same start, stop or reboot action to every listed DB cluster.
+The requests are sent concurrently, so changing N clusters takes about as long as
+changing one.
 
-    elif action == 'stop':
-        logger.info(f'Stopping DB cluster {db_cluster_identifier}')
-        response = await asyncio.to_thread(
-            rds_client.stop_db_cluster, DBClusterIdentifier=db_cluster_identifier
-        )
-        logger.success(f'Successfully stopped DB cluster {db_cluster_identifier}')
+<warning>
+These operations affect database availability and billing. A confirmation token is required
+and is only valid for the exact list of clusters it was issued for.
+</warning>
 
-        result = format_rds_api_response(response)
-        result['message'] = f'DB cluster {db_cluster_identifier} has been stopped successfully.'
+## Response structure
+If called with valid confirmation:
+- `results`: Per-cluster outcome keyed by cluster identifier; each value has the same shape as
+  the ChangeDBClusterStatus response, or an `error` entry if that cluster's action failed
+- `message`: Summary of how many clusters succeeded
+"""
 
-    elif action == 'reboot':
-        logger.info(f'Rebooting DB cluster {db_cluster_identifier}')
-        response = await asyncio.to_thread(
-            rds_client.reboot_db_cluster, DBClusterIdentifier=db_cluster_identifier
-        )
-        logger.success(f'Successfully initiated reboot of DB cluster {db_cluster_identifier}')
 
-        result = format_rds_api_response(response)
-        result['message'] = f'DB cluster {db_cluster_identifier} has been rebooted successfully.'
+@mcp.tool(
+    name='ChangeDBClustersStatus',
+    description=CHANGE_CLUSTERS_STATUS_TOOL_DESCRIPTION,
+)
+@handle_exceptions
+@readonly_check
+@require_confirmation('ChangeDBClustersStatus')
+async def status_db_clusters(
+    db_cluster_identifiers: Annotated[
+        List[str], Field(description='The identifiers for the DB clusters')
+    ],
+    action: Annotated[str, Field(description='Action to perform: "start", "stop", or "reboot"')],
+    include_formatted: IncludeFormattedCluster = True,
+    confirmation_token: Annotated[
+        Optional[str], Field(description='Confirmation token for destructive operations')
+    ] = None,
+) -> Dict[str, Any]:
+    """Manage the status of several RDS database clusters concurrently.
+
+    Args:
+        db_cluster_identifiers: The identifiers for the DB clusters
+        action: Action to perform: "start", "stop", or "reboot"
+        include_formatted: Whether to add a simplified formatted_cluster summary to each result
+        confirmation_token: Confirmation token for destructive operations
+
+    Returns:
+        Dict[str, Any]: The per-cluster responses from the AWS API
+    """
+    action = action.lower()
 
-    # add formatted cluster info to the result
-    result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
+    dispatch = _ACTION_DISPATCH.get(action)
+    if dispatch is None:
+        return {'error': f'Invalid action: {action}. Must be one of: start, stop, reboot'}
+
+    # each cluster is changed once, however often it is listed
+    cluster_ids = list(dict.fromkeys(db_cluster_identifiers))
+
+    # Get RDS client
+    rds_client = RDSConnectionManager.get_connection()
 
-    return result
+    outcomes = await asyncio.gather(
+        *(
+            _change_cluster_status(rds_client, cluster_id, dispatch, include_formatted)
+            for cluster_id in cluster_ids
+        ),
+        return_exceptions=True,
+    )
+
+    results = {}
+    succeeded = 0
+    for cluster_id, outcome in zip(cluster_ids, outcomes):
+        # gather also returns BaseExceptions such as CancelledError
+        if isinstance(outcome, BaseException):
+            results[cluster_id] = format_exception(outcome, 'status_db_clusters')
+        else:
+            results[cluster_id] = outcome
+            succeeded += 1
+
+    return {
+        'results': results,
+        'message': f'{action.capitalize()} succeeded for {succeeded} of '
+        f'{len(cluster_ids)} DB clusters.',
+    }
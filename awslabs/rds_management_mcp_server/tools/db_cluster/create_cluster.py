@@ -22,12 +22,14 @@ from ...common.constants import (
 )
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
+from ...common.schemas import DBClusterIdentifier, IncludeFormattedCluster
 from ...common.server import mcp
 from ...common.utils import (
     add_mcp_tags,
-    format_rds_api_response,
+    select_optional_params,
+    validate_db_identifier,
 )
-from .utils import format_cluster_info
+from .utils import format_cluster_response
 from loguru import logger
 from pydantic import Field
 from typing import Any, Dict, List, Optional
@@ -43,6 +45,16 @@ When not in readonly mode, this will create actual resources in your AWS account
 </warning>
 """
 
+# optional create parameters: (AWS parameter name, send falsy values other than None)
+_OPTIONAL_PARAMS = (
+    ('DatabaseName', False),
+    ('VpcSecurityGroupIds', False),
+    ('DBSubnetGroupName', False),
+    ('AvailabilityZones', False),
+    ('BackupRetentionPeriod', True),
+    ('EngineVersion', False),
+)
+
 
 @mcp.tool(
     name='CreateDBCluster',
@@ -51,7 +63,7 @@ When not in readonly mode, this will create actual resources in your AWS account
 @handle_exceptions
 @readonly_check
 async def create_db_cluster(
-    db_cluster_identifier: Annotated[str, Field(description='The identifier for the DB cluster')],
+    db_cluster_identifier: DBClusterIdentifier,
     engine: Annotated[
         str,
         Field(
@@ -90,6 +102,7 @@ async def create_db_cluster(
     engine_version: Annotated[
         Optional[str], Field(description='The version number of the database engine to use')
     ] = None,
+    include_formatted: IncludeFormattedCluster = True,
 ) -> Dict[str, Any]:
     """Create a new RDS database cluster.
 
@@ -104,10 +117,18 @@ async def create_db_cluster(
         backup_retention_period: The number of days for which automated backups are retained
         port: The port number on which the instances in the DB cluster accept connections
         engine_version: The version number of the database engine to use
+        include_formatted: Whether to add a simplified formatted_cluster summary to the response
 
     Returns:
         Dict[str, Any]: The response from the AWS API
     """
+    if not validate_db_identifier(db_cluster_identifier):
+        return {
+            'error': f'Invalid DB cluster identifier: {db_cluster_identifier}. '
+            'It must be 1-63 letters, digits or hyphens, start with a letter, '
+            'and cannot end with a hyphen or contain two consecutive hyphens.'
+        }
+
     # Get RDS client
     rds_client = RDSConnectionManager.get_connection()
 
@@ -116,37 +137,32 @@ async def create_db_cluster(
         'Engine': engine,
         'MasterUsername': master_username,
         'ManageMasterUserPassword': True,
+        # Use ENGINE_PORT_MAP to get the port, defaulting to None if not found
+        'Port': port if port is not None else ENGINE_PORT_MAP.get(engine.lower()),
     }
 
     # add optional parameters if provided
-    if database_name:
-        params['DatabaseName'] = database_name
-    if vpc_security_group_ids:
-        params['VpcSecurityGroupIds'] = vpc_security_group_ids
-    if db_subnet_group_name:
-        params['DBSubnetGroupName'] = db_subnet_group_name
-    if availability_zones:
-        params['AvailabilityZones'] = availability_zones
-    if backup_retention_period is not None:
-        params['BackupRetentionPeriod'] = backup_retention_period
-    if port is not None:
-        params['Port'] = port
-    else:
-        engine_lower = engine.lower()
-        # Use ENGINE_PORT_MAP to get the port, defaulting to None if not found
-        params['Port'] = ENGINE_PORT_MAP.get(engine_lower)
-    if engine_version:
-        params['EngineVersion'] = engine_version
+    params.update(
+        select_optional_params(
+            _OPTIONAL_PARAMS,
+            (
+                database_name,
+                vpc_security_group_ids,
+                db_subnet_group_name,
+                availability_zones,
+                backup_retention_period,
+                engine_version,
+            ),
+        )
+    )
 
     # MCP tags
     params = add_mcp_tags(params)
 
-    logger.info(f'Creating DB cluster {db_cluster_identifier} with engine {engine}')
+    logger.info('Creating DB cluster {} with engine {}', db_cluster_identifier, engine)
     response = await asyncio.to_thread(rds_client.create_db_cluster, **params)
-    logger.success(f'Successfully created DB cluster {db_cluster_identifier}')
-
-    result = format_rds_api_response(response)
-    result['message'] = SUCCESS_CREATED.format(f'DB cluster {db_cluster_identifier}')
-    result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
+    logger.success('Successfully created DB cluster {}', db_cluster_identifier)
 
-    return result
+    return format_cluster_response(
+        response, SUCCESS_CREATED.format(f'DB cluster {db_cluster_identifier}'), include_formatted
+    )
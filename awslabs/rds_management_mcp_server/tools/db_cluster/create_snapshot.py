@@ -92,10 +92,12 @@ async def create_db_cluster_snapshot(
     kwargs = add_mcp_tags(kwargs)
 
     logger.info(
-        f'Creating DB cluster snapshot {db_cluster_snapshot_identifier} for cluster {db_cluster_identifier}'
+        'Creating DB cluster snapshot {} for cluster {}',
+        db_cluster_snapshot_identifier,
+        db_cluster_identifier,
     )
     response = await asyncio.to_thread(rds_client.create_db_cluster_snapshot, **kwargs)
-    logger.success(f'Successfully created DB cluster snapshot {db_cluster_snapshot_identifier}')
+    logger.success('Successfully created DB cluster snapshot {}', db_cluster_snapshot_identifier)
 
     # Format the response
     result = format_rds_api_response(response)
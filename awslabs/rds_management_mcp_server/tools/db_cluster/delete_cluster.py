@@ -19,11 +19,9 @@ from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
 from ...common.decorators.require_confirmation import require_confirmation
+from ...common.schemas import DBClusterIdentifier, IncludeFormattedCluster
 from ...common.server import mcp
-from ...common.utils import (
-    format_rds_api_response,
-)
-from .utils import format_cluster_info
+from .utils import format_cluster_response
 from loguru import logger
 from pydantic import Field
 from typing import Any, Dict, Optional
@@ -48,7 +46,7 @@ This is a destructive operation that permanently deletes data. A confirmation to
 @readonly_check
 @require_confirmation('DeleteDBCluster')
 async def delete_db_cluster(
-    db_cluster_identifier: Annotated[str, Field(description='The identifier for the DB cluster')],
+    db_cluster_identifier: DBClusterIdentifier,
     skip_final_snapshot: Annotated[
         bool,
         Field(
@@ -61,6 +59,7 @@ async def delete_db_cluster(
             description='The DB snapshot identifier of the new DB snapshot created when SkipFinalSnapshot is false'
         ),
     ] = None,
+    include_formatted: IncludeFormattedCluster = True,
     confirmation_token: Annotated[
         Optional[str], Field(description='The confirmation token for the operation')
     ] = None,
@@ -71,6 +70,7 @@ async def delete_db_cluster(
         db_cluster_identifier: The identifier for the DB cluster
         skip_final_snapshot: Determines whether a final DB snapshot is created
         final_db_snapshot_identifier: The DB snapshot identifier if creating final snapshot
+        include_formatted: Whether to add a simplified formatted_cluster summary to the response
         confirmation_token: The confirmation token for the operation
 
     Returns:
@@ -88,12 +88,10 @@ async def delete_db_cluster(
     if not skip_final_snapshot and final_db_snapshot_identifier:
         aws_params['FinalDBSnapshotIdentifier'] = final_db_snapshot_identifier
 
-    logger.info(f'Deleting DB cluster {db_cluster_identifier}')
+    logger.info('Deleting DB cluster {}', db_cluster_identifier)
     response = await asyncio.to_thread(rds_client.delete_db_cluster, **aws_params)
-    logger.success(f'Successfully initiated deletion of DB cluster {db_cluster_identifier}')
-
-    result = format_rds_api_response(response)
-    result['message'] = f'Successfully deleted DB cluster {db_cluster_identifier}'
-    result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
+    logger.success('Successfully initiated deletion of DB cluster {}', db_cluster_identifier)
 
-    return result
+    return format_cluster_response(
+        response, f'Successfully deleted DB cluster {db_cluster_identifier}', include_formatted
+    )
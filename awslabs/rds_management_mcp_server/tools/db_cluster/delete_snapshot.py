@@ -70,12 +70,12 @@ async def delete_db_cluster_snapshot(
     # Get RDS client
     rds_client = RDSConnectionManager.get_connection()
 
-    logger.info(f'Deleting DB cluster snapshot {db_cluster_snapshot_identifier}')
+    logger.info('Deleting DB cluster snapshot {}', db_cluster_snapshot_identifier)
     response = await asyncio.to_thread(
         rds_client.delete_db_cluster_snapshot,
         DBClusterSnapshotIdentifier=db_cluster_snapshot_identifier,
     )
-    logger.success(f'Successfully deleted DB cluster snapshot {db_cluster_snapshot_identifier}')
+    logger.success('Successfully deleted DB cluster snapshot {}', db_cluster_snapshot_identifier)
 
     # Format the response
     result = format_rds_api_response(response)
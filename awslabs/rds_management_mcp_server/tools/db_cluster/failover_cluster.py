@@ -19,11 +19,9 @@ from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
 from ...common.decorators.require_confirmation import require_confirmation
+from ...common.schemas import DBClusterIdentifier, IncludeFormattedCluster
 from ...common.server import mcp
-from ...common.utils import (
-    format_rds_api_response,
-)
-from .utils import format_cluster_info
+from .utils import format_cluster_response
 from loguru import logger
 from pydantic import Field
 from typing import Any, Dict, Optional
@@ -91,11 +89,12 @@ Example usage scenarios:
 @readonly_check
 @require_confirmation('FailoverDBCluster')
 async def failover_db_cluster(
-    db_cluster_identifier: Annotated[str, Field(description='The identifier for the DB cluster')],
+    db_cluster_identifier: DBClusterIdentifier,
     target_db_instance_identifier: Annotated[
         Optional[str],
         Field(description='The name of the instance to promote to the primary instance'),
     ] = None,
+    include_formatted: IncludeFormattedCluster = True,
     confirmation_token: Annotated[
         Optional[str], Field(description='Confirmation token for destructive operation')
     ] = None,
@@ -105,6 +104,7 @@ async def failover_db_cluster(
     Args:
         db_cluster_identifier: The identifier for the DB cluster
         target_db_instance_identifier: The name of the instance to promote to primary
+        include_formatted: Whether to add a simplified formatted_cluster summary to the response
         confirmation_token: Confirmation token for destructive operation
 
     Returns:
@@ -120,12 +120,12 @@ async def failover_db_cluster(
     if target_db_instance_identifier:
         params['TargetDBInstanceIdentifier'] = target_db_instance_identifier
 
-    logger.info(f'Initiating failover for DB cluster {db_cluster_identifier}')
+    logger.info('Initiating failover for DB cluster {}', db_cluster_identifier)
     response = await asyncio.to_thread(rds_client.failover_db_cluster, **params)
-    logger.success(f'Successfully initiated failover for DB cluster {db_cluster_identifier}')
-
-    result = format_rds_api_response(response)
-    result['message'] = f'Successfully initiated failover for DB cluster {db_cluster_identifier}'
-    result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
+    logger.success('Successfully initiated failover for DB cluster {}', db_cluster_identifier)
 
-    return result
+    return format_cluster_response(
+        response,
+        f'Successfully initiated failover for DB cluster {db_cluster_identifier}',
+        include_formatted,
+    )
@@ -21,11 +21,12 @@ from ...common.constants import (
 )
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
+from ...common.schemas import DBClusterIdentifier, IncludeFormattedCluster
 from ...common.server import mcp
 from ...common.utils import (
-    format_rds_api_response,
+    select_optional_params,
 )
-from .utils import format_cluster_info
+from .utils import format_cluster_response
 from loguru import logger
 from pydantic import Field
 from typing import Any, Dict, List, Optional
@@ -41,6 +42,17 @@ Setting apply_immediately=True may cause downtime. By default, changes are appli
 </warning>
 """
 
+# optional modify parameters: (AWS parameter name, send falsy values other than None)
+_OPTIONAL_PARAMS = (
+    ('ApplyImmediately', True),
+    ('BackupRetentionPeriod', True),
+    ('DBClusterParameterGroupName', False),
+    ('VpcSecurityGroupIds', False),
+    ('Port', True),
+    ('EngineVersion', False),
+    ('AllowMajorVersionUpgrade', True),
+)
+
 
 @mcp.tool(
     name='ModifyDBCluster',
@@ -49,7 +61,7 @@ Setting apply_immediately=True may cause downtime. By default, changes are appli
 @handle_exceptions
 @readonly_check
 async def modify_db_cluster(
-    db_cluster_identifier: Annotated[str, Field(description='The identifier for the DB cluster')],
+    db_cluster_identifier: DBClusterIdentifier,
     apply_immediately: Annotated[
         Optional[bool],
         Field(
@@ -78,6 +90,7 @@ async def modify_db_cluster(
     allow_major_version_upgrade: Annotated[
         Optional[bool], Field(description='Indicates whether major version upgrades are allowed')
     ] = None,
+    include_formatted: IncludeFormattedCluster = True,
 ) -> Dict[str, Any]:
     """Modify an existing RDS database cluster configuration.
 
@@ -90,6 +103,7 @@ async def modify_db_cluster(
         port: The port number on which the DB cluster accepts connections
         engine_version: The version number of the database engine to upgrade to
         allow_major_version_upgrade: Indicates whether major version upgrades are allowed
+        include_formatted: Whether to add a simplified formatted_cluster summary to the response
 
     Returns:
         Dict[str, Any]: The response from the AWS API
@@ -102,27 +116,25 @@ async def modify_db_cluster(
     }
 
     # Add optional parameters if provided
-    if apply_immediately is not None:
-        params['ApplyImmediately'] = apply_immediately
-    if backup_retention_period is not None:
-        params['BackupRetentionPeriod'] = backup_retention_period
-    if db_cluster_parameter_group_name:
-        params['DBClusterParameterGroupName'] = db_cluster_parameter_group_name
-    if vpc_security_group_ids:
-        params['VpcSecurityGroupIds'] = vpc_security_group_ids
-    if port is not None:
-        params['Port'] = port
-    if engine_version:
-        params['EngineVersion'] = engine_version
-    if allow_major_version_upgrade is not None:
-        params['AllowMajorVersionUpgrade'] = allow_major_version_upgrade
+    params.update(
+        select_optional_params(
+            _OPTIONAL_PARAMS,
+            (
+                apply_immediately,
+                backup_retention_period,
+                db_cluster_parameter_group_name,
+                vpc_security_group_ids,
+                port,
+                engine_version,
+                allow_major_version_upgrade,
+            ),
+        )
+    )
 
-    logger.info(f'Modifying DB cluster {db_cluster_identifier}')
+    logger.info('Modifying DB cluster {}', db_cluster_identifier)
     response = await asyncio.to_thread(rds_client.modify_db_cluster, **params)
-    logger.success(f'Successfully modified DB cluster {db_cluster_identifier}')
-
-    result = format_rds_api_response(response)
-    result['message'] = SUCCESS_MODIFIED.format(f'DB cluster {db_cluster_identifier}')
-    result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
+    logger.success('Successfully modified DB cluster {}', db_cluster_identifier)
 
-    return result
+    return format_cluster_response(
+        response, SUCCESS_MODIFIED.format(f'DB cluster {db_cluster_identifier}'), include_formatted
+    )
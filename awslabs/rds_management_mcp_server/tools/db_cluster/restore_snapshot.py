@@ -24,9 +24,8 @@ from ...common.decorators.readonly_check import readonly_check
 from ...common.server import mcp
 from ...common.utils import (
     add_mcp_tags,
-    format_rds_api_response,
 )
-from .utils import format_cluster_info
+from .utils import format_cluster_response
 from loguru import logger
 from pydantic import Field
 from typing import Any, Dict, List, Optional
@@ -132,17 +131,15 @@ async def restore_db_cluster_from_snapshot(
     kwargs = add_mcp_tags(kwargs)
 
     logger.info(
-        f'Restoring DB cluster {db_cluster_identifier} from snapshot {snapshot_identifier}'
+        'Restoring DB cluster {} from snapshot {}', db_cluster_identifier, snapshot_identifier
     )
     response = await asyncio.to_thread(rds_client.restore_db_cluster_from_snapshot, **kwargs)
-    logger.success(f'Successfully initiated restore of DB cluster {db_cluster_identifier}')
+    logger.success('Successfully initiated restore of DB cluster {}', db_cluster_identifier)
 
     # Format the response
-    result = format_rds_api_response(response)
-    result['message'] = SUCCESS_RESTORED.format(f'DB cluster {db_cluster_identifier}')
-    result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
-
-    return result
+    return format_cluster_response(
+        response, SUCCESS_RESTORED.format(f'DB cluster {db_cluster_identifier}')
+    )
 
 
 RESTORE_POINT_IN_TIME_TOOL_DESCRIPTION = """Restore an Amazon RDS database cluster to a point in time.
@@ -247,17 +244,13 @@ async def restore_db_cluster_to_point_in_time(
     # Add MCP tags
     kwargs = add_mcp_tags(kwargs)
 
-    logger.info(f'Restoring DB cluster {db_cluster_identifier} to point in time')
+    logger.info('Restoring DB cluster {} to point in time', db_cluster_identifier)
     response = await asyncio.to_thread(rds_client.restore_db_cluster_to_point_in_time, **kwargs)
     logger.success(
-        f'Successfully initiated point-in-time restore of DB cluster {db_cluster_identifier}'
+        'Successfully initiated point-in-time restore of DB cluster {}', db_cluster_identifier
     )
 
     # Format the response
-    result = format_rds_api_response(response)
-    result['message'] = SUCCESS_RESTORED.format(
-        f'DB cluster {db_cluster_identifier} to point in time'
+    return format_cluster_response(
+        response, SUCCESS_RESTORED.format(f'DB cluster {db_cluster_identifier} to point in time')
     )
-    result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
-
-    return result
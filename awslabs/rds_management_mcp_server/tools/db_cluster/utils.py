@@ -14,10 +14,44 @@
 
 """Util to format and process information about RDS database clusters."""
 
-from ...common.utils import convert_datetime_to_string
+from ...common.utils import convert_datetime_to_string, format_rds_api_response
+from operator import itemgetter
 from typing import Any, Dict
 
 
+# extracts the (key, value) pair of an AWS tag
+_TAG_KV = itemgetter('Key', 'Value')
+
+# (formatted key, AWS key) pairs copied as-is from the cluster description
+_CLUSTER_FIELDS = (
+    ('cluster_id', 'DBClusterIdentifier'),
+    ('status', 'Status'),
+    ('engine', 'Engine'),
+    ('engine_version', 'EngineVersion'),
+    ('endpoint', 'Endpoint'),
+    ('reader_endpoint', 'ReaderEndpoint'),
+    ('multi_az', 'MultiAZ'),
+    ('backup_retention', 'BackupRetentionPeriod'),
+    ('preferred_backup_window', 'PreferredBackupWindow'),
+    ('preferred_maintenance_window', 'PreferredMaintenanceWindow'),
+)
+_CLUSTER_OUT_KEYS, _CLUSTER_IN_KEYS = zip(*_CLUSTER_FIELDS)
+
+
+def _format_cluster_member(member: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a DB cluster member."""
+    return {
+        'instance_id': member.get('DBInstanceIdentifier'),
+        'is_writer': member.get('IsClusterWriter'),
+        'status': member.get('DBClusterParameterGroupStatus'),
+    }
+
+
+def _format_vpc_security_group(sg: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a VPC security group membership."""
+    return {'id': sg.get('VpcSecurityGroupId'), 'status': sg.get('Status')}
+
+
 def format_cluster_info(cluster: Dict[str, Any]) -> Dict[str, Any]:
     """Format cluster information for better readability.
 
@@ -27,31 +61,34 @@ def format_cluster_info(cluster: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Formatted cluster information
     """
-    return {
-        'cluster_id': cluster.get('DBClusterIdentifier'),
-        'status': cluster.get('Status'),
-        'engine': cluster.get('Engine'),
-        'engine_version': cluster.get('EngineVersion'),
-        'endpoint': cluster.get('Endpoint'),
-        'reader_endpoint': cluster.get('ReaderEndpoint'),
-        'multi_az': cluster.get('MultiAZ'),
-        'backup_retention': cluster.get('BackupRetentionPeriod'),
-        'preferred_backup_window': cluster.get('PreferredBackupWindow'),
-        'preferred_maintenance_window': cluster.get('PreferredMaintenanceWindow'),
-        'created_time': convert_datetime_to_string(cluster.get('ClusterCreateTime')),
-        'members': [
-            {
-                'instance_id': member.get('DBInstanceIdentifier'),
-                'is_writer': member.get('IsClusterWriter'),
-                'status': member.get('DBClusterParameterGroupStatus'),
-            }
-            for member in cluster.get('DBClusterMembers', [])
-        ],
-        'vpc_security_groups': [
-            {'id': sg.get('VpcSecurityGroupId'), 'status': sg.get('Status')}
-            for sg in cluster.get('VpcSecurityGroups', [])
-        ],
-        'tags': {tag['Key']: tag['Value'] for tag in cluster.get('TagList', [])}
-        if cluster.get('TagList')
-        else {},
-    }
+    get = cluster.get
+
+    formatted = dict(zip(_CLUSTER_OUT_KEYS, map(get, _CLUSTER_IN_KEYS)))
+    formatted['created_time'] = convert_datetime_to_string(get('ClusterCreateTime'))
+    formatted['members'] = list(map(_format_cluster_member, get('DBClusterMembers') or ()))
+    formatted['vpc_security_groups'] = list(
+        map(_format_vpc_security_group, get('VpcSecurityGroups') or ())
+    )
+    formatted['tags'] = dict(map(_TAG_KV, get('TagList') or ()))
+
+    return formatted
+
+
+def format_cluster_response(
+    response: Dict[str, Any], message: str, include_formatted: bool = True
+) -> Dict[str, Any]:
+    """Build the tool result for an API call that returns a DBCluster.
+
+    Args:
+        response: Raw AWS API response
+        message: Success message to include in the result
+        include_formatted: Whether to add the formatted_cluster summary
+
+    Returns:
+        Formatted response dictionary
+    """
+    result = format_rds_api_response(response)
+    result['message'] = message
+    if include_formatted:
+        result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
+    return result
@@ -24,6 +24,7 @@ from ...common.constants import (
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
 from ...common.decorators.require_confirmation import require_confirmation
+from ...common.schemas import DBInstanceIdentifier
 from ...common.server import mcp
 from ...common.utils import (
     format_rds_api_response,
@@ -60,9 +61,7 @@ These operations affect the availability of your database:
 @readonly_check
 @require_confirmation('ChangeDBInstanceStatus')
 async def status_db_instance(
-    db_instance_identifier: Annotated[
-        str, Field(description='The identifier for the DB instance')
-    ],
+    db_instance_identifier: DBInstanceIdentifier,
     action: Annotated[str, Field(description='Action to perform: "start", "stop", or "reboot"')],
     force_failover: Annotated[
         Optional[bool],
@@ -83,42 +82,42 @@ async def status_db_instance(
     Returns:
         Dict[str, Any]: The response from the AWS API
     """
-    # Get RDS client
-    rds_client = RDSConnectionManager.get_connection()
-
     action = action.lower()
 
     if action not in ['start', 'stop', 'reboot']:
         return {'error': f'Invalid action: {action}. Must be one of: start, stop, reboot'}
 
+    # Get RDS client
+    rds_client = RDSConnectionManager.get_connection()
+
     if action == 'start':
-        logger.info(f'Starting DB instance {db_instance_identifier}')
+        logger.info('Starting DB instance {}', db_instance_identifier)
         response = await asyncio.to_thread(
             rds_client.start_db_instance, DBInstanceIdentifier=db_instance_identifier
         )
-        logger.success(f'Successfully started DB instance {db_instance_identifier}')
+        logger.success('Successfully started DB instance {}', db_instance_identifier)
 
         result = format_rds_api_response(response)
         result['message'] = SUCCESS_STARTED.format(f'DB instance {db_instance_identifier}')
 
     elif action == 'stop':
-        logger.info(f'Stopping DB instance {db_instance_identifier}')
+        logger.info('Stopping DB instance {}', db_instance_identifier)
         response = await asyncio.to_thread(
             rds_client.stop_db_instance, DBInstanceIdentifier=db_instance_identifier
         )
-        logger.success(f'Successfully stopped DB instance {db_instance_identifier}')
+        logger.success('Successfully stopped DB instance {}', db_instance_identifier)
 
         result = format_rds_api_response(response)
         result['message'] = SUCCESS_STOPPED.format(f'DB instance {db_instance_identifier}')
 
     elif action == 'reboot':
-        logger.info(f'Rebooting DB instance {db_instance_identifier}')
+        logger.info('Rebooting DB instance {}', db_instance_identifier)
         response = await asyncio.to_thread(
             rds_client.reboot_db_instance,
             DBInstanceIdentifier=db_instance_identifier,
             ForceFailover=force_failover,
         )
-        logger.success(f'Successfully initiated reboot of DB instance {db_instance_identifier}')
+        logger.success('Successfully initiated reboot of DB instance {}', db_instance_identifier)
 
         result = format_rds_api_response(response)
         result['message'] = SUCCESS_REBOOTED.format(f'DB instance {db_instance_identifier}')
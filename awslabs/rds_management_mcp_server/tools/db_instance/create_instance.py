@@ -22,6 +22,7 @@ from ...common.constants import (
 )
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
+from ...common.schemas import DBInstanceIdentifier
 from ...common.server import mcp
 from ...common.utils import (
     add_mcp_tags,
@@ -51,9 +52,7 @@ When not in readonly mode, this will create actual resources in your AWS account
 @handle_exceptions
 @readonly_check
 async def create_db_instance(
-    db_instance_identifier: Annotated[
-        str, Field(description='The identifier for the DB instance')
-    ],
+    db_instance_identifier: DBInstanceIdentifier,
     db_instance_class: Annotated[
         str,
         Field(description='The compute and memory capacity of the DB instance, e.g., db.m5.large'),
@@ -190,9 +189,9 @@ async def create_db_instance(
     # MCP tags
     params = add_mcp_tags(params)
 
-    logger.info(f'Creating DB instance {db_instance_identifier} with engine {engine}')
+    logger.info('Creating DB instance {} with engine {}', db_instance_identifier, engine)
     response = await asyncio.to_thread(rds_client.create_db_instance, **params)
-    logger.success(f'Successfully created DB instance {db_instance_identifier}')
+    logger.success('Successfully created DB instance {}', db_instance_identifier)
 
     result = format_rds_api_response(response)
     result['message'] = SUCCESS_CREATED.format(f'DB instance {db_instance_identifier}')
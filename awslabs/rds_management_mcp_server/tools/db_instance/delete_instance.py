@@ -22,6 +22,7 @@ from ...common.constants import (
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
 from ...common.decorators.require_confirmation import require_confirmation
+from ...common.schemas import DBInstanceIdentifier
 from ...common.server import mcp
 from ...common.utils import (
     format_rds_api_response,
@@ -53,9 +54,7 @@ Without a final snapshot, all data will be permanently lost.
 @readonly_check
 @require_confirmation('DeleteDBInstance')
 async def delete_db_instance(
-    db_instance_identifier: Annotated[
-        str, Field(description='The identifier for the DB instance')
-    ],
+    db_instance_identifier: DBInstanceIdentifier,
     skip_final_snapshot: Annotated[
         bool,
         Field(
@@ -95,9 +94,9 @@ async def delete_db_instance(
     if not skip_final_snapshot and final_db_snapshot_identifier:
         aws_params['FinalDBSnapshotIdentifier'] = final_db_snapshot_identifier
 
-    logger.info(f'Deleting DB instance {db_instance_identifier}')
+    logger.info('Deleting DB instance {}', db_instance_identifier)
     response = await asyncio.to_thread(rds_client.delete_db_instance, **aws_params)
-    logger.success(f'Successfully initiated deletion of DB instance {db_instance_identifier}')
+    logger.success('Successfully initiated deletion of DB instance {}', db_instance_identifier)
 
     result = format_rds_api_response(response)
     result['message'] = SUCCESS_DELETED.format(f'DB instance {db_instance_identifier}')
@@ -16,6 +16,7 @@
 
 import asyncio
 from ...common.connection import RDSConnectionManager
+from ...common.context import RDSContext
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
@@ -32,7 +33,10 @@ DESCRIBE_INSTANCES_TOOL_DESCRIPTION = """Retrieve information about one or multi
 
 This tool allows you to fetch detailed information about RDS database instances
 in your account. You can retrieve information about all instances or filter by
-specific instance identifier or other criteria.
+specific instance identifier or other criteria. When neither max_records nor marker is given,
+up to the server's configured maximum number of items is returned in a single response, and the
+`NextToken` of a truncated response can be passed back as next_token to fetch the rest. A
+`Marker` in the response is an RDS marker and is passed back as marker instead.
 
 <use_case>
 Use this tool when you need programmatic access to instance information, especially
@@ -59,26 +63,34 @@ async def describe_db_instances(
     ] = None,
     marker: Annotated[
         Optional[str],
-        Field(
-            description='An optional pagination token provided by a previous DescribeDBInstances request'
-        ),
+        Field(description='An optional Marker returned by a previous DescribeDBInstances request'),
     ] = None,
     max_records: Annotated[
         Optional[int],
         Field(description='The maximum number of records to include in the response'),
     ] = None,
+    next_token: Annotated[
+        Optional[str],
+        Field(
+            description='An optional NextToken returned by a previous DescribeDBInstances request, to resume a truncated listing'
+        ),
+    ] = None,
 ) -> Dict[str, Any]:
     """Retrieve information about one or multiple Amazon RDS instances.
 
     Args:
         db_instance_identifier: The user-supplied DB instance identifier
         filters: A filter that specifies one or more DB instances to describe
-        marker: An optional pagination token
+        marker: An optional Marker from a previous response
         max_records: The maximum number of records to include in the response
+        next_token: An optional NextToken from a previous truncated listing
 
     Returns:
         Dict[str, Any]: The response from the AWS API
     """
+    if marker and next_token:
+        return {'error': 'Specify either marker or next_token, not both'}
+
     # Get RDS client
     rds_client = RDSConnectionManager.get_connection()
 
@@ -88,13 +100,26 @@ async def describe_db_instances(
         params['DBInstanceIdentifier'] = db_instance_identifier
     if filters:
         params['Filters'] = filters
-    if marker:
-        params['Marker'] = marker
     if max_records:
         params['MaxRecords'] = max_records
 
     logger.info('Describing DB instances')
-    response = await asyncio.to_thread(rds_client.describe_db_instances, **params)
+    if next_token or not (max_records or marker or db_instance_identifier):
+        # let the boto3 paginator follow markers, up to max_records or --max-items
+        pagination_config = RDSContext.get_pagination_config()
+        if max_records:
+            pagination_config['MaxItems'] = max_records
+        if next_token:
+            pagination_config['StartingToken'] = next_token
+        pages = rds_client.get_paginator('describe_db_instances').paginate(
+            **params, PaginationConfig=pagination_config
+        )
+        # a truncated result carries a NextToken, which is a paginator token, not an RDS marker
+        response = await asyncio.to_thread(pages.build_full_result)
+    else:
+        if marker:
+            params['Marker'] = marker
+        response = await asyncio.to_thread(rds_client.describe_db_instances, **params)
 
     result = format_rds_api_response(response)
 
@@ -21,6 +21,7 @@ from ...common.constants import (
 )
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.readonly_check import readonly_check
+from ...common.schemas import DBInstanceIdentifier
 from ...common.server import mcp
 from ...common.utils import (
     format_rds_api_response,
@@ -55,9 +56,7 @@ For storage changes, the instance may become unavailable during the modification
 @handle_exceptions
 @readonly_check
 async def modify_db_instance(
-    db_instance_identifier: Annotated[
-        str, Field(description='The identifier for the DB instance')
-    ],
+    db_instance_identifier: DBInstanceIdentifier,
     apply_immediately: Annotated[
         Optional[bool],
         Field(
@@ -175,9 +174,9 @@ async def modify_db_instance(
     if publicly_accessible is not None:
         params['PubliclyAccessible'] = publicly_accessible
 
-    logger.info(f'Modifying DB instance {db_instance_identifier}')
+    logger.info('Modifying DB instance {}', db_instance_identifier)
     response = await asyncio.to_thread(rds_client.modify_db_instance, **params)
-    logger.success(f'Successfully modified DB instance {db_instance_identifier}')
+    logger.success('Successfully modified DB instance {}', db_instance_identifier)
 
     result = format_rds_api_response(response)
     result['message'] = SUCCESS_MODIFIED.format(f'DB instance {db_instance_identifier}')
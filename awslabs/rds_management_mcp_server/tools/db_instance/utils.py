@@ -14,9 +14,35 @@
 
 """Util to format and process information about RDS database instances."""
 
+from operator import itemgetter
 from typing import Any, Dict
 
 
+# extracts the (key, value) pair of an AWS tag
+_TAG_KV = itemgetter('Key', 'Value')
+
+# (formatted key, AWS key) pairs copied as-is from the instance description
+_INSTANCE_FIELDS = (
+    ('instance_id', 'DBInstanceIdentifier'),
+    ('status', 'DBInstanceStatus'),
+    ('engine', 'Engine'),
+    ('engine_version', 'EngineVersion'),
+    ('instance_class', 'DBInstanceClass'),
+    ('availability_zone', 'AvailabilityZone'),
+    ('db_cluster', 'DBClusterIdentifier'),
+    ('preferred_backup_window', 'PreferredBackupWindow'),
+    ('preferred_maintenance_window', 'PreferredMaintenanceWindow'),
+    ('resource_id', 'DbiResourceId'),
+    ('read_replica_source_db_instance_identifier', 'ReadReplicaSourceDBInstanceIdentifier'),
+)
+_INSTANCE_OUT_KEYS, _INSTANCE_IN_KEYS = zip(*_INSTANCE_FIELDS)
+
+
+def _format_vpc_security_group(sg: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a VPC security group membership."""
+    return {'id': sg.get('VpcSecurityGroupId'), 'status': sg.get('Status')}
+
+
 def format_instance_info(instance: Dict[str, Any]) -> Dict[str, Any]:
     """Format instance information for better readability.
 
@@ -26,48 +52,34 @@ def format_instance_info(instance: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Formatted instance information
     """
+    get = instance.get
+
     # Handle potentially nested endpoint structure
-    endpoint = {}
-    if instance.get('Endpoint'):
-        if isinstance(instance['Endpoint'], dict):
-            endpoint = {
-                'address': instance['Endpoint'].get('Address'),
-                'port': instance['Endpoint'].get('Port'),
-                'hosted_zone_id': instance['Endpoint'].get('HostedZoneId'),
-            }
-        else:
-            endpoint = {'address': instance.get('Endpoint')}
+    raw_endpoint = get('Endpoint')
+    if not raw_endpoint:
+        endpoint = {}
+    elif isinstance(raw_endpoint, dict):
+        endpoint = {
+            'address': raw_endpoint.get('Address'),
+            'port': raw_endpoint.get('Port'),
+            'hosted_zone_id': raw_endpoint.get('HostedZoneId'),
+        }
+    else:
+        endpoint = {'address': raw_endpoint}
 
-    return {
-        'instance_id': instance.get('DBInstanceIdentifier'),
-        'status': instance.get('DBInstanceStatus'),
-        'engine': instance.get('Engine'),
-        'engine_version': instance.get('EngineVersion'),
-        'instance_class': instance.get('DBInstanceClass'),
-        'endpoint': endpoint,
-        'availability_zone': instance.get('AvailabilityZone'),
-        'multi_az': instance.get('MultiAZ', False),
-        'storage': {
-            'type': instance.get('StorageType'),
-            'allocated': instance.get('AllocatedStorage'),
-            'encrypted': instance.get('StorageEncrypted'),
-        },
-        'publicly_accessible': instance.get('PubliclyAccessible', False),
-        'vpc_security_groups': [
-            {'id': sg.get('VpcSecurityGroupId'), 'status': sg.get('Status')}
-            for sg in instance.get('VpcSecurityGroups', [])
-        ],
-        'db_cluster': instance.get('DBClusterIdentifier'),
-        'preferred_backup_window': instance.get('PreferredBackupWindow'),
-        'preferred_maintenance_window': instance.get('PreferredMaintenanceWindow'),
-        'tags': {tag['Key']: tag['Value'] for tag in instance.get('TagList', [])}
-        if instance.get('TagList')
-        else {},
-        'resource_id': instance.get('DbiResourceId'),
-        'read_replica_db_instance_identifiers': instance.get(
-            'ReadReplicaDBInstanceIdentifiers', []
-        ),
-        'read_replica_source_db_instance_identifier': instance.get(
-            'ReadReplicaSourceDBInstanceIdentifier'
-        ),
+    formatted = dict(zip(_INSTANCE_OUT_KEYS, map(get, _INSTANCE_IN_KEYS)))
+    formatted['endpoint'] = endpoint
+    formatted['multi_az'] = get('MultiAZ', False)
+    formatted['storage'] = {
+        'type': get('StorageType'),
+        'allocated': get('AllocatedStorage'),
+        'encrypted': get('StorageEncrypted'),
     }
+    formatted['publicly_accessible'] = get('PubliclyAccessible', False)
+    formatted['vpc_security_groups'] = list(
+        map(_format_vpc_security_group, get('VpcSecurityGroups') or ())
+    )
+    formatted['tags'] = dict(map(_TAG_KV, get('TagList') or ()))
+    formatted['read_replica_db_instance_identifiers'] = get('ReadReplicaDBInstanceIdentifiers', [])
+
+    return formatted
@@ -123,10 +123,10 @@ async def create_db_cluster_parameter_group(
         # Add MCP tags
         params = add_mcp_tags(params)
 
-        logger.info(f'Creating DB cluster parameter group {db_cluster_parameter_group_name}')
+        logger.info('Creating DB cluster parameter group {}', db_cluster_parameter_group_name)
         response = await asyncio.to_thread(rds_client.create_db_cluster_parameter_group, **params)
         logger.success(
-            f'Successfully created DB cluster parameter group {db_cluster_parameter_group_name}'
+            'Successfully created DB cluster parameter group {}', db_cluster_parameter_group_name
         )
 
         result = format_rds_api_response(response)
@@ -242,10 +242,10 @@ async def create_db_instance_parameter_group(
         # Add MCP tags
         params = add_mcp_tags(params)
 
-        logger.info(f'Creating DB instance parameter group {db_parameter_group_name}')
+        logger.info('Creating DB instance parameter group {}', db_parameter_group_name)
         response = await asyncio.to_thread(rds_client.create_db_parameter_group, **params)
         logger.success(
-            f'Successfully created DB instance parameter group {db_parameter_group_name}'
+            'Successfully created DB instance parameter group {}', db_parameter_group_name
         )
 
         result = format_rds_api_response(response)
@@ -17,6 +17,7 @@
 import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
+from ...common.schemas import MaxRecords, PaginationMarker
 from ...common.server import mcp
 from ...common.utils import (
     format_rds_api_response,
@@ -75,10 +76,8 @@ async def describe_db_instance_parameter_groups(
     db_parameter_group_name: Annotated[
         Optional[str], Field(description='The name of the DB parameter group')
     ] = None,
-    marker: Annotated[Optional[str], Field(description='Pagination token')] = None,
-    max_records: Annotated[
-        Optional[int], Field(description='Maximum number of records to return')
-    ] = None,
+    marker: PaginationMarker = None,
+    max_records: MaxRecords = None,
 ) -> Dict[str, Any]:
     """List DB instance parameter groups.
 
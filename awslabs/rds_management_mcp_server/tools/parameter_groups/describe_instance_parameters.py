@@ -17,6 +17,7 @@
 import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
+from ...common.schemas import MaxRecords, PaginationMarker
 from ...common.server import mcp
 from ...common.utils import (
     format_rds_api_response,
@@ -80,10 +81,8 @@ async def describe_db_instance_parameters(
     source: Annotated[
         Optional[str], Field(description='The parameter source (system, engine-default, or user)')
     ] = None,
-    marker: Annotated[Optional[str], Field(description='Pagination token')] = None,
-    max_records: Annotated[
-        Optional[int], Field(description='Maximum number of records to return')
-    ] = None,
+    marker: PaginationMarker = None,
+    max_records: MaxRecords = None,
 ) -> Dict[str, Any]:
     """List all parameters for a DB instance parameter group.
 
@@ -110,7 +109,7 @@ async def describe_db_instance_parameters(
             params['MaxRecords'] = max_records
 
         logger.info(
-            f'Describing parameters for DB instance parameter group {db_parameter_group_name}'
+            'Describing parameters for DB instance parameter group {}', db_parameter_group_name
         )
         response = await asyncio.to_thread(rds_client.describe_db_parameters, **params)
 
@@ -86,14 +86,15 @@ async def modify_db_cluster_parameter_group(
             formatted_param['ApplyMethod'] = param.get('apply_method')
         formatted_parameters.append(formatted_param)
 
-    logger.info(f'Modifying DB cluster parameter group {db_cluster_parameter_group_name}')
+    logger.info('Modifying DB cluster parameter group {}', db_cluster_parameter_group_name)
     response = await asyncio.to_thread(
         rds_client.modify_db_cluster_parameter_group,
         DBClusterParameterGroupName=db_cluster_parameter_group_name,
         Parameters=formatted_parameters,
     )
     logger.success(
-        f'Successfully modified parameters in DB cluster parameter group {db_cluster_parameter_group_name}'
+        'Successfully modified parameters in DB cluster parameter group {}',
+        db_cluster_parameter_group_name,
     )
 
     # Get updated parameters for reference
@@ -188,14 +189,15 @@ async def modify_db_instance_parameter_group(
             formatted_param['ApplyMethod'] = param.get('apply_method')
         formatted_parameters.append(formatted_param)
 
-    logger.info(f'Modifying DB instance parameter group {db_parameter_group_name}')
+    logger.info('Modifying DB instance parameter group {}', db_parameter_group_name)
     response = await asyncio.to_thread(
         rds_client.modify_db_parameter_group,
         DBParameterGroupName=db_parameter_group_name,
         Parameters=formatted_parameters,
     )
     logger.success(
-        f'Successfully modified parameters in DB instance parameter group {db_parameter_group_name}'
+        'Successfully modified parameters in DB instance parameter group {}',
+        db_parameter_group_name,
     )
 
     # Get updated parameters for reference
@@ -99,7 +99,9 @@ async def reset_db_cluster_parameter_group(
             formatted_parameters.append(formatted_param)
 
     logger.info(
-        f'Resetting {"all parameters" if reset_all_parameters else "specified parameters"} in DB cluster parameter group {db_cluster_parameter_group_name}'
+        'Resetting {} in DB cluster parameter group {}',
+        'all parameters' if reset_all_parameters else 'specified parameters',
+        db_cluster_parameter_group_name,
     )
     response = await asyncio.to_thread(
         rds_client.reset_db_cluster_parameter_group,
@@ -108,7 +110,8 @@ async def reset_db_cluster_parameter_group(
         Parameters=formatted_parameters if not reset_all_parameters else [],
     )
     logger.success(
-        f'Successfully reset parameters in DB cluster parameter group {db_cluster_parameter_group_name}'
+        'Successfully reset parameters in DB cluster parameter group {}',
+        db_cluster_parameter_group_name,
     )
 
     result = format_rds_api_response(response)
@@ -190,7 +193,9 @@ async def reset_db_instance_parameter_group(
             formatted_parameters.append(formatted_param)
 
     logger.info(
-        f'Resetting {"all parameters" if reset_all_parameters else "specified parameters"} in DB instance parameter group {db_parameter_group_name}'
+        'Resetting {} in DB instance parameter group {}',
+        'all parameters' if reset_all_parameters else 'specified parameters',
+        db_parameter_group_name,
     )
     response = await asyncio.to_thread(
         rds_client.reset_db_parameter_group,
@@ -199,7 +204,7 @@ async def reset_db_instance_parameter_group(
         Parameters=formatted_parameters if not reset_all_parameters else [],
     )
     logger.success(
-        f'Successfully reset parameters in DB instance parameter group {db_parameter_group_name}'
+        'Successfully reset parameters in DB instance parameter group {}', db_parameter_group_name
     )
 
     result = format_rds_api_response(response)
@@ -0,0 +1,68 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cache module."""
+
+from awslabs.rds_management_mcp_server.common.cache import TTLCache
+from unittest.mock import patch
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_returns_stored_value_until_expired(self):
+        """Test entries are returned until their TTL has passed."""
+        cache = TTLCache()
+        with patch('time.monotonic', return_value=100.0):
+            cache.set('key', 'value', ttl=10)
+            assert cache.get('key') == 'value'
+        with patch('time.monotonic', return_value=111.0):
+            assert cache.get('key') is None
+
+    def test_non_positive_ttl_is_not_stored(self):
+        """Test a TTL of zero disables caching."""
+        cache = TTLCache()
+        cache.set('key', 'value', ttl=0)
+        assert cache.get('key') is None
+
+    def test_oldest_entry_is_evicted_when_full(self):
+        """Test the cache stays within maxsize."""
+        cache = TTLCache(maxsize=2)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key, ttl=60)
+        assert cache.get('a') is None
+        assert cache.get('b') == 'b'
+        assert cache.get('c') == 'c'
+
+    def test_values_are_copied(self):
+        """Test callers cannot modify a cached value through their reference to it."""
+        cache = TTLCache()
+        value = {'items': [1]}
+        cache.set('key', value, ttl=60)
+        value['items'].append(2)
+        cache.get('key')['items'].append(3)
+
+        assert cache.get('key') == {'items': [1]}
+
+    def test_set_is_skipped_after_clear(self):
+        """Test a value fetched before a clear() is not stored after it."""
+        cache = TTLCache()
+        generation = cache.generation()
+        cache.clear()
+
+        cache.set('key', 'stale', ttl=60, generation=generation)
+        assert cache.get('key') is None
+
+        cache.set('key', 'fresh', ttl=60, generation=cache.generation())
+        assert cache.get('key') == 'fresh'
@@ -14,12 +14,11 @@
 
 """Tests for the confirmation module in the RDS Management MCP Server."""
 
-import pytest
 from awslabs.rds_management_mcp_server.common.decorators.readonly_check import (
+    ERROR_READONLY_MODE,
     readonly_check,
 )
 from awslabs.rds_management_mcp_server.common.decorators.require_confirmation import (
-    _pending_operations,
     require_confirmation,
 )
 from unittest.mock import patch
@@ -28,7 +27,6 @@ from unittest.mock import patch
 class TestReadOnlyCheckDecorator:
     """Test the readonly_check decorator."""
 
-    @pytest.mark.asyncio
     @patch('awslabs.rds_management_mcp_server.common.context.RDSContext.readonly_mode')
     async def test_operation_allowed_when_not_readonly(self, mock_readonly_mode):
         """Test operations are allowed when not in readonly mode."""
@@ -41,7 +39,6 @@ class TestReadOnlyCheckDecorator:
         result = await create_test()
         assert result == {'result': 'success'}
 
-    @pytest.mark.asyncio
     @patch('awslabs.rds_management_mcp_server.common.context.RDSContext.readonly_mode')
     async def test_operation_blocked_in_readonly_mode(self, mock_readonly_mode):
         """Test operations return error response in readonly mode."""
@@ -53,7 +50,7 @@ class TestReadOnlyCheckDecorator:
 
         result = await create_test()
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
-        assert 'This operation is not allowed in read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
         assert 'operation' in result
         assert result['operation'] == 'create_test'
         assert 'message' in result
@@ -63,11 +60,6 @@ class TestReadOnlyCheckDecorator:
 class TestRequireConfirmationDecorator:
     """Test the require_confirmation decorator."""
 
-    def setup_method(self):
-        """Clear pending operations before each test."""
-        _pending_operations.clear()
-
-    @pytest.mark.asyncio
     async def test_confirmation_required_without_token(self):
         """Test confirmation is required when no token is provided."""
 
@@ -83,8 +75,7 @@ class TestRequireConfirmationDecorator:
         assert 'confirmation_token' in result
         assert result['confirmation_token'] is not None
 
-    @pytest.mark.asyncio
-    async def test_confirmation_with_valid_token(self):
+    async def test_confirmation_with_valid_token(self, pending_operations):
         """Test operation proceeds with valid confirmation token."""
 
         # First call without token to get one
@@ -101,9 +92,8 @@ class TestRequireConfirmationDecorator:
             db_cluster_identifier='test-cluster', confirmation_token=token
         )
         assert result2 == {'result': 'deleted'}
-        assert token not in _pending_operations  # Token should be removed after use
+        assert token not in pending_operations  # Token should be removed after use
 
-    @pytest.mark.asyncio
     async def test_confirmation_with_invalid_token(self):
         """Test error returned with invalid confirmation token."""
 
@@ -121,7 +111,6 @@ class TestRequireConfirmationDecorator:
             or 'token' in result.get('error', '')
         )
 
-    @pytest.mark.asyncio
     async def test_confirmation_with_mismatched_parameters(self):
         """Test error returned when parameters don't match token."""
 
@@ -137,3 +126,67 @@ class TestRequireConfirmationDecorator:
         result2 = await delete_cluster(db_cluster_identifier='cluster-2', confirmation_token=token)
         assert hasattr(result2, 'error') or (isinstance(result2, dict) and 'error' in result2)
         assert 'Parameter mismatch' in result2['error']
+
+    async def test_confirmation_with_different_identifier_keys(self):
+        """Test a token is rejected by a function that names its resource differently."""
+
+        @require_confirmation('ChangeDBClusterStatus')
+        async def change_cluster(db_cluster_identifier, confirmation_token=None):
+            return {'result': 'changed'}
+
+        @require_confirmation('ChangeDBClusterStatus')
+        async def change_clusters(db_cluster_identifiers, confirmation_token=None):
+            return {'result': 'changed'}
+
+        single_token = (await change_cluster(db_cluster_identifier='harmless-dev'))[
+            'confirmation_token'
+        ]
+        list_token = (await change_clusters(db_cluster_identifiers=['harmless-dev']))[
+            'confirmation_token'
+        ]
+
+        result1 = await change_clusters(
+            db_cluster_identifiers=['prod-a', 'prod-b'], confirmation_token=single_token
+        )
+        result2 = await change_cluster(
+            db_cluster_identifier='prod-a', confirmation_token=list_token
+        )
+        assert 'Parameter mismatch' in result1['error']
+        assert 'Parameter mismatch' in result2['error']
+
+    async def test_confirmation_token_is_single_use(self):
+        """Test a confirmation token cannot be replayed after it is consumed."""
+
+        @require_confirmation('DeleteDBCluster')
+        async def delete_cluster(db_cluster_identifier, confirmation_token=None):
+            return {'result': 'deleted'}
+
+        result1 = await delete_cluster(db_cluster_identifier='test-cluster')
+        token = result1['confirmation_token']
+
+        result2 = await delete_cluster(
+            db_cluster_identifier='test-cluster', confirmation_token=token
+        )
+        result3 = await delete_cluster(
+            db_cluster_identifier='test-cluster', confirmation_token=token
+        )
+        assert result2 == {'result': 'deleted'}
+        assert 'Invalid or expired confirmation token' in result3['error']
+
+    async def test_pending_operations_are_bounded(self, pending_operations):
+        """Test the oldest pending operation is evicted once the store is full."""
+
+        @require_confirmation('DeleteDBCluster')
+        async def delete_cluster(db_cluster_identifier, confirmation_token=None):
+            return {'result': 'deleted'}
+
+        with patch(
+            'awslabs.rds_management_mcp_server.common.decorators.require_confirmation.MAX_PENDING_OPERATIONS',
+            2,
+        ):
+            tokens = [
+                (await delete_cluster(db_cluster_identifier=f'cluster-{i}'))['confirmation_token']
+                for i in range(3)
+            ]
+
+        assert list(pending_operations) == tokens[1:]
@@ -15,100 +15,122 @@
 """Tests for connection module."""
 
 import pytest
-from awslabs.rds_management_mcp_server.common.connection import RDSConnectionManager
-from unittest.mock import MagicMock, patch
+from awslabs.rds_management_mcp_server.common.connection import (
+    BaseConnectionManager,
+    PIConnectionManager,
+    RDSConnectionManager,
+)
+from unittest.mock import Mock
+
+
+def _reset_connection_managers():
+    for manager in (RDSConnectionManager, PIConnectionManager):
+        manager._client = None
+        manager._session_key = None
+    BaseConnectionManager._sessions.clear()
+    BaseConnectionManager.configure()
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_managers():
+    """Drop cached clients, sessions and configuration around every test."""
+    _reset_connection_managers()
+    yield
+    _reset_connection_managers()
 
 
 class TestRDSConnectionManager:
     """Test cases for RDSConnectionManager class."""
 
-    def setup_method(self):
-        """Reset the connection manager before each test."""
-        RDSConnectionManager._client = None
-
-    def test_get_connection_creates_client(self):
-        """Test that get_connection creates a client."""
-        with patch('boto3.Session') as mock_session:
-            mock_client = MagicMock()
-            mock_session.return_value.client.return_value = mock_client
-
-            result = RDSConnectionManager.get_connection()
-
-            assert result is mock_client
-            mock_session.return_value.client.assert_called_once_with(
-                service_name='rds', config=mock_session.return_value.client.call_args[1]['config']
-            )
-
-    def test_get_connection_reuses_client(self):
-        """Test that get_connection reuses existing client."""
-        with patch('boto3.Session') as mock_session:
-            mock_client = MagicMock()
-            mock_session.return_value.client.return_value = mock_client
-
-            # First call should create client
-            result1 = RDSConnectionManager.get_connection()
-            # Second call should reuse client
-            result2 = RDSConnectionManager.get_connection()
-
-            assert result1 is result2
-            mock_session.return_value.client.assert_called_once_with(
-                service_name='rds', config=mock_session.return_value.client.call_args[1]['config']
-            )
-
-    def test_get_connection_with_region(self):
-        """Test get_connection with specific region."""
-        with patch('boto3.Session') as mock_session:
-            mock_client = MagicMock()
-            mock_session.return_value.client.return_value = mock_client
-
-            with patch.dict('os.environ', {'AWS_DEFAULT_REGION': 'us-west-2'}):
-                result = RDSConnectionManager.get_connection()
-
-                assert result is mock_client
-                mock_session.return_value.client.assert_called_once_with(
-                    service_name='rds',
-                    config=mock_session.return_value.client.call_args[1]['config'],
-                )
-
-    def test_get_connection_handles_exception(self):
+    @pytest.fixture(autouse=True)
+    def mock_session(self, monkeypatch):
+        """Replace boto3.Session for every test in the class."""
+        mock = Mock()
+        monkeypatch.setattr('boto3.Session', mock)
+        return mock
+
+    @pytest.mark.parametrize(
+        'n_calls,env',
+        [
+            (1, {}),
+            (2, {}),
+            (3, {}),
+            (1, {'AWS_DEFAULT_REGION': 'us-west-2'}),
+        ],
+    )
+    def test_get_connection_returns_single_client(self, mock_session, monkeypatch, n_calls, env):
+        """Test that get_connection creates one client and reuses it on later calls."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        mock_client = Mock()
+        mock_session.return_value.client.return_value = mock_client
+
+        results = [RDSConnectionManager.get_connection() for _ in range(n_calls)]
+
+        assert all(result is mock_client for result in results)
+        mock_session.return_value.client.assert_called_once()
+        assert mock_session.return_value.client.call_args.kwargs['service_name'] == 'rds'
+
+    def test_get_connection_sets_connection_pool_size(self, mock_session, monkeypatch):
+        """Test get_connection sizes the HTTP connection pool from the environment."""
+        monkeypatch.setenv('RDS_MAX_POOL_CONNECTIONS', '20')
+        RDSConnectionManager.get_connection()
+
+        config = mock_session.return_value.client.call_args[1]['config']
+        assert config.max_pool_connections == 20
+
+    def test_get_connection_handles_exception(self, mock_session):
         """Test get_connection handles boto3 exceptions."""
-        with patch('boto3.Session') as mock_session:
-            mock_session.return_value.client.side_effect = Exception('Connection failed')
+        mock_session.return_value.client.side_effect = Exception('Connection failed')
+
+        with pytest.raises(Exception):
+            RDSConnectionManager.get_connection()
 
-            with pytest.raises(Exception):
-                RDSConnectionManager.get_connection()
+    def test_reset_connection(self, mock_session):
+        """Test that connection can be reset."""
+        mock_client1 = Mock()
+        mock_client2 = Mock()
+        mock_session.return_value.client.side_effect = [mock_client1, mock_client2]
+
+        # First connection
+        client1 = RDSConnectionManager.get_connection()
+        assert client1 is mock_client1
 
-    def test_connection_manager_is_singleton(self):
-        """Test that connection manager maintains singleton pattern."""
-        with patch('boto3.Session') as mock_session:
-            mock_client = MagicMock()
-            mock_session.return_value.client.return_value = mock_client
+        # Reset connection
+        RDSConnectionManager._client = None
 
-            # Multiple calls should return the same client
-            client1 = RDSConnectionManager.get_connection()
-            client2 = RDSConnectionManager.get_connection()
-            client3 = RDSConnectionManager.get_connection()
+        # Second connection should create new client
+        client2 = RDSConnectionManager.get_connection()
+        assert client2 is mock_client2
+        assert client1 is not client2
 
-            assert client1 is client2 is client3
-            mock_session.return_value.client.assert_called_once()
+        assert mock_session.return_value.client.call_count == 2
 
-    def test_reset_connection(self):
-        """Test that connection can be reset."""
-        with patch('boto3.Session') as mock_session:
-            mock_client1 = MagicMock()
-            mock_client2 = MagicMock()
-            mock_session.return_value.client.side_effect = [mock_client1, mock_client2]
+    def test_clients_share_session(self, mock_session):
+        """Test that clients for the same profile and region share one session."""
+        RDSConnectionManager.get_connection()
+        PIConnectionManager.get_connection()
+
+        RDSConnectionManager._client = None
+        RDSConnectionManager.get_connection()
+
+        mock_session.assert_called_once()
+        assert mock_session.return_value.client.call_count == 3
 
-            # First connection
-            client1 = RDSConnectionManager.get_connection()
-            assert client1 is mock_client1
+    def test_close_connection_discards_session(self, mock_session):
+        """Test that closing a client makes the next connection resolve credentials again."""
+        RDSConnectionManager.get_connection()
+        RDSConnectionManager.close_connection()
+        RDSConnectionManager.get_connection()
 
-            # Reset connection
-            RDSConnectionManager._client = None
+        assert mock_session.call_count == 2
+        mock_session.return_value.client.return_value.close.assert_called_once()
 
-            # Second connection should create new client
-            client2 = RDSConnectionManager.get_connection()
-            assert client2 is mock_client2
-            assert client1 is not client2
+    def test_configure_overrides_environment(self, mock_session, monkeypatch):
+        """Test that a configured profile and region take precedence over the environment."""
+        monkeypatch.setenv('AWS_PROFILE', 'env')
+        monkeypatch.setenv('AWS_REGION', 'us-east-1')
+        RDSConnectionManager.configure('cli', 'eu-west-1')
+        RDSConnectionManager.get_connection()
 
-            assert mock_session.return_value.client.call_count == 2
+        mock_session.assert_called_once_with(profile_name='cli', region_name='eu-west-1')
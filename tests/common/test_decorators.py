@@ -14,129 +14,117 @@
 
 """Tests for common decorators."""
 
-import pytest
+from awslabs.rds_management_mcp_server.common.cache import describe_cache
 from awslabs.rds_management_mcp_server.common.decorators.handle_exceptions import handle_exceptions
 from awslabs.rds_management_mcp_server.common.decorators.readonly_check import readonly_check
 from awslabs.rds_management_mcp_server.common.decorators.require_confirmation import (
     require_confirmation,
 )
+from botocore.exceptions import ClientError
+
+
+@handle_exceptions
+async def _handled_success():
+    return {'status': 'success'}
+
+
+@handle_exceptions
+async def _handled_value_error():
+    raise ValueError('Test error')
+
+
+_CLIENT_ERROR = ClientError(
+    error_response={'Error': {'Code': 'ValidationException', 'Message': 'Invalid parameter'}},
+    operation_name='CreateDBCluster',
+)
+
+
+@handle_exceptions
+async def _handled_client_error():
+    raise _CLIENT_ERROR
+
+
+@readonly_check
+async def _write_operation():
+    return {'status': 'success'}
+
+
+@require_confirmation('DeleteDBCluster')
+async def _confirmed_delete(db_cluster_identifier, confirmation_token=None):
+    return {'status': 'success'}
 
 
 class TestHandleExceptions:
     """Test cases for handle_exceptions decorator."""
 
-    @pytest.mark.asyncio
     async def test_handle_exceptions_success(self):
         """Test handle_exceptions with successful function call."""
-
-        @handle_exceptions
-        async def test_func():
-            return {'status': 'success'}
-
-        result = await test_func()
+        result = await _handled_success()
         assert result == {'status': 'success'}
 
-    @pytest.mark.asyncio
     async def test_handle_exceptions_with_exception(self):
         """Test handle_exceptions with exception."""
-
-        @handle_exceptions
-        async def test_func():
-            raise ValueError('Test error')
-
-        result = await test_func()
-        assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
+        result = await _handled_value_error()
+        assert 'error' in result
         assert 'Test error' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_handle_exceptions_with_client_error(self):
         """Test handle_exceptions with client error."""
-        from botocore.exceptions import ClientError
-
-        @handle_exceptions
-        async def test_func():
-            raise ClientError(
-                error_response={
-                    'Error': {'Code': 'ValidationException', 'Message': 'Invalid parameter'}
-                },
-                operation_name='CreateDBCluster',
-            )
-
-        result = await test_func()
-        assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
-        assert result['error_message'] == 'Invalid parameter'
+        result = await _handled_client_error()
+        assert 'error' in result and result.get('error_message') == 'Invalid parameter'
 
 
 class TestReadonlyCheck:
     """Test cases for readonly_check decorator."""
 
-    @pytest.mark.asyncio
     async def test_readonly_check_allowed(self, mock_rds_context_allowed):
         """Test readonly_check when operations are allowed."""
-
-        @readonly_check
-        async def test_func():
-            return {'status': 'success'}
-
-        result = await test_func()
+        result = await _write_operation()
         assert result == {'status': 'success'}
 
-    @pytest.mark.asyncio
     async def test_readonly_check_blocked(self, mock_rds_context_readonly):
         """Test readonly_check when operations are blocked."""
+        result = await _write_operation()
+        assert 'error' in result
+        assert 'read-only mode' in result['message']
 
-        @readonly_check
-        async def test_func():
-            return {'status': 'success'}
+    async def test_readonly_check_clears_describe_cache(self, mock_rds_context_allowed):
+        """Test a permitted operation discards cached describe results."""
+        describe_cache.set('key', {'cached': True}, ttl=60)
 
-        result = await test_func()
-        assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
-        assert 'read-only mode' in result['message']
+        await _write_operation()
+        assert describe_cache.get('key') is None
 
 
 class TestRequireConfirmation:
     """Test cases for require_confirmation decorator."""
 
-    @pytest.mark.asyncio
     async def test_require_confirmation_with_token(self):
         """Test require_confirmation with valid token."""
-
-        @require_confirmation('DeleteDBCluster')
-        async def test_func(db_cluster_identifier, confirmation_token=None):
-            return {'status': 'success'}
-
         # First get a token
-        result1 = await test_func(db_cluster_identifier='test-resource')
+        result1 = await _confirmed_delete(db_cluster_identifier='test-resource')
         token = result1['confirmation_token']
 
         # Then use the token
-        result2 = await test_func(db_cluster_identifier='test-resource', confirmation_token=token)
+        result2 = await _confirmed_delete(
+            db_cluster_identifier='test-resource', confirmation_token=token
+        )
         assert result2 == {'status': 'success'}
 
-    @pytest.mark.asyncio
     async def test_require_confirmation_without_token(self):
         """Test require_confirmation without token."""
-
-        @require_confirmation('DeleteDBCluster')
-        async def test_func(db_cluster_identifier):
-            return {'status': 'success'}
-
-        result = await test_func(db_cluster_identifier='test-resource')
+        result = await _confirmed_delete(db_cluster_identifier='test-resource')
         assert result['requires_confirmation'] is True
         assert 'warning' in result
         assert 'confirmation_token' in result
         assert result['confirmation_token'] is not None
 
-    @pytest.mark.asyncio
     async def test_require_confirmation_with_empty_token(self):
         """Test require_confirmation with empty token."""
-
-        @require_confirmation('DeleteDBCluster')
-        async def test_func(db_cluster_identifier, confirmation_token=None):
-            return {'status': 'success'}
-
         # Empty string is treated as no token, so it should generate a new confirmation token
-        result = await test_func(db_cluster_identifier='test-resource', confirmation_token='')
+        result = await _confirmed_delete(
+            db_cluster_identifier='test-resource', confirmation_token=''
+        )
         assert result['requires_confirmation'] is True
         assert 'warning' in result
         assert 'confirmation_token' in result
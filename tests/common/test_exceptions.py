@@ -14,7 +14,6 @@
 
 """Tests for the exceptions module in the RDS Management MCP Server."""
 
-import pytest
 from awslabs.rds_management_mcp_server.common.decorators.handle_exceptions import (
     handle_exceptions,
 )
@@ -25,7 +24,6 @@ from unittest.mock import patch
 class TestHandleExceptionsDecorator:
     """Test the handle_exceptions decorator."""
 
-    @pytest.mark.asyncio
     async def test_successful_async_function(self):
         """Test decorator with successful async function execution."""
 
@@ -36,7 +34,6 @@ class TestHandleExceptionsDecorator:
         result = await test_func()
         assert result == {'result': 'success'}
 
-    @pytest.mark.asyncio
     async def test_successful_sync_function(self):
         """Test decorator with successful sync function execution."""
 
@@ -47,7 +44,6 @@ class TestHandleExceptionsDecorator:
         result = await test_func()
         assert result == {'result': 'sync success'}
 
-    @pytest.mark.asyncio
     async def test_function_with_arguments(self):
         """Test decorator preserves function arguments."""
 
@@ -58,8 +54,7 @@ class TestHandleExceptionsDecorator:
         result = await test_func('test', arg2='value')
         assert result == {'arg1': 'test', 'arg2': 'value'}
 
-    @pytest.mark.asyncio
-    async def test_preserves_function_metadata(self):
+    def test_preserves_function_metadata(self):
         """Test decorator preserves function metadata."""
 
         @handle_exceptions
@@ -74,7 +69,6 @@ class TestHandleExceptionsDecorator:
 class TestClientErrorHandling:
     """Test ClientError exception handling."""
 
-    @pytest.mark.asyncio
     async def test_client_error_response_format(self):
         """Test ClientError produces correct JSON response format."""
         error_code = 'AccessDenied'
@@ -94,7 +88,6 @@ class TestClientErrorHandling:
         assert result_dict['error_message'] == error_message
         assert result_dict['operation'] == 'test_func'
 
-    @pytest.mark.asyncio
     @patch('awslabs.rds_management_mcp_server.common.decorators.handle_exceptions.logger.error')
     async def test_client_error_logging(self, mock_log_error):
         """Test ClientError is properly logged."""
@@ -113,7 +106,6 @@ class TestClientErrorHandling:
 class TestGeneralExceptionHandling:
     """Test general exception handling."""
 
-    @pytest.mark.asyncio
     async def test_general_exception_response_format(self):
         """Test general exceptions produce correct JSON response format."""
         error_message = 'Unexpected runtime error'
@@ -130,7 +122,6 @@ class TestGeneralExceptionHandling:
         assert result_dict['error_message'] == error_message
         assert result_dict['operation'] == 'test_func'
 
-    @pytest.mark.asyncio
     @patch(
         'awslabs.rds_management_mcp_server.common.decorators.handle_exceptions.logger.exception'
     )
@@ -14,8 +14,24 @@
 
 """Tests for server module."""
 
+import asyncio
 import pytest
-from awslabs.rds_management_mcp_server.common.server import mcp
+import threading
+from awslabs.rds_management_mcp_server.common.connection import RDSConnectionManager
+from awslabs.rds_management_mcp_server.common.server import mcp, server_lifespan
+from concurrent.futures import ThreadPoolExecutor
+from mcp.server.fastmcp import FastMCP
+from unittest.mock import patch
+
+
+# the lifespan sets up each event loop only once, so its tests cannot share the session loop
+own_event_loop = pytest.mark.asyncio(loop_scope='function')
+
+
+@pytest.fixture
+def fresh_mcp():
+    """Return an empty FastMCP server so registration tests leave the real one untouched."""
+    return FastMCP(name='test')
 
 
 class TestMCPServer:
@@ -45,58 +61,94 @@ class TestMCPServer:
         assert hasattr(mcp, 'instructions')
         assert hasattr(mcp, 'dependencies')
 
-    @pytest.mark.asyncio
-    async def test_mcp_server_tool_registration(self):
+    @own_event_loop
+    async def test_server_lifespan_routes_to_thread_to_rds_executor(self):
+        """Test blocking calls run on the dedicated RDS worker threads inside the lifespan."""
+        with patch.object(RDSConnectionManager, 'get_connection'):
+            async with server_lifespan(mcp):
+                thread_name = await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith('rds-io')
+
+    @own_event_loop
+    async def test_server_lifespan_sizes_executor_to_connection_pool(self, monkeypatch):
+        """Test the RDS worker threads follow RDS_MAX_POOL_CONNECTIONS."""
+        monkeypatch.setenv('RDS_MAX_POOL_CONNECTIONS', '7')
+        with (
+            patch.object(RDSConnectionManager, 'get_connection'),
+            patch(
+                'awslabs.rds_management_mcp_server.common.server.ThreadPoolExecutor',
+                wraps=ThreadPoolExecutor,
+            ) as mock_executor,
+        ):
+            async with server_lifespan(mcp):
+                pass
+
+        assert mock_executor.call_args.kwargs['max_workers'] == 7
+
+    @own_event_loop
+    async def test_server_lifespan_creates_rds_client(self):
+        """Test the shared RDS client is created before the first tool call."""
+        with patch.object(RDSConnectionManager, 'get_connection') as mock_get_connection:
+            async with server_lifespan(mcp):
+                pass
+
+        mock_get_connection.assert_called_once_with()
+
+    @own_event_loop
+    async def test_server_lifespan_tolerates_client_errors(self):
+        """Test a client creation failure does not stop the server from starting."""
+        with patch.object(
+            RDSConnectionManager, 'get_connection', side_effect=Exception('no credentials')
+        ):
+            async with server_lifespan(mcp):
+                entered = True
+
+        assert entered
+
+    async def test_mcp_server_tool_registration(self, fresh_mcp):
         """Test tool registration on MCP server."""
 
-        @mcp.tool(name='test_tool', description='Test tool')
+        @fresh_mcp.tool(name='test_tool', description='Test tool')
         def test_tool():
             return 'test'
 
         # Tool should be registered
-        tools = await mcp.list_tools()
+        tools = await fresh_mcp.list_tools()
         assert 'test_tool' in [tool.name for tool in tools]
 
-    @pytest.mark.asyncio
-    async def test_mcp_server_resource_registration(self):
+    async def test_mcp_server_resource_registration(self, fresh_mcp):
         """Test resource registration on MCP server."""
 
-        @mcp.resource('test://resource')
+        @fresh_mcp.resource('test://resource')
         def test_resource():
             return 'test'
 
         # Resource should be registered
-        resources = await mcp.list_resources()
+        resources = await fresh_mcp.list_resources()
         assert any('test://resource' in str(resource) for resource in resources)
 
-    @pytest.mark.asyncio
-    async def test_mcp_server_handles_multiple_tools(self):
-        """Test MCP server handles multiple tool registrations."""
+    async def test_mcp_server_registers_multiple(self, fresh_mcp):
+        """Test MCP server handles multiple tool and resource registrations."""
 
-        @mcp.tool(name='test_tool_1', description='Test tool 1')
+        @fresh_mcp.tool(name='test_tool_1', description='Test tool 1')
         def test_tool_1():
             return 'test1'
 
-        @mcp.tool(name='test_tool_2', description='Test tool 2')
+        @fresh_mcp.tool(name='test_tool_2', description='Test tool 2')
         def test_tool_2():
             return 'test2'
 
-        tools = await mcp.list_tools()
-        tool_names = [tool.name for tool in tools]
-        assert 'test_tool_1' in tool_names
-        assert 'test_tool_2' in tool_names
-
-    @pytest.mark.asyncio
-    async def test_mcp_server_handles_multiple_resources(self):
-        """Test MCP server handles multiple resource registrations."""
-
-        @mcp.resource('test://resource1')
+        @fresh_mcp.resource('test://resource1')
         def test_resource_1():
             return 'test1'
 
-        @mcp.resource('test://resource2')
+        @fresh_mcp.resource('test://resource2')
         def test_resource_2():
             return 'test2'
 
-        resources = await mcp.list_resources()
-        assert len(resources) >= 2
+        tools = await fresh_mcp.list_tools()
+        resources = await fresh_mcp.list_resources()
+
+        assert [tool.name for tool in tools] == ['test_tool_1', 'test_tool_2']
+        assert len(resources) == 2
@@ -14,58 +14,80 @@
 
 """Tests for utils module."""
 
+import datetime
+import pytest
+from awslabs.rds_management_mcp_server.common.constants import MCP_SERVER_VERSION
 from awslabs.rds_management_mcp_server.common.utils import (
     add_mcp_tags,
     convert_datetime_to_string,
     format_rds_api_response,
     handle_paginated_aws_api_call,
+    select_optional_params,
+    validate_db_identifier,
 )
-from unittest.mock import MagicMock
 
 
 class TestFormatRDSApiResponse:
     """Test cases for format_rds_api_response function."""
 
-    def test_format_response_with_response_metadata(self):
-        """Test formatting response with ResponseMetadata."""
+    @pytest.mark.parametrize(
+        'response,expected',
+        [
+            (
+                {
+                    'DBCluster': {'DBClusterIdentifier': 'test-cluster'},
+                    'ResponseMetadata': {
+                        'RequestId': 'test-request-id',
+                        'HTTPStatusCode': 200,
+                        'HTTPHeaders': {'content-type': 'application/json'},
+                        'RetryAttempts': 0,
+                    },
+                },
+                {'DBCluster': {'DBClusterIdentifier': 'test-cluster'}},
+            ),
+            (
+                {'DBCluster': {'DBClusterIdentifier': 'test-cluster'}},
+                {'DBCluster': {'DBClusterIdentifier': 'test-cluster'}},
+            ),
+            ({}, {}),
+            ({'ResponseMetadata': {'RequestId': 'test-request-id', 'HTTPStatusCode': 200}}, {}),
+        ],
+        ids=[
+            'with_response_metadata',
+            'without_response_metadata',
+            'empty_dict',
+            'only_response_metadata',
+        ],
+    )
+    def test_format_response(self, response, expected):
+        """Test formatting strips ResponseMetadata and keeps everything else."""
+        assert format_rds_api_response(response) == expected
+
+    def test_format_response_converts_nested_datetimes(self):
+        """Test formatting converts nested datetime objects in place."""
+        dt = datetime.datetime(2023, 1, 1, 12, 0, 0)
         response = {
-            'DBCluster': {'DBClusterIdentifier': 'test-cluster'},
-            'ResponseMetadata': {
-                'RequestId': 'test-request-id',
-                'HTTPStatusCode': 200,
-                'HTTPHeaders': {'content-type': 'application/json'},
-                'RetryAttempts': 0,
-            },
+            'DBClusters': [{'ClusterCreateTime': dt, 'Members': [{'Time': dt}]}],
+            'ResponseMetadata': {'RequestId': 'test-request-id'},
         }
 
         result = format_rds_api_response(response)
 
-        assert 'ResponseMetadata' not in result
-        assert result['DBCluster']['DBClusterIdentifier'] == 'test-cluster'
-
-    def test_format_response_without_response_metadata(self):
-        """Test formatting response without ResponseMetadata."""
-        response = {'DBCluster': {'DBClusterIdentifier': 'test-cluster'}}
-
-        result = format_rds_api_response(response)
-
-        assert result['DBCluster']['DBClusterIdentifier'] == 'test-cluster'
-
-    def test_format_response_empty_dict(self):
-        """Test formatting empty response."""
-        response = {}
-
-        result = format_rds_api_response(response)
-
-        assert result == {}
-
-    def test_format_response_only_response_metadata(self):
-        """Test formatting response with only ResponseMetadata."""
-        response = {'ResponseMetadata': {'RequestId': 'test-request-id', 'HTTPStatusCode': 200}}
+        assert result is response
+        assert result == {
+            'DBClusters': [
+                {
+                    'ClusterCreateTime': '2023-01-01T12:00:00',
+                    'Members': [{'Time': '2023-01-01T12:00:00'}],
+                }
+            ]
+        }
 
-        result = format_rds_api_response(response)
 
-        assert result == {}
+_EXPECTED_MCP_TAGS = [
+    {'Key': 'mcp_server_version', 'Value': MCP_SERVER_VERSION},
+    {'Key': 'created_by', 'Value': 'rds-management-mcp-server'},
+]
 
 
 class TestAddMCPTags:
@@ -77,12 +99,7 @@ class TestAddMCPTags:
 
         result = add_mcp_tags(params)
 
-        assert 'Tags' in result
-        assert len(result['Tags']) >= 2
-
-        tag_keys = [tag['Key'] for tag in result['Tags']]
-        assert 'mcp_server_version' in tag_keys
-        assert 'created_by' in tag_keys
+        assert result['Tags'] == _EXPECTED_MCP_TAGS
 
     def test_add_mcp_tags_to_existing_params(self):
         """Test adding MCP tags to existing parameters."""
@@ -92,8 +109,7 @@ class TestAddMCPTags:
 
         assert result['DBClusterIdentifier'] == 'test-cluster'
         assert result['Engine'] == 'aurora-mysql'
-        assert 'Tags' in result
-        assert len(result['Tags']) >= 2
+        assert result['Tags'] == _EXPECTED_MCP_TAGS
 
     def test_add_mcp_tags_with_existing_tags(self):
         """Test adding MCP tags to parameters with existing tags."""
@@ -108,23 +124,41 @@ class TestAddMCPTags:
         result = add_mcp_tags(params)
 
         assert result['DBClusterIdentifier'] == 'test-cluster'
-        assert len(result['Tags']) >= 4  # 2 existing + 2 MCP tags
+        assert result['Tags'] == [
+            {'Key': 'Environment', 'Value': 'Production'},
+            {'Key': 'Team', 'Value': 'DataEngineering'},
+            *_EXPECTED_MCP_TAGS,
+        ]
 
-        tag_keys = [tag['Key'] for tag in result['Tags']]
-        assert 'Environment' in tag_keys
-        assert 'Team' in tag_keys
-        assert 'mcp_server_version' in tag_keys
-        assert 'created_by' in tag_keys
+    def test_add_mcp_tags_does_not_mutate_caller_tags(self):
+        """Test that the caller's tag list is not modified in place."""
+        caller_tags = [{'Key': 'Environment', 'Value': 'Production'}]
+        params = {'Tags': caller_tags}
+
+        result = add_mcp_tags(params)
+
+        assert caller_tags == [{'Key': 'Environment', 'Value': 'Production'}]
+        assert result['Tags'] is not caller_tags
+        assert len(result['Tags']) == 3
+
+    def test_add_mcp_tags_are_not_shared_between_calls(self):
+        """Test that changing the tags of one call does not leak into the next."""
+        first = add_mcp_tags({})
+        first['Tags'][0]['Value'] = 'changed'
+
+        second = add_mcp_tags({})
+
+        assert second['Tags'] == _EXPECTED_MCP_TAGS
 
     def test_add_mcp_tags_preserves_original_params(self):
         """Test that adding MCP tags doesn't modify original parameters."""
         original_params = {'DBClusterIdentifier': 'test-cluster', 'Engine': 'aurora-mysql'}
-        params = original_params.copy()
+        keys_before = frozenset(original_params)
 
-        result = add_mcp_tags(params)
+        result = add_mcp_tags(dict(original_params))
 
         # Original should be unchanged
-        assert 'Tags' not in original_params
+        assert frozenset(original_params) == keys_before
         # Result should have tags
         assert 'Tags' in result
 
@@ -132,32 +166,26 @@ class TestAddMCPTags:
 class TestConvertDatetimeToString:
     """Test cases for convert_datetime_to_string function."""
 
+    _DT = datetime.datetime(2023, 1, 1, 12, 0, 0)
+    _ISO = '2023-01-01T12:00:00'
+
     def test_convert_datetime_to_string_with_datetime(self):
         """Test converting datetime object to string."""
-        import datetime
-
-        dt = datetime.datetime(2023, 1, 1, 12, 0, 0)
-        result = convert_datetime_to_string(dt)
-        assert result == '2023-01-01T12:00:00'
+        result = convert_datetime_to_string(self._DT)
+        assert result == self._ISO
 
     def test_convert_datetime_to_string_with_dict(self):
         """Test converting dictionary containing datetime objects."""
-        import datetime
-
-        dt = datetime.datetime(2023, 1, 1, 12, 0, 0)
-        obj = {'timestamp': dt, 'name': 'test'}
+        obj = {'timestamp': self._DT, 'name': 'test'}
         result = convert_datetime_to_string(obj)
-        assert result['timestamp'] == '2023-01-01T12:00:00'
+        assert result['timestamp'] == self._ISO
         assert result['name'] == 'test'
 
     def test_convert_datetime_to_string_with_list(self):
         """Test converting list containing datetime objects."""
-        import datetime
-
-        dt = datetime.datetime(2023, 1, 1, 12, 0, 0)
-        obj = [dt, 'test', 42]
+        obj = [self._DT, 'test', 42]
         result = convert_datetime_to_string(obj)
-        assert result[0] == '2023-01-01T12:00:00'
+        assert result[0] == self._ISO
         assert result[1] == 'test'
         assert result[2] == 42
 
@@ -168,31 +196,58 @@ class TestConvertDatetimeToString:
         assert convert_datetime_to_string(None) is None
 
 
+# canned paginator responses; the pagination helper only iterates them, so tuples suffice
+_PAGES_SINGLE = (
+    {
+        'DBClusters': (
+            {'DBClusterIdentifier': 'cluster-1'},
+            {'DBClusterIdentifier': 'cluster-2'},
+        )
+    },
+)
+_PAGES_MULTIPLE = (
+    {'DBClusters': ({'DBClusterIdentifier': 'cluster-1'},)},
+    {'DBClusters': ({'DBClusterIdentifier': 'cluster-2'},)},
+)
+_PAGES_EMPTY = ({'DBClusters': ()},)
+
+
+class _StubPaginator:
+    """Paginator stand-in that serves canned pages and records its arguments."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.paginate_kwargs = None
+
+    def paginate(self, **kwargs):
+        self.paginate_kwargs = kwargs
+        return iter(self.pages)
+
+
+class _StubClient:
+    """Client stand-in whose only operation is get_paginator."""
+
+    def __init__(self, pages):
+        self.paginator = _StubPaginator(pages)
+        self.paginator_names = []
+
+    def get_paginator(self, name):
+        self.paginator_names.append(name)
+        return self.paginator
+
+
 class TestHandlePaginatedAwsApiCall:
     """Test cases for handle_paginated_aws_api_call function."""
 
     def test_handle_paginated_aws_api_call_single_page(self):
         """Test handling single page response."""
-        mock_client = MagicMock()
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-
-        # Mock page iterator
-        mock_page_iterator = [
-            {
-                'DBClusters': [
-                    {'DBClusterIdentifier': 'cluster-1'},
-                    {'DBClusterIdentifier': 'cluster-2'},
-                ]
-            }
-        ]
-        mock_paginator.paginate.return_value = mock_page_iterator
+        client = _StubClient(_PAGES_SINGLE)
 
         def format_function(item):
             return {'cluster_id': item['DBClusterIdentifier']}
 
         result = handle_paginated_aws_api_call(
-            client=mock_client,
+            client=client,
             paginator_name='describe_db_clusters',
             operation_parameters={'MaxItems': 100},
             format_function=format_function,
@@ -202,26 +257,18 @@ class TestHandlePaginatedAwsApiCall:
         assert len(result) == 2
         assert result[0]['cluster_id'] == 'cluster-1'
         assert result[1]['cluster_id'] == 'cluster-2'
-        mock_client.get_paginator.assert_called_once_with('describe_db_clusters')
+        assert client.paginator_names == ['describe_db_clusters']
+        assert client.paginator.paginate_kwargs['PaginationConfig'] == {'MaxItems': 100}
 
     def test_handle_paginated_aws_api_call_multiple_pages(self):
         """Test handling multiple page response."""
-        mock_client = MagicMock()
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-
-        # Mock page iterator with multiple pages
-        mock_page_iterator = [
-            {'DBClusters': [{'DBClusterIdentifier': 'cluster-1'}]},
-            {'DBClusters': [{'DBClusterIdentifier': 'cluster-2'}]},
-        ]
-        mock_paginator.paginate.return_value = mock_page_iterator
+        client = _StubClient(_PAGES_MULTIPLE)
 
         def format_function(item):
             return {'cluster_id': item['DBClusterIdentifier']}
 
         result = handle_paginated_aws_api_call(
-            client=mock_client,
+            client=client,
             paginator_name='describe_db_clusters',
             operation_parameters={},
             format_function=format_function,
@@ -234,19 +281,13 @@ class TestHandlePaginatedAwsApiCall:
 
     def test_handle_paginated_aws_api_call_empty_result(self):
         """Test handling empty result."""
-        mock_client = MagicMock()
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-
-        # Mock empty page iterator
-        mock_page_iterator = [{'DBClusters': []}]
-        mock_paginator.paginate.return_value = mock_page_iterator
+        client = _StubClient(_PAGES_EMPTY)
 
         def format_function(item):
             return {'cluster_id': item['DBClusterIdentifier']}
 
         result = handle_paginated_aws_api_call(
-            client=mock_client,
+            client=client,
             paginator_name='describe_db_clusters',
             operation_parameters={},
             format_function=format_function,
@@ -254,3 +295,74 @@ class TestHandlePaginatedAwsApiCall:
         )
 
         assert len(result) == 0
+
+    def test_handle_paginated_aws_api_call_preserves_page_order(self):
+        """Test pages are formatted in the order they are returned."""
+        client = _StubClient(
+            {'DBClusters': ({'DBClusterIdentifier': f'cluster-{i}'},)} for i in range(5)
+        )
+
+        result = handle_paginated_aws_api_call(
+            client=client,
+            paginator_name='describe_db_clusters',
+            operation_parameters={},
+            format_function=lambda item: item['DBClusterIdentifier'],
+            result_key='DBClusters',
+        )
+
+        assert result == [f'cluster-{i}' for i in range(5)]
+
+    def test_handle_paginated_aws_api_call_propagates_page_errors(self):
+        """Test an error fetching a page is raised to the caller."""
+
+        def pages():
+            yield {'DBClusters': [{'DBClusterIdentifier': 'cluster-1'}]}
+            raise RuntimeError('page fetch failed')
+
+        client = _StubClient(pages())
+
+        with pytest.raises(RuntimeError, match='page fetch failed'):
+            handle_paginated_aws_api_call(
+                client=client,
+                paginator_name='describe_db_clusters',
+                operation_parameters={},
+                format_function=lambda item: item,
+                result_key='DBClusters',
+            )
+
+
+class TestSelectOptionalParams:
+    """Test cases for select_optional_params function."""
+
+    def test_select_optional_params(self):
+        """Test falsy values are kept only where the spec allows it."""
+        spec = (
+            ('DatabaseName', False),
+            ('BackupRetentionPeriod', True),
+            ('EngineVersion', False),
+            ('Port', True),
+        )
+
+        result = select_optional_params(spec, ('', 0, None, None))
+
+        assert result == {'BackupRetentionPeriod': 0}
+
+
+class TestValidateDbIdentifier:
+    """Test cases for validate_db_identifier function."""
+
+    def test_valid_identifiers(self):
+        """Test identifiers that follow the RDS naming rules."""
+        assert validate_db_identifier('a')
+        assert validate_db_identifier('test-cluster-1')
+        assert validate_db_identifier('A' * 63)
+
+    def test_invalid_identifiers(self):
+        """Test identifiers that break the RDS naming rules."""
+        assert not validate_db_identifier('')
+        assert not validate_db_identifier('1cluster')
+        assert not validate_db_identifier('test--cluster')
+        assert not validate_db_identifier('test-cluster-')
+        assert not validate_db_identifier('test_cluster')
+        assert not validate_db_identifier('test-cluster\n')
+        assert not validate_db_identifier('A' * 64)
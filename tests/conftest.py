@@ -14,30 +14,39 @@
 
 """Global pytest fixtures for Amazon RDS Management MCP Server tests."""
 
-import os
+import asyncio
 import pytest
+import time
+from awslabs.rds_management_mcp_server.common.cache import describe_cache
 from awslabs.rds_management_mcp_server.common.connection import RDSConnectionManager
 from awslabs.rds_management_mcp_server.common.context import RDSContext
+from awslabs.rds_management_mcp_server.common.decorators import require_confirmation
+from mcp.server.fastmcp import Context
+from mypy_boto3_rds.client import RDSClient
+from pytest_asyncio import is_async_test
 from unittest.mock import MagicMock, patch
 
 
+def pytest_collection_modifyitems(items):
+    """Run async tests on one session-wide event loop unless they pick their own loop scope."""
+    session_loop = pytest.mark.asyncio(loop_scope='session')
+    for item in items:
+        if not is_async_test(item):
+            continue
+        if any('loop_scope' in marker.kwargs for marker in item.iter_markers('asyncio')):
+            continue
+        item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope='session', autouse=True)
 def tests_setup_and_teardown():
     """Mock environment and module variables for testing."""
-    # Will be executed before the first test
-    old_environ = dict(os.environ)
-    os.environ.update(
-        {
-            'AWS_DEFAULT_REGION': 'us-east-1',  # pragma: allowlist secret
-            'AWS_ACCESS_KEY_ID': 'mock_access_key',  # pragma: allowlist secret
-            'AWS_SECRET_ACCESS_KEY': 'mock_secret_key',  # pragma: allowlist secret
-        }
-    )
-
-    yield
-    # Will be executed after the last test
-    os.environ.clear()
-    os.environ.update(old_environ)
+    # only the variables set here are restored after the last test
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('AWS_DEFAULT_REGION', 'us-east-1')  # pragma: allowlist secret
+        mp.setenv('AWS_ACCESS_KEY_ID', 'mock_access_key')  # pragma: allowlist secret
+        mp.setenv('AWS_SECRET_ACCESS_KEY', 'mock_secret_key')  # pragma: allowlist secret
+        yield
 
 
 @pytest.fixture
@@ -49,9 +58,9 @@ def mock_rds_client():
     """
     RDSConnectionManager._client = None
 
-    mock_client = MagicMock()
+    mock_client = MagicMock(spec=RDSClient)
 
-    with patch.object(RDSConnectionManager, 'get_connection', return_value=mock_client) as _:
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=mock_client):
         yield mock_client
 
     RDSConnectionManager._client = None
@@ -72,10 +81,19 @@ def mock_rds_context_readonly():
 
 
 @pytest.fixture
-def mock_asyncio_thread():
-    """Mock asyncio.to_thread for testing async operations."""
-    with patch('asyncio.to_thread') as mock:
-        yield mock
+def mock_asyncio_thread(monkeypatch):
+    """Mock asyncio.to_thread with a mock that runs the call inline.
+
+    Tests can still inspect the recorded calls or replace the side effect.
+    """
+
+    async def run_inline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    # the side effect is a coroutine function, so calling the mock already yields an awaitable
+    mock = MagicMock(side_effect=run_inline)
+    monkeypatch.setattr(asyncio, 'to_thread', mock)
+    return mock
 
 
 @pytest.fixture
@@ -226,5 +244,41 @@ def sample_snapshot():
 @pytest.fixture
 def context():
     """Create a mock context for MCP tools."""
-    mock_ctx = MagicMock()
+    mock_ctx = MagicMock(spec=Context)
     return mock_ctx
+
+
+@pytest.fixture(autouse=True)
+def reset_describe_cache():
+    """Start every test with caching disabled and an empty describe cache."""
+    RDSContext._cache_ttl = 0.0
+    describe_cache.clear()
+    yield
+    describe_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def pending_operations(monkeypatch):
+    """Give every test its own empty store of pending confirmation tokens."""
+    operations = {}
+    monkeypatch.setattr(require_confirmation, '_pending_operations', operations)
+    return operations
+
+
+@pytest.fixture
+def issue_confirmation_token(pending_operations):
+    """Return a helper that plants a valid confirmation token for an operation.
+
+    Tests of the confirmed branch use it instead of calling the tool once just to get a token.
+    """
+
+    def issue(operation_type, **params):
+        token = f'test-token-{len(pending_operations)}'
+        pending_operations[token] = (
+            operation_type,
+            params,
+            time.monotonic() + require_confirmation.EXPIRATION_TIME,
+        )
+        return token
+
+    return issue
@@ -15,6 +15,9 @@
 """Tests for describe_cluster_backups resource."""
 
 import pytest
+import threading
+import time
+from awslabs.rds_management_mcp_server.common.constants import MAX_CONCURRENT_DESCRIBE_CALLS
 from awslabs.rds_management_mcp_server.resources.db_cluster.describe_all_cluster_backups import (
     describe_all_cluster_backups,
 )
@@ -25,6 +28,7 @@ from awslabs.rds_management_mcp_server.resources.db_cluster.describe_cluster_bac
     describe_cluster_backups,
 )
 from datetime import datetime, timezone
+from mypy_boto3_rds.client import RDSClient
 from unittest.mock import MagicMock, patch
 
 
@@ -34,7 +38,7 @@ def mock_rds_client():
     with patch(
         'awslabs.rds_management_mcp_server.common.connection.RDSConnectionManager.get_connection'
     ) as mock_get_connection:
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec=RDSClient)
         mock_get_connection.return_value = mock_client
         yield mock_client
 
@@ -93,7 +97,6 @@ def sample_snapshot():
 class TestDescribeClusterBackups:
     """Test describe_cluster_backups function."""
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_backups_success(
         self, mock_rds_client, sample_automated_backup, sample_snapshot
     ):
@@ -137,7 +140,6 @@ class TestDescribeClusterBackups:
         assert snapshot.vpc_id == 'vpc-12345678'
         assert snapshot.tags == {'Environment': 'Test'}
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_backups_no_backups(self, mock_rds_client):
         """Test cluster backups with no backups found."""
         mock_rds_client.describe_db_cluster_automated_backups.return_value = {
@@ -151,7 +153,6 @@ class TestDescribeClusterBackups:
         assert len(result.automated_backups) == 0
         assert len(result.snapshots) == 0
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_backups_handles_exception(self, mock_rds_client):
         """Test error handling in describe_cluster_backups."""
         # One succeeds, one fails - should still return partial results
@@ -167,11 +168,27 @@ class TestDescribeClusterBackups:
         assert len(result.automated_backups) == 0
         assert len(result.snapshots) == 0
 
+    async def test_describe_cluster_backups_runs_off_event_loop(self, mock_rds_client):
+        """Test the RDS calls do not run on the event loop thread."""
+        loop_thread = threading.get_ident()
+        call_threads = []
+
+        def record_thread(**kwargs):
+            call_threads.append(threading.get_ident())
+            return {}
+
+        mock_rds_client.describe_db_cluster_automated_backups.side_effect = record_thread
+        mock_rds_client.describe_db_cluster_snapshots.side_effect = record_thread
+
+        await describe_cluster_backups('test-cluster')
+
+        assert len(call_threads) == 2
+        assert loop_thread not in call_threads
+
 
 class TestDescribeAllClusterBackups:
     """Test describe_all_cluster_backups function."""
 
-    @pytest.mark.asyncio
     async def test_describe_all_cluster_backups_success(
         self, mock_rds_client, sample_automated_backup, sample_snapshot
     ):
@@ -215,7 +232,6 @@ class TestDescribeAllClusterBackups:
         assert 'test-snapshot' in snapshot_ids
         assert 'test-snapshot-2' in snapshot_ids
 
-    @pytest.mark.asyncio
     async def test_describe_all_cluster_backups_no_clusters(self, mock_rds_client):
         """Test all cluster backups with no clusters."""
         mock_rds_client.describe_db_clusters.return_value = {'DBClusters': []}
@@ -226,7 +242,6 @@ class TestDescribeAllClusterBackups:
         assert len(result.automated_backups) == 0
         assert len(result.snapshots) == 0
 
-    @pytest.mark.asyncio
     async def test_describe_all_cluster_backups_handles_errors(
         self, mock_rds_client, sample_snapshot
     ):
@@ -258,6 +273,120 @@ class TestDescribeAllClusterBackups:
         assert len(result.snapshots) == 1
         assert result.snapshots[0].snapshot_id == 'test-snapshot'
 
+    async def test_describe_all_cluster_backups_lists_automated_backups_once(
+        self, mock_rds_client, sample_automated_backup
+    ):
+        """Test automated backups are fetched once and snapshots once per cluster."""
+        mock_rds_client.describe_db_clusters.return_value = {
+            'DBClusters': [{'DBClusterIdentifier': f'cluster-{i}'} for i in range(5)]
+        }
+        mock_rds_client.describe_db_cluster_automated_backups.return_value = {
+            'DBClusterAutomatedBackups': [sample_automated_backup]
+        }
+        mock_rds_client.describe_db_cluster_snapshots.return_value = {'DBClusterSnapshots': []}
+
+        result = await describe_all_cluster_backups()
+
+        # the sample backup belongs to a cluster that is not in the list
+        assert result.count == 0
+        mock_rds_client.describe_db_cluster_automated_backups.assert_called_once_with()
+        assert mock_rds_client.describe_db_cluster_snapshots.call_count == 5
+
+    async def test_describe_all_cluster_backups_groups_by_cluster(
+        self, mock_rds_client, sample_automated_backup
+    ):
+        """Test automated backups are kept only for listed clusters, in cluster order."""
+        mock_rds_client.describe_db_clusters.return_value = {
+            'DBClusters': [
+                {'DBClusterIdentifier': 'test-cluster-2'},
+                {'DBClusterIdentifier': 'test-cluster'},
+            ]
+        }
+        backup2 = {**sample_automated_backup, 'DBClusterIdentifier': 'test-cluster-2'}
+        orphan = {**sample_automated_backup, 'DBClusterIdentifier': 'deleted-cluster'}
+        mock_rds_client.describe_db_cluster_automated_backups.return_value = {
+            'DBClusterAutomatedBackups': [sample_automated_backup, orphan, backup2]
+        }
+        mock_rds_client.describe_db_cluster_snapshots.return_value = {'DBClusterSnapshots': []}
+
+        result = await describe_all_cluster_backups()
+
+        assert result.count == 2
+        assert [b.cluster_id for b in result.automated_backups] == [
+            'test-cluster-2',
+            'test-cluster',
+        ]
+
+    async def test_describe_all_cluster_backups_one_snapshot_call_fails(
+        self, mock_rds_client, sample_snapshot
+    ):
+        """Test a failing snapshot call drops only that cluster's snapshots."""
+        mock_rds_client.describe_db_clusters.return_value = {
+            'DBClusters': [{'DBClusterIdentifier': f'cluster-{i}'} for i in range(3)]
+        }
+        mock_rds_client.describe_db_cluster_automated_backups.return_value = {
+            'DBClusterAutomatedBackups': []
+        }
+
+        def describe_snapshots(DBClusterIdentifier):
+            if DBClusterIdentifier == 'cluster-1':
+                raise Exception('Snapshot error')
+            return {
+                'DBClusterSnapshots': [
+                    {
+                        **sample_snapshot,
+                        'DBClusterIdentifier': DBClusterIdentifier,
+                        'DBClusterSnapshotIdentifier': f'{DBClusterIdentifier}-snapshot',
+                    }
+                ]
+            }
+
+        mock_rds_client.describe_db_cluster_snapshots.side_effect = describe_snapshots
+
+        result = await describe_all_cluster_backups()
+
+        assert result.count == 2
+        assert [s.snapshot_id for s in result.snapshots] == [
+            'cluster-0-snapshot',
+            'cluster-2-snapshot',
+        ]
+        assert mock_rds_client.describe_db_cluster_snapshots.call_count == 3
+
+    async def test_describe_all_cluster_backups_limits_concurrent_calls(self, mock_rds_client):
+        """Test no more than MAX_CONCURRENT_DESCRIBE_CALLS snapshot calls are in flight."""
+        mock_rds_client.describe_db_clusters.return_value = {
+            'DBClusters': [
+                {'DBClusterIdentifier': f'cluster-{i}'}
+                for i in range(3 * MAX_CONCURRENT_DESCRIBE_CALLS)
+            ]
+        }
+        mock_rds_client.describe_db_cluster_automated_backups.return_value = {
+            'DBClusterAutomatedBackups': []
+        }
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def describe_snapshots(DBClusterIdentifier):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return {'DBClusterSnapshots': []}
+
+        mock_rds_client.describe_db_cluster_snapshots.side_effect = describe_snapshots
+
+        await describe_all_cluster_backups()
+
+        assert (
+            mock_rds_client.describe_db_cluster_snapshots.call_count
+            == 3 * MAX_CONCURRENT_DESCRIBE_CALLS
+        )
+        assert 1 < max_in_flight <= MAX_CONCURRENT_DESCRIBE_CALLS
+
 
 class TestBackupModels:
     """Test backup-related models."""
@@ -14,7 +14,6 @@
 
 """Tests for describe_cluster_detail resource."""
 
-import pytest
 from awslabs.rds_management_mcp_server.resources.db_cluster.describe_cluster_detail import (
     describe_cluster_detail,
 )
@@ -24,7 +23,6 @@ from botocore.exceptions import ClientError
 class TestDescribeClusterDetail:
     """Test cases for describe_cluster_detail resource."""
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_detail_success(self, mock_rds_client, sample_db_cluster):
         """Test successful cluster detail retrieval."""
         mock_rds_client.describe_db_clusters.return_value = {'DBClusters': [sample_db_cluster]}
@@ -52,7 +50,6 @@ class TestDescribeClusterDetail:
             DBClusterIdentifier='test-cluster'
         )
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_detail_not_found(self, mock_rds_client):
         """Test cluster detail retrieval with cluster not found."""
         mock_rds_client.describe_db_clusters.side_effect = ClientError(
@@ -67,7 +64,6 @@ class TestDescribeClusterDetail:
         assert 'error' in result
         assert result['error_code'] == 'DBClusterNotFoundFault'
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_detail_empty_cluster_id(self, mock_rds_client):
         """Test cluster detail retrieval with empty cluster ID."""
         cluster_id = ''
@@ -78,7 +74,6 @@ class TestDescribeClusterDetail:
         assert result['error_type'] == 'ValueError'
         assert 'Cluster identifier cannot be empty' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_detail_empty_response(self, mock_rds_client):
         """Test cluster detail retrieval with empty response."""
         mock_rds_client.describe_db_clusters.return_value = {'DBClusters': []}
@@ -91,7 +86,6 @@ class TestDescribeClusterDetail:
         assert result['error_type'] == 'ValueError'
         assert 'not found' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_detail_minimal_cluster(self, mock_rds_client):
         """Test cluster detail retrieval with minimal cluster data."""
         minimal_cluster = {
@@ -120,7 +114,6 @@ class TestDescribeClusterDetail:
         assert result.members == []
         assert result.vpc_security_groups == []
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_detail_with_tags(self, mock_rds_client):
         """Test cluster detail retrieval with tags."""
         cluster_with_tags = {
@@ -146,7 +139,6 @@ class TestDescribeClusterDetail:
         assert result.tags['Environment'] == 'Production'
         assert result.tags['Team'] == 'DataEngineering'
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_detail_exception_handling(self, mock_rds_client):
         """Test cluster detail retrieval with general exception."""
         mock_rds_client.describe_db_clusters.side_effect = Exception('General error')
@@ -159,7 +151,6 @@ class TestDescribeClusterDetail:
         assert result['error_type'] == 'Exception'
         assert 'General error' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_cluster_model_attributes(self, mock_rds_client, sample_db_cluster):
         """Test that ClusterModel attributes are accessible."""
         mock_rds_client.describe_db_clusters.return_value = {'DBClusters': [sample_db_cluster]}
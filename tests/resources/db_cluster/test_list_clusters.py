@@ -14,7 +14,6 @@
 
 """Tests for list_clusters resource."""
 
-import pytest
 from awslabs.rds_management_mcp_server.resources.db_cluster.list_clusters import (
     ClusterSummary,
     list_clusters,
@@ -27,7 +26,6 @@ from unittest.mock import MagicMock
 class TestListClusters:
     """Test list_clusters function."""
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_rds_client):
         """Test successful cluster list retrieval."""
         mock_paginator = MagicMock()
@@ -58,7 +56,6 @@ class TestListClusters:
         assert result.clusters[0].cluster_id == 'test-cluster-1'
         assert result.clusters[1].cluster_id == 'test-cluster-2'
 
-    @pytest.mark.asyncio
     async def test_empty_response(self, mock_rds_client):
         """Test handling of empty cluster response."""
         mock_paginator = MagicMock()
@@ -70,7 +67,6 @@ class TestListClusters:
         assert result.count == 0
         assert len(result.clusters) == 0
 
-    @pytest.mark.asyncio
     async def test_calls_api_with_correct_parameters(self, mock_rds_client):
         """Test API is called with correct parameters."""
         mock_paginator = MagicMock()
@@ -82,7 +78,6 @@ class TestListClusters:
         mock_rds_client.get_paginator.assert_called_once_with('describe_db_clusters')
         mock_paginator.paginate.assert_called_once_with(PaginationConfig={'MaxItems': 100})
 
-    @pytest.mark.asyncio
     async def test_client_error(self, mock_rds_client):
         """Test error propagation from RDS client."""
         error_response = {
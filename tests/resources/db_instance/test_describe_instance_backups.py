@@ -15,6 +15,9 @@
 """Tests for describe_instance_backups resource."""
 
 import pytest
+import threading
+import time
+from awslabs.rds_management_mcp_server.common.constants import MAX_CONCURRENT_DESCRIBE_CALLS
 from awslabs.rds_management_mcp_server.resources.db_instance.describe_all_instance_backups import (
     describe_all_instance_backups,
 )
@@ -25,6 +28,7 @@ from awslabs.rds_management_mcp_server.resources.db_instance.describe_instance_b
     describe_instance_backups,
 )
 from datetime import datetime, timezone
+from mypy_boto3_rds.client import RDSClient
 from unittest.mock import MagicMock, patch
 
 
@@ -34,7 +38,7 @@ def mock_rds_client():
     with patch(
         'awslabs.rds_management_mcp_server.common.connection.RDSConnectionManager.get_connection'
     ) as mock_get_connection:
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec=RDSClient)
         mock_get_connection.return_value = mock_client
         yield mock_client
 
@@ -98,7 +102,6 @@ def sample_snapshot():
 class TestDescribeInstanceBackups:
     """Test describe_instance_backups function."""
 
-    @pytest.mark.asyncio
     async def test_describe_instance_backups_success(
         self, mock_rds_client, sample_automated_backup, sample_snapshot
     ):
@@ -139,7 +142,6 @@ class TestDescribeInstanceBackups:
         assert snapshot.vpc_id == 'vpc-12345678'
         assert snapshot.tags == {'Environment': 'Test'}
 
-    @pytest.mark.asyncio
     async def test_describe_instance_backups_no_backups(self, mock_rds_client):
         """Test instance backups with no backups found."""
         mock_rds_client.describe_db_instance_automated_backups.return_value = {
@@ -153,7 +155,6 @@ class TestDescribeInstanceBackups:
         assert len(result.automated_backups) == 0
         assert len(result.snapshots) == 0
 
-    @pytest.mark.asyncio
     async def test_describe_instance_backups_handles_exception(self, mock_rds_client):
         """Test error handling in describe_instance_backups."""
         # One succeeds, one fails - should still return partial results
@@ -169,7 +170,6 @@ class TestDescribeInstanceBackups:
         assert len(result.automated_backups) == 0
         assert len(result.snapshots) == 0
 
-    @pytest.mark.asyncio
     async def test_describe_instance_backups_multiple_backups(
         self, mock_rds_client, sample_automated_backup, sample_snapshot
     ):
@@ -201,7 +201,6 @@ class TestDescribeInstanceBackups:
 class TestDescribeAllInstanceBackups:
     """Test describe_all_instance_backups function."""
 
-    @pytest.mark.asyncio
     async def test_describe_all_instance_backups_success(
         self, mock_rds_client, sample_automated_backup, sample_snapshot
     ):
@@ -252,7 +251,6 @@ class TestDescribeAllInstanceBackups:
         assert 'test-snapshot' in snapshot_ids
         assert 'test-snapshot-2' in snapshot_ids
 
-    @pytest.mark.asyncio
     async def test_describe_all_instance_backups_no_instances(self, mock_rds_client):
         """Test all instance backups with no instances."""
         mock_rds_client.describe_db_instances.return_value = {'DBInstances': []}
@@ -263,7 +261,6 @@ class TestDescribeAllInstanceBackups:
         assert len(result.automated_backups) == 0
         assert len(result.snapshots) == 0
 
-    @pytest.mark.asyncio
     async def test_describe_all_instance_backups_handles_errors(
         self, mock_rds_client, sample_snapshot
     ):
@@ -295,6 +292,100 @@ class TestDescribeAllInstanceBackups:
         assert len(result.snapshots) == 1
         assert result.snapshots[0].snapshot_id == 'test-snapshot'
 
+    async def test_describe_all_instance_backups_groups_by_instance(
+        self, mock_rds_client, sample_automated_backup
+    ):
+        """Test automated backups are kept only for listed instances, in instance order."""
+        mock_rds_client.describe_db_instances.return_value = {
+            'DBInstances': [
+                {'DBInstanceIdentifier': 'test-instance-2'},
+                {'DBInstanceIdentifier': 'test-instance'},
+            ]
+        }
+        backup2 = {**sample_automated_backup, 'DBInstanceIdentifier': 'test-instance-2'}
+        orphan = {**sample_automated_backup, 'DBInstanceIdentifier': 'deleted-instance'}
+        mock_rds_client.describe_db_instance_automated_backups.return_value = {
+            'DBInstanceAutomatedBackups': [sample_automated_backup, orphan, backup2]
+        }
+        mock_rds_client.describe_db_snapshots.return_value = {'DBSnapshots': []}
+
+        result = await describe_all_instance_backups()
+
+        assert result.count == 2
+        assert [b.instance_id for b in result.automated_backups] == [
+            'test-instance-2',
+            'test-instance',
+        ]
+
+    async def test_describe_all_instance_backups_one_snapshot_call_fails(
+        self, mock_rds_client, sample_snapshot
+    ):
+        """Test a failing snapshot call drops only that instance's snapshots."""
+        mock_rds_client.describe_db_instances.return_value = {
+            'DBInstances': [{'DBInstanceIdentifier': f'instance-{i}'} for i in range(3)]
+        }
+        mock_rds_client.describe_db_instance_automated_backups.return_value = {
+            'DBInstanceAutomatedBackups': []
+        }
+
+        def describe_snapshots(DBInstanceIdentifier):
+            if DBInstanceIdentifier == 'instance-1':
+                raise Exception('Snapshot error')
+            return {
+                'DBSnapshots': [
+                    {
+                        **sample_snapshot,
+                        'DBInstanceIdentifier': DBInstanceIdentifier,
+                        'DBSnapshotIdentifier': f'{DBInstanceIdentifier}-snapshot',
+                    }
+                ]
+            }
+
+        mock_rds_client.describe_db_snapshots.side_effect = describe_snapshots
+
+        result = await describe_all_instance_backups()
+
+        assert result.count == 2
+        assert [s.snapshot_id for s in result.snapshots] == [
+            'instance-0-snapshot',
+            'instance-2-snapshot',
+        ]
+        assert mock_rds_client.describe_db_snapshots.call_count == 3
+
+    async def test_describe_all_instance_backups_limits_concurrent_calls(self, mock_rds_client):
+        """Test no more than MAX_CONCURRENT_DESCRIBE_CALLS snapshot calls are in flight."""
+        mock_rds_client.describe_db_instances.return_value = {
+            'DBInstances': [
+                {'DBInstanceIdentifier': f'instance-{i}'}
+                for i in range(3 * MAX_CONCURRENT_DESCRIBE_CALLS)
+            ]
+        }
+        mock_rds_client.describe_db_instance_automated_backups.return_value = {
+            'DBInstanceAutomatedBackups': []
+        }
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def describe_snapshots(DBInstanceIdentifier):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return {'DBSnapshots': []}
+
+        mock_rds_client.describe_db_snapshots.side_effect = describe_snapshots
+
+        await describe_all_instance_backups()
+
+        assert (
+            mock_rds_client.describe_db_snapshots.call_count == 3 * MAX_CONCURRENT_DESCRIBE_CALLS
+        )
+        assert 1 < max_in_flight <= MAX_CONCURRENT_DESCRIBE_CALLS
+
 
 class TestBackupModels:
     """Test backup-related models."""
@@ -14,7 +14,6 @@
 
 """Tests for describe_instance_detail resource."""
 
-import pytest
 from awslabs.rds_management_mcp_server.resources.db_instance.describe_instance_detail import (
     Instance,
     describe_instance_detail,
@@ -24,7 +23,6 @@ from awslabs.rds_management_mcp_server.resources.db_instance.describe_instance_d
 class TestDescribeInstanceDetail:
     """Test cases for describe_instance_detail resource."""
 
-    @pytest.mark.asyncio
     async def test_describe_instance_detail_success(self, mock_rds_client, sample_db_instance):
         """Test successful instance detail retrieval."""
         mock_rds_client.describe_db_instances.return_value = {'DBInstances': [sample_db_instance]}
@@ -53,7 +51,6 @@ class TestDescribeInstanceDetail:
             DBInstanceIdentifier='test-instance'
         )
 
-    @pytest.mark.asyncio
     async def test_describe_instance_detail_not_found(self, mock_rds_client):
         """Test instance detail retrieval with instance not found."""
         mock_rds_client.describe_db_instances.return_value = {'DBInstances': []}
@@ -64,7 +61,6 @@ class TestDescribeInstanceDetail:
         assert 'error' in result
         assert 'not found' in result['error'].lower()
 
-    @pytest.mark.asyncio
     async def test_describe_instance_detail_empty_response(self, mock_rds_client):
         """Test instance detail retrieval with empty response."""
         mock_rds_client.describe_db_instances.return_value = {'DBInstances': []}
@@ -75,7 +71,6 @@ class TestDescribeInstanceDetail:
         assert 'error' in result
         assert 'not found' in result['error'].lower()
 
-    @pytest.mark.asyncio
     async def test_describe_instance_detail_minimal_instance(self, mock_rds_client):
         """Test instance detail retrieval with minimal instance data."""
         minimal_instance = {
@@ -107,7 +102,6 @@ class TestDescribeInstanceDetail:
         assert result.publicly_accessible is False
         assert result.vpc_security_groups == []
 
-    @pytest.mark.asyncio
     async def test_describe_instance_detail_with_tags(self, mock_rds_client):
         """Test instance detail retrieval with tags."""
         instance_with_tags = {
@@ -133,7 +127,6 @@ class TestDescribeInstanceDetail:
         assert result.tags['Environment'] == 'Production'
         assert result.tags['Team'] == 'DataEngineering'
 
-    @pytest.mark.asyncio
     async def test_describe_instance_detail_exception_handling(self, mock_rds_client):
         """Test instance detail retrieval with general exception."""
         mock_rds_client.describe_db_instances.side_effect = Exception('General error')
@@ -144,7 +137,6 @@ class TestDescribeInstanceDetail:
         assert 'error' in result
         assert 'general error' in result['error'].lower()
 
-    @pytest.mark.asyncio
     async def test_describe_instance_detail_with_read_replicas(self, mock_rds_client):
         """Test instance detail retrieval with read replicas."""
         instance_with_replicas = {
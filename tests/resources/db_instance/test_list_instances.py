@@ -1,6 +1,5 @@
 """Tests for list_instances resource."""
 
-import pytest
 from awslabs.rds_management_mcp_server.resources.db_instance.list_instances import list_instances
 from unittest.mock import MagicMock
 
@@ -8,10 +7,7 @@ from unittest.mock import MagicMock
 class TestListInstances:
     """Test cases for list_instances function."""
 
-    @pytest.mark.asyncio
-    async def test_list_instances_success(
-        self, mock_rds_client, mock_asyncio_thread, sample_db_instance
-    ):
+    async def test_list_instances_success(self, mock_rds_client, sample_db_instance):
         """Test successful listing of instances."""
         # Mock the paginator
         mock_paginator = MagicMock()
@@ -26,10 +22,7 @@ class TestListInstances:
         assert result.instances[0].status == 'available'
         assert result.instances[0].engine == 'mysql'
 
-    @pytest.mark.asyncio
-    async def test_list_instances_multiple(
-        self, mock_rds_client, mock_asyncio_thread, sample_db_instance
-    ):
+    async def test_list_instances_multiple(self, mock_rds_client, sample_db_instance):
         """Test listing multiple instances."""
         instance2 = sample_db_instance.copy()
         instance2['DBInstanceIdentifier'] = 'test-db-instance-2'
@@ -46,8 +39,7 @@ class TestListInstances:
         assert result.instances[0].instance_id == 'test-db-instance'
         assert result.instances[1].instance_id == 'test-db-instance-2'
 
-    @pytest.mark.asyncio
-    async def test_list_instances_empty(self, mock_rds_client, mock_asyncio_thread):
+    async def test_list_instances_empty(self, mock_rds_client):
         """Test listing when no instances exist."""
         # Mock the paginator
         mock_paginator = MagicMock()
@@ -59,8 +51,7 @@ class TestListInstances:
         assert len(result.instances) == 0
         assert result.count == 0
 
-    @pytest.mark.asyncio
-    async def test_list_instances_error(self, mock_rds_client, mock_asyncio_thread):
+    async def test_list_instances_error(self, mock_rds_client):
         """Test error handling in list instances."""
         mock_rds_client.get_paginator.side_effect = Exception('Test error')
 
@@ -70,10 +61,7 @@ class TestListInstances:
         assert isinstance(result, dict) and 'error' in result
         assert 'Test error' in result['error']
 
-    @pytest.mark.asyncio
-    async def test_list_instances_with_tags(
-        self, mock_rds_client, mock_asyncio_thread, sample_db_instance
-    ):
+    async def test_list_instances_with_tags(self, mock_rds_client, sample_db_instance):
         """Test listing instances includes tags."""
         # Mock the paginator
         mock_paginator = MagicMock()
@@ -1,6 +1,5 @@
 """Tests for describe_parameters resource."""
 
-import pytest
 from awslabs.rds_management_mcp_server.resources.parameter_groups.describe_parameters import (
     describe_cluster_parameters,
     describe_instance_parameters,
@@ -10,7 +9,6 @@ from awslabs.rds_management_mcp_server.resources.parameter_groups.describe_param
 class TestDescribeParameters:
     """Test cases for describe parameter functions."""
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_parameters_success(self, mock_rds_client, mock_asyncio_thread):
         """Test successful description of cluster parameters."""
         mock_rds_client.describe_db_cluster_parameters.return_value = {
@@ -40,11 +38,6 @@ class TestDescribeParameters:
             'Marker': None,
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_cluster_parameters('test-cluster-parameter-group')
 
         assert result.parameter_group_name == 'test-cluster-parameter-group'
@@ -60,7 +53,6 @@ class TestDescribeParameters:
         assert len(custom_params) == 1
         assert custom_params[0].name == 'max_connections'
 
-    @pytest.mark.asyncio
     async def test_describe_instance_parameters_success(
         self, mock_rds_client, mock_asyncio_thread
     ):
@@ -81,11 +73,6 @@ class TestDescribeParameters:
             'Marker': None,
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_instance_parameters('test-parameter-group')
 
         assert result.parameter_group_name == 'test-parameter-group'
@@ -95,7 +82,6 @@ class TestDescribeParameters:
         assert result.parameters[0].name == 'innodb_buffer_pool_size'
         assert result.parameters[0].source == 'engine-default'
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_parameters_empty(self, mock_rds_client, mock_asyncio_thread):
         """Test description when no parameters exist."""
         mock_rds_client.describe_db_cluster_parameters.return_value = {
@@ -103,33 +89,21 @@ class TestDescribeParameters:
             'Marker': None,
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_cluster_parameters('empty-parameter-group')
 
         assert result.parameter_group_name == 'empty-parameter-group'
         assert len(result.parameters) == 0
         assert result.count == 0
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_parameters_error(self, mock_rds_client, mock_asyncio_thread):
         """Test error handling in describe cluster parameters."""
         mock_rds_client.describe_db_cluster_parameters.side_effect = Exception('Test error')
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_cluster_parameters('test-parameter-group')
 
         assert isinstance(result, dict) and 'error' in result
         assert 'Test error' in result['error']
 
-    @pytest.mark.asyncio
     async def test_describe_parameters_with_pagination(self, mock_rds_client, mock_asyncio_thread):
         """Test parameter description with pagination."""
         # First call returns partial results with marker
@@ -152,11 +126,6 @@ class TestDescribeParameters:
             },
         ]
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_instance_parameters('test-parameter-group')
 
         # Should have called twice due to pagination
@@ -22,6 +22,7 @@ from awslabs.rds_management_mcp_server.resources.parameter_groups.list_parameter
     list_instance_parameter_groups,
 )
 from botocore.exceptions import ClientError
+from mypy_boto3_rds.client import RDSClient
 from unittest.mock import MagicMock, patch
 
 
@@ -31,7 +32,7 @@ def mock_rds_client():
     with patch(
         'awslabs.rds_management_mcp_server.common.connection.RDSConnectionManager.get_connection'
     ) as mock_get_connection:
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec=RDSClient)
         mock_get_connection.return_value = mock_client
 
         # Mock both asyncio.to_thread and asyncio.wait_for to handle the async operations
@@ -55,7 +56,6 @@ def mock_rds_client():
 class TestListClusterParameterGroups:
     """Test list_cluster_parameter_groups function."""
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_rds_client):
         """Test successful cluster parameter groups list retrieval."""
         # Mock describe_db_cluster_parameter_groups with no pagination
@@ -104,7 +104,6 @@ class TestListClusterParameterGroups:
         assert result.parameter_groups[0].tags == {'Environment': 'Test'}
         assert result.parameter_groups[1].name == 'test-cluster-param-group-2'
 
-    @pytest.mark.asyncio
     async def test_empty_response(self, mock_rds_client):
         """Test handling of empty cluster parameter groups response."""
         mock_rds_client.describe_db_cluster_parameter_groups.return_value = {
@@ -116,7 +115,6 @@ class TestListClusterParameterGroups:
         assert result.count == 0
         assert len(result.parameter_groups) == 0
 
-    @pytest.mark.asyncio
     async def test_pagination(self, mock_rds_client):
         """Test handling of paginated responses."""
         # First call returns with marker
@@ -155,7 +153,6 @@ class TestListClusterParameterGroups:
         mock_rds_client.describe_db_cluster_parameter_groups.assert_any_call()
         mock_rds_client.describe_db_cluster_parameter_groups.assert_any_call(Marker='next-page')
 
-    @pytest.mark.asyncio
     async def test_error_handling(self, mock_rds_client):
         """Test error handling when API call fails."""
         mock_rds_client.describe_db_cluster_parameter_groups.side_effect = ClientError(
@@ -169,7 +166,6 @@ class TestListClusterParameterGroups:
         assert 'error' in result
         assert result['error_code'] == 'SomeError'
 
-    @pytest.mark.asyncio
     async def test_parameter_error_handling(self, mock_rds_client):
         """Test graceful handling when parameter description fails."""
         mock_rds_client.describe_db_cluster_parameter_groups.return_value = {
@@ -195,7 +191,6 @@ class TestListClusterParameterGroups:
         assert len(result.parameter_groups) == 1
         assert result.parameter_groups[0].parameters == []
 
-    @pytest.mark.asyncio
     async def test_timeout_handling(self, mock_rds_client):
         """Test handling of timeout during parameter group listing."""
         # Make the describe_db_cluster_parameter_groups timeout
@@ -211,7 +206,6 @@ class TestListClusterParameterGroups:
 class TestListInstanceParameterGroups:
     """Test list_instance_parameter_groups function."""
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_rds_client):
         """Test successful instance parameter groups list retrieval."""
         # Mock describe_db_parameter_groups with no pagination
@@ -260,7 +254,6 @@ class TestListInstanceParameterGroups:
         assert result.parameter_groups[0].tags == {'Owner': 'Team'}
         assert result.parameter_groups[1].name == 'test-instance-param-group-2'
 
-    @pytest.mark.asyncio
     async def test_empty_response(self, mock_rds_client):
         """Test handling of empty instance parameter groups response."""
         mock_rds_client.describe_db_parameter_groups.return_value = {'DBParameterGroups': []}
@@ -270,7 +263,6 @@ class TestListInstanceParameterGroups:
         assert result.count == 0
         assert len(result.parameter_groups) == 0
 
-    @pytest.mark.asyncio
     async def test_pagination(self, mock_rds_client):
         """Test handling of paginated responses."""
         # First call returns with marker
@@ -309,7 +301,6 @@ class TestListInstanceParameterGroups:
         mock_rds_client.describe_db_parameter_groups.assert_any_call()
         mock_rds_client.describe_db_parameter_groups.assert_any_call(Marker='next-page')
 
-    @pytest.mark.asyncio
     async def test_error_handling(self, mock_rds_client):
         """Test error handling when API call fails."""
         mock_rds_client.describe_db_parameter_groups.side_effect = ClientError(
@@ -323,7 +314,6 @@ class TestListInstanceParameterGroups:
         assert 'error' in result
         assert result['error_code'] == 'SomeError'
 
-    @pytest.mark.asyncio
     async def test_parameter_error_handling(self, mock_rds_client):
         """Test graceful handling when parameter description fails."""
         mock_rds_client.describe_db_parameter_groups.return_value = {
@@ -349,7 +339,6 @@ class TestListInstanceParameterGroups:
         assert len(result.parameter_groups) == 1
         assert result.parameter_groups[0].parameters == []
 
-    @pytest.mark.asyncio
     async def test_timeout_handling(self, mock_rds_client):
         """Test handling of timeout during parameter group listing."""
         # Make the describe_db_parameter_groups timeout
@@ -15,37 +15,63 @@
 """Tests for main module."""
 
 import pytest
+import sys
+from awslabs.rds_management_mcp_server.common.connection import (
+    BaseConnectionManager,
+    RDSConnectionManager,
+)
+from awslabs.rds_management_mcp_server.common.context import RDSContext
+from awslabs.rds_management_mcp_server.common.server import mcp
 from awslabs.rds_management_mcp_server.main import main
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 
 class TestMain:
     """Test cases for main function."""
 
-    @pytest.mark.asyncio
-    async def test_main_success(self):
-        """Test successful main function execution."""
-        with patch('awslabs.rds_management_mcp_server.main.mcp.run') as mock_run:
-            with patch('sys.argv', ['test']):
-                main()
+    @pytest.fixture(autouse=True)
+    def mock_run(self, monkeypatch):
+        """Keep main() from starting the server."""
+        mock = MagicMock()
+        monkeypatch.setattr(mcp, 'run', mock)
+        return mock
 
-            mock_run.assert_called_once()
+    @pytest.fixture(autouse=True)
+    def restore_server_state(self, monkeypatch):
+        """Undo the settings main() applies, so later tests see the defaults again."""
+        for name in ('_readonly', '_max_items', '_cache_ttl'):
+            monkeypatch.setattr(RDSContext, name, getattr(RDSContext, name))
+        for name in ('_profile_name', '_region_name'):
+            monkeypatch.setattr(BaseConnectionManager, name, getattr(BaseConnectionManager, name))
+        monkeypatch.setattr(mcp.settings, 'port', mcp.settings.port)
 
-    @pytest.mark.asyncio
-    async def test_main_with_args(self):
-        """Test main function with command line arguments."""
-        with patch('awslabs.rds_management_mcp_server.main.mcp.run') as mock_run:
-            with patch('sys.argv', ['test', '--readonly']):
-                main()
+    def test_main_exception_handling(self, mock_run, monkeypatch):
+        """Test main function exception handling."""
+        mock_run.side_effect = Exception('Test exception')
+        monkeypatch.setattr(sys, 'argv', ['test'])
 
-            mock_run.assert_called_once()
+        with pytest.raises(Exception, match='Test exception'):
+            main()
 
-    @pytest.mark.asyncio
-    async def test_main_exception_handling(self):
-        """Test main function exception handling."""
-        with patch('awslabs.rds_management_mcp_server.main.mcp.run') as mock_run:
-            mock_run.side_effect = Exception('Test exception')
+    def test_main_with_profile_and_region(self, monkeypatch):
+        """Test main function passes the AWS profile and region to the connection manager."""
+        mock_configure = MagicMock()
+        monkeypatch.setattr(RDSConnectionManager, 'configure', mock_configure)
+        monkeypatch.setattr(sys, 'argv', ['test', '--profile', 'prod', '--region', 'eu-west-1'])
+
+        main()
+
+        mock_configure.assert_called_once_with('prod', 'eu-west-1')
+
+    @pytest.mark.parametrize(
+        'argv,readonly',
+        [(['test'], True), (['test', '--readonly'], True), (['test', '--no-readonly'], False)],
+    )
+    def test_main_readonly_flag(self, mock_run, monkeypatch, argv, readonly):
+        """Test the server runs with the readonly flag parsed to a bool, defaulting to on."""
+        monkeypatch.setattr(sys, 'argv', argv)
+
+        main()
 
-            with patch('sys.argv', ['test']):
-                with pytest.raises(Exception, match='Test exception'):
-                    main()
+        mock_run.assert_called_once()
+        assert RDSContext.readonly_mode() is readonly
@@ -14,12 +14,12 @@
 
 """Tests for change_cluster_status tool."""
 
+import asyncio
 import pytest
-from awslabs.rds_management_mcp_server.common.decorators.require_confirmation import (
-    _pending_operations,
-)
+from awslabs.rds_management_mcp_server.common.decorators.readonly_check import ERROR_READONLY_MODE
 from awslabs.rds_management_mcp_server.tools.db_cluster.change_cluster_status import (
     status_db_cluster,
+    status_db_clusters,
 )
 from botocore.exceptions import ClientError
 
@@ -27,127 +27,54 @@ from botocore.exceptions import ClientError
 class TestChangeDBClusterStatus:
     """Test cases for change_db_cluster_status function."""
 
-    def setup_method(self):
-        """Clear pending operations before each test."""
-        _pending_operations.clear()
-
-    @pytest.mark.asyncio
-    async def test_stop_cluster_success(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+    @pytest.mark.parametrize(
+        'action,client_method,status,verb',
+        [
+            ('start', 'start_db_cluster', 'starting', 'started'),
+            ('stop', 'stop_db_cluster', 'stopping', 'stopped'),
+            ('reboot', 'reboot_db_cluster', 'rebooting', 'rebooted'),
+        ],
+    )
+    async def test_status_change_success(
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        action,
+        client_method,
+        status,
+        verb,
     ):
-        """Test successful cluster stop."""
-        mock_rds_client.stop_db_cluster.return_value = {
+        """Test each status action is confirmed and then applied to the cluster."""
+        getattr(mock_rds_client, client_method).return_value = {
             'DBCluster': {
                 'DBClusterIdentifier': 'test-cluster',
-                'Status': 'stopping',
+                'Status': status,
                 'Engine': 'aurora-mysql',
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         # First call without confirmation token
-        result = await status_db_cluster(db_cluster_identifier='test-cluster', action='stop')
+        result = await status_db_cluster(db_cluster_identifier='test-cluster', action=action)
 
         assert result['requires_confirmation'] is True
-        assert 'confirmation_token' in result
         assert 'WARNING' in result['warning']
-
-        # Second call with confirmation token
-        token = result['confirmation_token']
-        result = await status_db_cluster(
-            db_cluster_identifier='test-cluster', action='stop', confirmation_token=token
-        )
-
-        assert 'stopped successfully' in result['message'] or 'Successfully' in result['message']
-        assert result['formatted_cluster']['cluster_id'] == 'test-cluster'
-        assert result['formatted_cluster']['status'] == 'stopping'
-        assert result['formatted_cluster']['engine'] == 'aurora-mysql'
-        assert 'DBCluster' in result
-        mock_asyncio_thread.assert_called_once()
-        call_args = mock_asyncio_thread.call_args[1]
-        assert call_args['DBClusterIdentifier'] == 'test-cluster'
-
-    @pytest.mark.asyncio
-    async def test_start_cluster_success(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
-    ):
-        """Test successful cluster start."""
-        mock_rds_client.start_db_cluster.return_value = {
-            'DBCluster': {
-                'DBClusterIdentifier': 'test-cluster',
-                'Status': 'starting',
-                'Engine': 'aurora-mysql',
-            }
-        }
-
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
-        # First call without confirmation token
-        result = await status_db_cluster(db_cluster_identifier='test-cluster', action='start')
-
-        assert result['requires_confirmation'] is True
         token = result['confirmation_token']
 
         # Second call with confirmation token
         result = await status_db_cluster(
-            db_cluster_identifier='test-cluster', action='start', confirmation_token=token
+            db_cluster_identifier='test-cluster', action=action, confirmation_token=token
         )
 
-        assert 'started successfully' in result['message'] or 'Successfully' in result['message']
+        assert result['message'] == f'Successfully {verb} DB cluster test-cluster'
         assert result['formatted_cluster']['cluster_id'] == 'test-cluster'
-        assert result['formatted_cluster']['status'] == 'starting'
+        assert result['formatted_cluster']['status'] == status
         assert result['formatted_cluster']['engine'] == 'aurora-mysql'
         assert 'DBCluster' in result
         mock_asyncio_thread.assert_called_once()
-        call_args = mock_asyncio_thread.call_args[1]
-        assert call_args['DBClusterIdentifier'] == 'test-cluster'
-
-    @pytest.mark.asyncio
-    async def test_reboot_cluster_success(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
-    ):
-        """Test successful cluster reboot."""
-        mock_rds_client.reboot_db_cluster.return_value = {
-            'DBCluster': {
-                'DBClusterIdentifier': 'test-cluster',
-                'Status': 'rebooting',
-                'Engine': 'aurora-mysql',
-            }
-        }
+        assert mock_asyncio_thread.call_args[0][0] is getattr(mock_rds_client, client_method)
+        assert mock_asyncio_thread.call_args[1]['DBClusterIdentifier'] == 'test-cluster'
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
-        # First call without confirmation token
-        result = await status_db_cluster(db_cluster_identifier='test-cluster', action='reboot')
-
-        assert result['requires_confirmation'] is True
-        token = result['confirmation_token']
-
-        # Second call with confirmation token
-        result = await status_db_cluster(
-            db_cluster_identifier='test-cluster', action='reboot', confirmation_token=token
-        )
-
-        assert 'reboot' in result['message'].lower() or 'Successfully' in result['message']
-        assert result['formatted_cluster']['cluster_id'] == 'test-cluster'
-        assert result['formatted_cluster']['status'] == 'rebooting'
-        assert result['formatted_cluster']['engine'] == 'aurora-mysql'
-        assert 'DBCluster' in result
-        mock_asyncio_thread.assert_called_once()
-        call_args = mock_asyncio_thread.call_args[1]
-        assert call_args['DBClusterIdentifier'] == 'test-cluster'
-
-    @pytest.mark.asyncio
     async def test_invalid_action(self, mock_rds_context_allowed):
         """Test with invalid action."""
         # First get confirmation token
@@ -164,15 +91,12 @@ class TestChangeDBClusterStatus:
         assert 'error' in result2
         assert 'Invalid action' in result2['error']
 
-    @pytest.mark.asyncio
     async def test_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster status change in readonly mode."""
         result = await status_db_cluster(db_cluster_identifier='test-cluster', action='stop')
 
-        assert 'error' in result
-        assert 'read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
 
-    @pytest.mark.asyncio
     async def test_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -204,7 +128,6 @@ class TestChangeDBClusterStatus:
             or result.get('error_code') == 'DBClusterNotFoundFault'
         )
 
-    @pytest.mark.asyncio
     async def test_invalid_confirmation_token(self, mock_rds_context_allowed):
         """Test with invalid confirmation token."""
         result = await status_db_cluster(
@@ -214,7 +137,6 @@ class TestChangeDBClusterStatus:
         assert 'error' in result
         assert 'Invalid or expired confirmation token' in result['error']
 
-    @pytest.mark.asyncio
     async def test_parameter_mismatch(self, mock_rds_context_allowed):
         """Test with parameter mismatch."""
         # Get token for one cluster
@@ -229,7 +151,6 @@ class TestChangeDBClusterStatus:
         assert 'error' in result
         assert 'Parameter mismatch' in result['error']
 
-    @pytest.mark.asyncio
     async def test_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -251,3 +172,145 @@ class TestChangeDBClusterStatus:
 
         assert 'error' in result
         assert 'General error' in result['error']
+
+
+class TestChangeDBClustersStatus:
+    """Test cases for status_db_clusters function."""
+
+    async def test_start_clusters_reports_each_outcome(
+        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+    ):
+        """Test every cluster is started and a single failure is reported per cluster."""
+
+        async def async_return(func, **kwargs):
+            if kwargs['DBClusterIdentifier'] == 'cluster-2':
+                raise ClientError(
+                    {'Error': {'Code': 'InvalidDBClusterStateFault', 'Message': 'Not stopped'}},
+                    'StartDBCluster',
+                )
+            return {
+                'DBCluster': {
+                    'DBClusterIdentifier': kwargs['DBClusterIdentifier'],
+                    'Status': 'starting',
+                }
+            }
+
+        mock_asyncio_thread.side_effect = async_return
+        cluster_ids = ['cluster-1', 'cluster-2', 'cluster-3']
+
+        result = await status_db_clusters(db_cluster_identifiers=cluster_ids, action='start')
+        assert "DB clusters 'cluster-1, cluster-2, cluster-3'" in result['warning']
+
+        result = await status_db_clusters(
+            db_cluster_identifiers=cluster_ids,
+            action='start',
+            confirmation_token=result['confirmation_token'],
+        )
+
+        assert result['message'] == 'Start succeeded for 2 of 3 DB clusters.'
+        assert result['results']['cluster-1']['formatted_cluster']['status'] == 'starting'
+        assert result['results']['cluster-3']['formatted_cluster']['status'] == 'starting'
+        assert result['results']['cluster-2']['error_code'] == 'InvalidDBClusterStateFault'
+        assert mock_asyncio_thread.call_count == 3
+
+    async def test_token_is_bound_to_cluster_list(
+        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+    ):
+        """Test a token issued for one list of clusters cannot be used for another."""
+        result = await status_db_clusters(db_cluster_identifiers=['cluster-1'], action='stop')
+
+        result = await status_db_clusters(
+            db_cluster_identifiers=['cluster-1', 'cluster-2'],
+            action='stop',
+            confirmation_token=result['confirmation_token'],
+        )
+
+        assert 'Parameter mismatch' in result['error']
+        mock_asyncio_thread.assert_not_called()
+
+    async def test_single_cluster_token_is_rejected_for_cluster_list(
+        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+    ):
+        """Test a ChangeDBClusterStatus token cannot confirm ChangeDBClustersStatus."""
+        result = await status_db_cluster(db_cluster_identifier='harmless-dev', action='stop')
+
+        result = await status_db_clusters(
+            db_cluster_identifiers=['prod-a', 'prod-b'],
+            action='stop',
+            confirmation_token=result['confirmation_token'],
+        )
+
+        assert 'Invalid operation type' in result['error']
+        mock_asyncio_thread.assert_not_called()
+
+    async def test_cluster_list_token_is_rejected_for_single_cluster(
+        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+    ):
+        """Test a ChangeDBClustersStatus token cannot confirm ChangeDBClusterStatus."""
+        result = await status_db_clusters(db_cluster_identifiers=['harmless-dev'], action='stop')
+
+        result = await status_db_cluster(
+            db_cluster_identifier='prod-a',
+            action='stop',
+            confirmation_token=result['confirmation_token'],
+        )
+
+        assert 'Invalid operation type' in result['error']
+        mock_asyncio_thread.assert_not_called()
+
+    async def test_cancelled_cluster_is_reported_as_failure(
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
+    ):
+        """Test a cluster whose call is cancelled is reported as an error, not a success."""
+
+        async def async_return(func, **kwargs):
+            if kwargs['DBClusterIdentifier'] == 'cluster-2':
+                raise asyncio.CancelledError()
+            return {'DBCluster': {'DBClusterIdentifier': kwargs['DBClusterIdentifier']}}
+
+        mock_asyncio_thread.side_effect = async_return
+        cluster_ids = ['cluster-1', 'cluster-2']
+        token = issue_confirmation_token(
+            'ChangeDBClustersStatus',
+            db_cluster_identifiers=cluster_ids,
+            action='stop',
+            include_formatted=True,
+        )
+
+        result = await status_db_clusters(
+            db_cluster_identifiers=cluster_ids, action='stop', confirmation_token=token
+        )
+
+        assert result['message'] == 'Stop succeeded for 1 of 2 DB clusters.'
+        assert result['results']['cluster-2']['error_type'] == 'CancelledError'
+
+    async def test_duplicate_identifiers_are_changed_once(
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
+    ):
+        """Test a cluster listed twice is changed once and counted once."""
+        mock_rds_client.reboot_db_cluster.return_value = {
+            'DBCluster': {'DBClusterIdentifier': 'cluster-1', 'Status': 'rebooting'}
+        }
+        cluster_ids = ['cluster-1', 'cluster-2', 'cluster-1']
+        token = issue_confirmation_token(
+            'ChangeDBClustersStatus',
+            db_cluster_identifiers=cluster_ids,
+            action='reboot',
+            include_formatted=True,
+        )
+
+        result = await status_db_clusters(
+            db_cluster_identifiers=cluster_ids, action='reboot', confirmation_token=token
+        )
+
+        assert result['message'] == 'Reboot succeeded for 2 of 2 DB clusters.'
+        assert list(result['results']) == ['cluster-1', 'cluster-2']
+        assert mock_asyncio_thread.call_count == 2
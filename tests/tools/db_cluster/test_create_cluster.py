@@ -14,7 +14,7 @@
 
 """Tests for create_cluster tool."""
 
-import pytest
+from awslabs.rds_management_mcp_server.common.decorators.readonly_check import ERROR_READONLY_MODE
 from awslabs.rds_management_mcp_server.tools.db_cluster.create_cluster import create_db_cluster
 from botocore.exceptions import ClientError
 
@@ -22,7 +22,6 @@ from botocore.exceptions import ClientError
 class TestCreateDBCluster:
     """Test cases for create_db_cluster function."""
 
-    @pytest.mark.asyncio
     async def test_create_cluster_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -40,11 +39,6 @@ class TestCreateDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster(
             db_cluster_identifier='test-cluster', engine='aurora-mysql', master_username='admin'
         )
@@ -54,17 +48,14 @@ class TestCreateDBCluster:
         assert 'DBCluster' in result
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_cluster_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster creation in readonly mode."""
         result = await create_db_cluster(
             db_cluster_identifier='test-cluster', engine='aurora-mysql', master_username='admin'
         )
 
-        assert isinstance(result, dict) and 'error' in result
-        assert 'read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
 
-    @pytest.mark.asyncio
     async def test_create_cluster_with_optional_params(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -82,11 +73,6 @@ class TestCreateDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster(
             db_cluster_identifier='test-cluster',
             engine='aurora-mysql',
@@ -111,7 +97,6 @@ class TestCreateDBCluster:
         assert call_args['AvailabilityZones'] == ['us-east-1a', 'us-east-1b']
         assert call_args['EngineVersion'] == '5.7.mysql_aurora.2.10.2'
 
-    @pytest.mark.asyncio
     async def test_create_cluster_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -142,7 +127,6 @@ class TestCreateDBCluster:
             or result.get('error_code') == 'DBClusterAlreadyExistsFault'
         )
 
-    @pytest.mark.asyncio
     async def test_create_cluster_adds_mcp_tags(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -155,11 +139,6 @@ class TestCreateDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         await create_db_cluster(
             db_cluster_identifier='test-cluster', engine='aurora-mysql', master_username='admin'
         )
@@ -172,7 +151,6 @@ class TestCreateDBCluster:
         assert 'mcp_server_version' in tag_keys
         assert 'created_by' in tag_keys
 
-    @pytest.mark.asyncio
     async def test_create_cluster_port_mapping(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -185,11 +163,6 @@ class TestCreateDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         await create_db_cluster(
             db_cluster_identifier='test-cluster', engine='aurora-mysql', master_username='admin'
         )
@@ -198,7 +171,6 @@ class TestCreateDBCluster:
         # MySQL should default to port 3306
         assert call_args['Port'] == 3306
 
-    @pytest.mark.asyncio
     async def test_create_cluster_manage_master_password(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -211,11 +183,6 @@ class TestCreateDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         await create_db_cluster(
             db_cluster_identifier='test-cluster', engine='aurora-mysql', master_username='admin'
         )
@@ -223,7 +190,17 @@ class TestCreateDBCluster:
         call_args = mock_asyncio_thread.call_args[1]
         assert call_args['ManageMasterUserPassword'] is True
 
-    @pytest.mark.asyncio
+    async def test_create_cluster_invalid_identifier(
+        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+    ):
+        """Test an invalid identifier is rejected before calling the API."""
+        result = await create_db_cluster(
+            db_cluster_identifier='test--cluster', engine='aurora-mysql', master_username='admin'
+        )
+
+        assert 'Invalid DB cluster identifier' in result['error']
+        mock_asyncio_thread.assert_not_called()
+
     async def test_create_cluster_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -241,7 +218,6 @@ class TestCreateDBCluster:
         assert isinstance(result, dict) and 'error' in result
         assert 'General error' in result['error']
 
-    @pytest.mark.asyncio
     async def test_create_cluster_with_postgresql_engine(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -256,11 +232,6 @@ class TestCreateDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster(
             db_cluster_identifier='test-postgres-cluster',
             engine='aurora-postgresql',
@@ -271,7 +242,6 @@ class TestCreateDBCluster:
         assert result['formatted_cluster']['engine'] == 'aurora-postgresql'
         # Port will be in the DBCluster response, not in formatted_cluster
 
-    @pytest.mark.asyncio
     async def test_create_cluster_with_invalid_engine(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -14,7 +14,7 @@
 
 """Tests for create_snapshot tool."""
 
-import pytest
+from awslabs.rds_management_mcp_server.common.decorators.readonly_check import ERROR_READONLY_MODE
 from awslabs.rds_management_mcp_server.tools.db_cluster.create_snapshot import (
     create_db_cluster_snapshot,
 )
@@ -24,7 +24,6 @@ from botocore.exceptions import ClientError
 class TestCreateDBClusterSnapshot:
     """Test cases for create_db_cluster_snapshot function."""
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -44,11 +43,6 @@ class TestCreateDBClusterSnapshot:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster_snapshot(
             db_cluster_snapshot_identifier='test-snapshot', db_cluster_identifier='test-cluster'
         )
@@ -58,7 +52,6 @@ class TestCreateDBClusterSnapshot:
         assert 'DBClusterSnapshot' in result
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_with_tags(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -76,11 +69,6 @@ class TestCreateDBClusterSnapshot:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster_snapshot(
             db_cluster_snapshot_identifier='test-snapshot',
             db_cluster_identifier='test-cluster',
@@ -100,17 +88,14 @@ class TestCreateDBClusterSnapshot:
         assert 'mcp_server_version' in tag_dict  # MCP tags are always added
         assert 'created_by' in tag_dict
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_readonly_mode(self, mock_rds_context_readonly):
         """Test snapshot creation in readonly mode."""
         result = await create_db_cluster_snapshot(
             db_cluster_snapshot_identifier='test-snapshot', db_cluster_identifier='test-cluster'
         )
 
-        assert isinstance(result, dict) and 'error' in result
-        assert 'read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -138,7 +123,6 @@ class TestCreateDBClusterSnapshot:
         if 'error_code' in result:
             assert result['error_code'] == 'DBClusterSnapshotAlreadyExistsFault'
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -156,7 +140,6 @@ class TestCreateDBClusterSnapshot:
         assert isinstance(result, dict) and 'error' in result
         assert 'General error' in result['error']
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_minimal_params(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -170,11 +153,6 @@ class TestCreateDBClusterSnapshot:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster_snapshot(
             db_cluster_snapshot_identifier='test-snapshot', db_cluster_identifier='test-cluster'
         )
@@ -191,7 +169,6 @@ class TestCreateDBClusterSnapshot:
         assert 'mcp_server_version' in tag_keys
         assert 'created_by' in tag_keys
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_non_existent_cluster(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -214,7 +191,6 @@ class TestCreateDBClusterSnapshot:
         if 'error_code' in result:
             assert result['error_code'] == 'DBClusterNotFoundFault'
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_invalid_tags(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -238,7 +214,6 @@ class TestCreateDBClusterSnapshot:
         if 'error_code' in result:
             assert result['error_code'] == 'InvalidParameterValue'
 
-    @pytest.mark.asyncio
     async def test_create_snapshot_result_formatting(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -258,11 +233,6 @@ class TestCreateDBClusterSnapshot:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster_snapshot(
             db_cluster_snapshot_identifier='test-snapshot', db_cluster_identifier='test-cluster'
         )
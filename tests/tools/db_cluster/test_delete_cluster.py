@@ -14,10 +14,7 @@
 
 """Tests for delete_cluster tool."""
 
-import pytest
-from awslabs.rds_management_mcp_server.common.decorators.require_confirmation import (
-    _pending_operations,
-)
+from awslabs.rds_management_mcp_server.common.decorators.readonly_check import ERROR_READONLY_MODE
 from awslabs.rds_management_mcp_server.tools.db_cluster.delete_cluster import delete_db_cluster
 from botocore.exceptions import ClientError
 
@@ -25,11 +22,6 @@ from botocore.exceptions import ClientError
 class TestDeleteCluster:
     """Test cases for delete_cluster function."""
 
-    def setup_method(self):
-        """Clear pending operations before each test."""
-        _pending_operations.clear()
-
-    @pytest.mark.asyncio
     async def test_delete_cluster_requires_confirmation(self, mock_rds_context_allowed):
         """Test delete cluster requires confirmation when no token provided."""
         result = await delete_db_cluster(db_cluster_identifier='test-cluster')
@@ -40,7 +32,6 @@ class TestDeleteCluster:
         assert 'confirmation_token' in result
         assert result['confirmation_token'] is not None
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_with_confirmation(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -53,11 +44,6 @@ class TestDeleteCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         # Get confirmation token first
         result1 = await delete_db_cluster(db_cluster_identifier='test-cluster')
         token = result1['confirmation_token']
@@ -73,17 +59,18 @@ class TestDeleteCluster:
         assert result2['formatted_cluster']['engine'] == 'aurora-mysql'
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster deletion in readonly mode."""
         result = await delete_db_cluster(db_cluster_identifier='test-cluster')
 
-        assert isinstance(result, dict) and 'error' in result
-        assert 'read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_with_final_snapshot(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test cluster deletion with final snapshot."""
         mock_rds_client.delete_db_cluster.return_value = {
@@ -94,14 +81,7 @@ class TestDeleteCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
-        # Get confirmation token first
-        result1 = await delete_db_cluster(db_cluster_identifier='test-cluster')
-        token = result1['confirmation_token']
+        token = issue_confirmation_token('DeleteDBCluster', db_cluster_identifier='test-cluster')
 
         # Use token with snapshot option
         result2 = await delete_db_cluster(
@@ -119,9 +99,12 @@ class TestDeleteCluster:
         assert call_args['SkipFinalSnapshot'] is False
         assert call_args['FinalDBSnapshotIdentifier'] == 'test-cluster-final-snapshot'
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_client_error(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test cluster deletion with client error."""
 
@@ -133,9 +116,9 @@ class TestDeleteCluster:
 
         mock_asyncio_thread.side_effect = async_error
 
-        # Get confirmation token first
-        result1 = await delete_db_cluster(db_cluster_identifier='nonexistent-cluster')
-        token = result1['confirmation_token']
+        token = issue_confirmation_token(
+            'DeleteDBCluster', db_cluster_identifier='nonexistent-cluster'
+        )
 
         # Try to delete with confirmation
         result2 = await delete_db_cluster(
@@ -146,7 +129,6 @@ class TestDeleteCluster:
         if 'error_code' in result2:
             assert result2['error_code'] == 'DBClusterNotFoundFault'
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_invalid_token(self, mock_rds_context_allowed):
         """Test cluster deletion with invalid confirmation token."""
         result = await delete_db_cluster(
@@ -154,15 +136,14 @@ class TestDeleteCluster:
         )
 
         assert isinstance(result, dict) and 'error' in result
-        assert (
-            'Invalid' in result['error']
-            or 'expired' in result['error']
-            or 'token' in result['error']
-        )
+        assert result['error'].startswith('Invalid or expired confirmation token')
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_missing_final_snapshot_identifier(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test cluster deletion without final snapshot identifier when required."""
 
@@ -179,9 +160,7 @@ class TestDeleteCluster:
 
         mock_asyncio_thread.side_effect = async_error
 
-        # Get confirmation token first
-        result1 = await delete_db_cluster(db_cluster_identifier='test-cluster')
-        token = result1['confirmation_token']
+        token = issue_confirmation_token('DeleteDBCluster', db_cluster_identifier='test-cluster')
 
         # Try to delete with confirmation but missing final snapshot identifier
         result2 = await delete_db_cluster(
@@ -194,9 +173,12 @@ class TestDeleteCluster:
         if 'error_code' in result2:
             assert result2['error_code'] == 'InvalidParameterCombination'
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_invalid_final_snapshot_identifier(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test cluster deletion with an invalid final snapshot identifier."""
 
@@ -213,9 +195,7 @@ class TestDeleteCluster:
 
         mock_asyncio_thread.side_effect = async_error
 
-        # Get confirmation token first
-        result1 = await delete_db_cluster(db_cluster_identifier='test-cluster')
-        token = result1['confirmation_token']
+        token = issue_confirmation_token('DeleteDBCluster', db_cluster_identifier='test-cluster')
 
         # Try to delete with confirmation and invalid final snapshot identifier
         result2 = await delete_db_cluster(
@@ -229,9 +209,12 @@ class TestDeleteCluster:
         if 'error_code' in result2:
             assert result2['error_code'] == 'InvalidParameterValue'
 
-    @pytest.mark.asyncio
     async def test_delete_cluster_general_exception(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test cluster deletion with a general exception."""
 
@@ -240,9 +223,7 @@ class TestDeleteCluster:
 
         mock_asyncio_thread.side_effect = async_error
 
-        # Get confirmation token first
-        result1 = await delete_db_cluster(db_cluster_identifier='test-cluster')
-        token = result1['confirmation_token']
+        token = issue_confirmation_token('DeleteDBCluster', db_cluster_identifier='test-cluster')
 
         # Try to delete with confirmation
         result2 = await delete_db_cluster(
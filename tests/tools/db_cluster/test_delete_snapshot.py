@@ -1,7 +1,7 @@
 """Tests for delete_snapshot tool."""
 
-import pytest
 import time
+from awslabs.rds_management_mcp_server.common.decorators.readonly_check import ERROR_READONLY_MODE
 from awslabs.rds_management_mcp_server.tools.db_cluster.delete_snapshot import (
     delete_db_cluster_snapshot,
 )
@@ -11,7 +11,6 @@ from unittest.mock import patch
 class TestDeleteSnapshot:
     """Test cases for delete_db_cluster_snapshot function."""
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -23,7 +22,7 @@ class TestDeleteSnapshot:
             mock_pending.get.return_value = (
                 'DeleteDBClusterSnapshot',
                 {'db_cluster_snapshot_identifier': 'test-snapshot'},
-                time.time() + 300,  # 5 minutes from now
+                time.monotonic() + 300,  # 5 minutes from now
             )
 
             mock_rds_client.delete_db_cluster_snapshot.return_value = {
@@ -37,11 +36,6 @@ class TestDeleteSnapshot:
                 }
             }
 
-            async def async_return(func, **kwargs):
-                return func(**kwargs)
-
-            mock_asyncio_thread.side_effect = async_return
-
             result = await delete_db_cluster_snapshot(
                 db_cluster_snapshot_identifier='test-snapshot', confirmation_token='test-token'
             )
@@ -52,7 +46,6 @@ class TestDeleteSnapshot:
             assert result['formatted_snapshot']['status'] == 'deleting'
             assert 'DBClusterSnapshot' in result
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_without_confirmation(self, mock_rds_context_allowed):
         """Test snapshot deletion without confirmation token."""
         result = await delete_db_cluster_snapshot(db_cluster_snapshot_identifier='test-snapshot')
@@ -60,15 +53,12 @@ class TestDeleteSnapshot:
         assert result['requires_confirmation'] is True
         assert 'confirmation_token' in result
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_readonly_mode(self, mock_rds_context_readonly):
         """Test snapshot deletion in readonly mode."""
         result = await delete_db_cluster_snapshot(db_cluster_snapshot_identifier='test-snapshot')
 
-        assert isinstance(result, dict) and 'error' in result
-        assert 'read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_invalid_token(self, mock_rds_context_allowed):
         """Test snapshot deletion with invalid confirmation token."""
         with patch(
@@ -81,9 +71,8 @@ class TestDeleteSnapshot:
             )
 
             assert 'error' in result
-            assert 'Invalid' in result['error'] or 'expired' in result['error']
+            assert result['error'].startswith('Invalid or expired confirmation token')
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_general_exception(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -94,7 +83,7 @@ class TestDeleteSnapshot:
             mock_pending.get.return_value = (
                 'DeleteDBClusterSnapshot',
                 {'db_cluster_snapshot_identifier': 'test-snapshot'},
-                time.time() + 300,
+                time.monotonic() + 300,
             )
 
             async def async_error(func, **kwargs):
@@ -109,7 +98,6 @@ class TestDeleteSnapshot:
             assert isinstance(result, dict) and 'error' in result
             assert 'General error' in result['error']
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_result_formatting(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -120,7 +108,7 @@ class TestDeleteSnapshot:
             mock_pending.get.return_value = (
                 'DeleteDBClusterSnapshot',
                 {'db_cluster_snapshot_identifier': 'test-snapshot'},
-                time.time() + 300,
+                time.monotonic() + 300,
             )
 
             mock_rds_client.delete_db_cluster_snapshot.return_value = {
@@ -139,11 +127,6 @@ class TestDeleteSnapshot:
                 }
             }
 
-            async def async_return(func, **kwargs):
-                return func(**kwargs)
-
-            mock_asyncio_thread.side_effect = async_return
-
             result = await delete_db_cluster_snapshot(
                 db_cluster_snapshot_identifier='test-snapshot', confirmation_token='test-token'
             )
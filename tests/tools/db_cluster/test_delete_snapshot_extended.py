@@ -22,6 +22,7 @@ from awslabs.rds_management_mcp_server.tools.db_cluster.delete_snapshot import (
     delete_db_cluster_snapshot,
 )
 from botocore.exceptions import ClientError
+from mypy_boto3_rds.client import RDSClient
 from unittest.mock import MagicMock, patch
 
 
@@ -31,7 +32,7 @@ def mock_rds_client():
     with patch(
         'awslabs.rds_management_mcp_server.common.connection.RDSConnectionManager.get_connection'
     ) as mock_get_connection:
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec=RDSClient)
         mock_get_connection.return_value = mock_client
         yield mock_client
 
@@ -80,7 +81,6 @@ def add_delete_snapshot_to_impacts():
 class TestDeleteSnapshotCoverage:
     """Test delete_db_cluster_snapshot for better coverage."""
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_successful_with_confirmation(
         self,
         mock_rds_client,
@@ -95,7 +95,7 @@ class TestDeleteSnapshotCoverage:
         mock_pending_operations.get.return_value = (
             'DeleteDBClusterSnapshot',
             {'db_cluster_snapshot_identifier': 'test-snapshot'},
-            time.time() + 300,  # 5 minutes from now
+            time.monotonic() + 300,  # 5 minutes from now
         )
 
         # Mock successful deletion
@@ -141,7 +141,6 @@ class TestDeleteSnapshotCoverage:
             DBClusterSnapshotIdentifier='test-snapshot'
         )
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_with_complete_snapshot_data(
         self,
         mock_rds_client,
@@ -156,7 +155,7 @@ class TestDeleteSnapshotCoverage:
         mock_pending_operations.get.return_value = (
             'DeleteDBClusterSnapshot',
             {'db_cluster_snapshot_identifier': 'full-snapshot'},
-            time.time() + 300,
+            time.monotonic() + 300,
         )
 
         # Mock response with all possible fields
@@ -206,7 +205,6 @@ class TestDeleteSnapshotCoverage:
         assert result['DBClusterSnapshot']['AllocatedStorage'] == 200
         assert result['DBClusterSnapshot']['KmsKeyId'] == 'arn:aws:kms:us-east-1:12345:key/67890'
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_with_minimal_response(
         self,
         mock_rds_client,
@@ -221,7 +219,7 @@ class TestDeleteSnapshotCoverage:
         mock_pending_operations.get.return_value = (
             'DeleteDBClusterSnapshot',
             {'db_cluster_snapshot_identifier': 'minimal-snapshot'},
-            time.time() + 300,
+            time.monotonic() + 300,
         )
 
         # Mock response with minimal fields
@@ -243,7 +241,6 @@ class TestDeleteSnapshotCoverage:
         assert result['formatted_snapshot']['cluster_id'] is None
         assert result['formatted_snapshot']['deletion_time'] is None
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_requires_confirmation_flow(
         self, mock_rds_context_allowed, add_delete_snapshot_to_impacts
     ):
@@ -260,7 +257,6 @@ class TestDeleteSnapshotCoverage:
         assert result['impact']['downtime'] == 'None'
         assert result['impact']['estimated_time'] == '1-2 minutes'
 
-    @pytest.mark.asyncio
     async def test_delete_snapshot_client_error_handling(
         self,
         mock_rds_client,
@@ -275,7 +271,7 @@ class TestDeleteSnapshotCoverage:
         mock_pending_operations.get.return_value = (
             'DeleteDBClusterSnapshot',
             {'db_cluster_snapshot_identifier': 'error-snapshot'},
-            time.time() + 300,
+            time.monotonic() + 300,
         )
 
         # Test specific error codes
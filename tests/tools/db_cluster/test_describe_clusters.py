@@ -1,25 +1,24 @@
 """Tests for describe_clusters tool."""
 
-import pytest
+from awslabs.rds_management_mcp_server.common.cache import describe_cache
+from awslabs.rds_management_mcp_server.common.context import RDSContext
 from awslabs.rds_management_mcp_server.tools.db_cluster.describe_clusters import (
     describe_db_clusters,
 )
+from unittest.mock import call, patch
 
 
 class TestDescribeClusters:
     """Test cases for describe_db_clusters function."""
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_all_success(
         self, mock_rds_client, mock_asyncio_thread, sample_db_cluster
     ):
         """Test successful description of all clusters."""
-        mock_rds_client.describe_db_clusters.return_value = {'DBClusters': [sample_db_cluster]}
-
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
+        mock_paginator = mock_rds_client.get_paginator.return_value
+        mock_paginator.paginate.return_value.build_full_result.return_value = {
+            'DBClusters': [sample_db_cluster]
+        }
 
         result = await describe_db_clusters()
 
@@ -32,19 +31,18 @@ class TestDescribeClusters:
             result['formatted_clusters'][0]['engine_version'] == sample_db_cluster['EngineVersion']
         )
         assert 'DBClusters' in result
+        mock_rds_client.get_paginator.assert_called_once_with('describe_db_clusters')
+        mock_rds_client.get_paginator.return_value.paginate.assert_called_once_with(
+            PaginationConfig={'MaxItems': RDSContext.max_items()}
+        )
+        mock_rds_client.describe_db_clusters.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_specific_cluster(
         self, mock_rds_client, mock_asyncio_thread, sample_db_cluster
     ):
         """Test description of a specific cluster."""
         mock_rds_client.describe_db_clusters.return_value = {'DBClusters': [sample_db_cluster]}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_db_clusters(db_cluster_identifier='test-cluster')
 
         assert (
@@ -59,18 +57,12 @@ class TestDescribeClusters:
         call_args = mock_asyncio_thread.call_args[1]
         assert call_args['DBClusterIdentifier'] == 'test-cluster'
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_with_filters(
         self, mock_rds_client, mock_asyncio_thread, sample_db_cluster
     ):
         """Test description of clusters with filters."""
         mock_rds_client.describe_db_clusters.return_value = {'DBClusters': [sample_db_cluster]}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_db_clusters(
             filters=[{'Name': 'engine', 'Values': ['aurora-mysql']}], max_records=50
         )
@@ -83,15 +75,10 @@ class TestDescribeClusters:
         assert call_args['Filters'] == [{'Name': 'engine', 'Values': ['aurora-mysql']}]
         assert call_args['MaxRecords'] == 50
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_empty_result(self, mock_rds_client, mock_asyncio_thread):
         """Test description when no clusters are found."""
-        mock_rds_client.describe_db_clusters.return_value = {'DBClusters': []}
-
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
+        mock_paginator = mock_rds_client.get_paginator.return_value
+        mock_paginator.paginate.return_value.build_full_result.return_value = {'DBClusters': []}
 
         result = await describe_db_clusters()
 
@@ -99,7 +86,6 @@ class TestDescribeClusters:
         assert len(result['formatted_clusters']) == 0
         assert 'DBClusters' in result
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_with_pagination(
         self, mock_rds_client, mock_asyncio_thread, sample_db_cluster
     ):
@@ -109,11 +95,6 @@ class TestDescribeClusters:
             'Marker': 'next-page-marker',
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_db_clusters(marker='start-marker', max_records=10)
 
         assert result['message'] == 'Successfully retrieved information for 1 DB clusters'
@@ -124,7 +105,49 @@ class TestDescribeClusters:
         assert call_args['Marker'] == 'start-marker'
         assert call_args['MaxRecords'] == 10
 
-    @pytest.mark.asyncio
+    async def test_describe_clusters_resumes_from_next_token(
+        self, mock_rds_client, mock_asyncio_thread
+    ):
+        """Test a truncated listing returns a NextToken that resumes it, also with max_records."""
+        mock_paginator = mock_rds_client.get_paginator.return_value
+        mock_paginator.paginate.return_value.build_full_result.side_effect = [
+            {'DBClusters': [], 'NextToken': 'resume-token'},
+            {'DBClusters': []},
+        ]
+
+        first = await describe_db_clusters()
+        second = await describe_db_clusters(next_token=first['NextToken'], max_records=20)
+
+        assert 'Marker' not in first
+        assert 'NextToken' not in second
+        assert mock_paginator.paginate.call_args_list == [
+            call(PaginationConfig={'MaxItems': RDSContext.max_items()}),
+            call(
+                MaxRecords=20, PaginationConfig={'MaxItems': 20, 'StartingToken': 'resume-token'}
+            ),
+        ]
+        mock_rds_client.describe_db_clusters.assert_not_called()
+
+    async def test_describe_clusters_passes_marker_to_rds(
+        self, mock_rds_client, mock_asyncio_thread
+    ):
+        """Test a Marker from a previous response is sent to RDS as a marker."""
+        mock_rds_client.describe_db_clusters.return_value = {'DBClusters': []}
+
+        await describe_db_clusters(marker='rds-marker')
+
+        mock_rds_client.describe_db_clusters.assert_called_once_with(Marker='rds-marker')
+        mock_rds_client.get_paginator.assert_not_called()
+
+    async def test_describe_clusters_rejects_marker_with_next_token(
+        self, mock_rds_client, mock_asyncio_thread
+    ):
+        """Test marker and next_token cannot be combined."""
+        result = await describe_db_clusters(marker='rds-marker', next_token='resume-token')
+
+        assert 'error' in result
+        mock_asyncio_thread.assert_not_called()
+
     async def test_describe_clusters_invalid_identifier(
         self, mock_rds_client, mock_asyncio_thread
     ):
@@ -150,7 +173,6 @@ class TestDescribeClusters:
         if 'error_code' in result:
             assert result['error_code'] == 'DBClusterNotFoundFault'
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_general_exception(self, mock_rds_client, mock_asyncio_thread):
         """Test error handling for general exceptions."""
 
@@ -164,17 +186,14 @@ class TestDescribeClusters:
         assert isinstance(result, dict) and 'error' in result
         assert 'Unexpected error occurred' in result['error']
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_formatting(
         self, mock_rds_client, mock_asyncio_thread, sample_db_cluster
     ):
         """Test the formatting of the cluster information in the result."""
-        mock_rds_client.describe_db_clusters.return_value = {'DBClusters': [sample_db_cluster]}
-
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
+        mock_paginator = mock_rds_client.get_paginator.return_value
+        mock_paginator.paginate.return_value.build_full_result.return_value = {
+            'DBClusters': [sample_db_cluster]
+        }
 
         result = await describe_db_clusters()
 
@@ -201,7 +220,6 @@ class TestDescribeClusters:
         assert 'tags' in formatted_cluster
         assert 'DBClusters' in result
 
-    @pytest.mark.asyncio
     async def test_describe_clusters_invalid_filter(self, mock_rds_client, mock_asyncio_thread):
         """Test error handling with invalid filter parameters."""
         from botocore.exceptions import ClientError
@@ -226,3 +244,41 @@ class TestDescribeClusters:
         assert isinstance(result, dict) and ('error' in result or 'error_code' in result)
         if 'error_code' in result:
             assert result['error_code'] == 'InvalidParameterValue'
+
+    async def test_describe_clusters_uses_cache(
+        self, mock_rds_client, mock_asyncio_thread, sample_db_cluster
+    ):
+        """Test repeated calls with the same arguments are served from the cache."""
+        # boto3 returns a new response dict for every call
+        mock_rds_client.describe_db_clusters.side_effect = lambda **_: {
+            'DBClusters': [sample_db_cluster]
+        }
+
+        with patch.object(RDSContext, 'cache_ttl', return_value=10):
+            first = await describe_db_clusters(db_cluster_identifier='test-cluster')
+            second = await describe_db_clusters(db_cluster_identifier='test-cluster')
+            await describe_db_clusters(db_cluster_identifier='other-cluster')
+
+        assert second == first
+        assert second is not first
+        assert mock_rds_client.describe_db_clusters.call_count == 2
+
+    async def test_describe_clusters_does_not_cache_across_a_write(
+        self, mock_rds_client, mock_asyncio_thread, sample_db_cluster
+    ):
+        """Test a result fetched while a write completes is not cached."""
+        mock_rds_client.describe_db_clusters.return_value = {'DBClusters': [sample_db_cluster]}
+
+        async def write_lands_during_call(func, *args, **kwargs):
+            response = func(*args, **kwargs)
+            # what readonly_check does once a mutating tool finishes
+            describe_cache.clear()
+            return response
+
+        mock_asyncio_thread.side_effect = write_lands_during_call
+
+        with patch.object(RDSContext, 'cache_ttl', return_value=10):
+            await describe_db_clusters(db_cluster_identifier='test-cluster')
+            await describe_db_clusters(db_cluster_identifier='test-cluster')
+
+        assert mock_rds_client.describe_db_clusters.call_count == 2
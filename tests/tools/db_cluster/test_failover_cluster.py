@@ -14,10 +14,7 @@
 
 """Tests for failover_cluster tool."""
 
-import pytest
-from awslabs.rds_management_mcp_server.common.decorators.require_confirmation import (
-    _pending_operations,
-)
+from awslabs.rds_management_mcp_server.common.decorators.readonly_check import ERROR_READONLY_MODE
 from awslabs.rds_management_mcp_server.tools.db_cluster.failover_cluster import failover_db_cluster
 from botocore.exceptions import ClientError
 
@@ -25,11 +22,6 @@ from botocore.exceptions import ClientError
 class TestFailoverDBCluster:
     """Test cases for failover_db_cluster function."""
 
-    def setup_method(self):
-        """Clear pending operations before each test."""
-        _pending_operations.clear()
-
-    @pytest.mark.asyncio
     async def test_failover_cluster_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -54,11 +46,6 @@ class TestFailoverDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         # First call without confirmation token
         result = await failover_db_cluster(db_cluster_identifier='test-cluster')
 
@@ -79,7 +66,6 @@ class TestFailoverDBCluster:
         assert 'DBCluster' in result
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_with_target(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -104,11 +90,6 @@ class TestFailoverDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         # First call without confirmation token
         result = await failover_db_cluster(
             db_cluster_identifier='test-cluster', target_db_instance_identifier='test-instance-2'
@@ -132,15 +113,12 @@ class TestFailoverDBCluster:
         call_args = mock_asyncio_thread.call_args[1]
         assert call_args['TargetDBInstanceIdentifier'] == 'test-instance-2'
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster failover in readonly mode."""
         result = await failover_db_cluster(db_cluster_identifier='test-cluster')
 
-        assert isinstance(result, dict) and 'error' in result
-        assert 'read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -167,7 +145,6 @@ class TestFailoverDBCluster:
         if 'error_code' in result:
             assert result['error_code'] == 'DBClusterNotFoundFault'
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_invalid_confirmation_token(self, mock_rds_context_allowed):
         """Test with invalid confirmation token."""
         result = await failover_db_cluster(
@@ -175,13 +152,8 @@ class TestFailoverDBCluster:
         )
 
         assert isinstance(result, dict) and 'error' in result
-        assert (
-            'Invalid' in result['error']
-            or 'expired' in result['error']
-            or 'token' in result['error']
-        )
+        assert result['error'].startswith('Invalid or expired confirmation token')
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_parameter_mismatch(self, mock_rds_context_allowed):
         """Test with parameter mismatch."""
         # Get token for one cluster
@@ -196,7 +168,6 @@ class TestFailoverDBCluster:
         assert isinstance(result, dict) and 'error' in result
         assert 'Parameter mismatch' in result['error']
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -219,7 +190,6 @@ class TestFailoverDBCluster:
         assert isinstance(result, dict) and 'error' in result
         assert 'General error' in result['error']
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_no_target_instance(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -232,11 +202,6 @@ class TestFailoverDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         # First call without confirmation token
         result = await failover_db_cluster(db_cluster_identifier='test-cluster')
         token = result['confirmation_token']
@@ -256,7 +221,6 @@ class TestFailoverDBCluster:
         # TargetDBInstanceIdentifier should not be set if not provided
         assert 'TargetDBInstanceIdentifier' not in call_args
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_invalid_target(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -292,7 +256,6 @@ class TestFailoverDBCluster:
         if 'error_code' in result:
             assert result['error_code'] == 'InvalidDBInstanceStateFault'
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_result_formatting(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -324,11 +287,6 @@ class TestFailoverDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         # First get confirmation token
         result = await failover_db_cluster(db_cluster_identifier='test-cluster')
         token = result['confirmation_token']
@@ -360,7 +318,6 @@ class TestFailoverDBCluster:
         assert formatted_cluster['members'][1]['is_writer'] is False
         assert 'DBCluster' in result
 
-    @pytest.mark.asyncio
     async def test_failover_cluster_invalid_state(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -14,7 +14,7 @@
 
 """Tests for modify_cluster tool."""
 
-import pytest
+from awslabs.rds_management_mcp_server.common.decorators.readonly_check import ERROR_READONLY_MODE
 from awslabs.rds_management_mcp_server.tools.db_cluster.modify_cluster import modify_db_cluster
 from botocore.exceptions import ClientError
 
@@ -22,7 +22,6 @@ from botocore.exceptions import ClientError
 class TestModifyDBCluster:
     """Test cases for modify_db_cluster function."""
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -39,11 +38,6 @@ class TestModifyDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_cluster(
             db_cluster_identifier='test-cluster',
             backup_retention_period=14,
@@ -59,17 +53,31 @@ class TestModifyDBCluster:
         assert 'DBCluster' in result
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_modify_cluster_without_formatted_cluster(
+        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+    ):
+        """Test the formatted cluster summary can be skipped."""
+        mock_rds_client.modify_db_cluster.return_value = {
+            'DBCluster': {'DBClusterIdentifier': 'test-cluster', 'Status': 'modifying'}
+        }
+
+        result = await modify_db_cluster(
+            db_cluster_identifier='test-cluster',
+            backup_retention_period=14,
+            include_formatted=False,
+        )
+
+        assert 'formatted_cluster' not in result
+        assert result['DBCluster']['DBClusterIdentifier'] == 'test-cluster'
+
     async def test_modify_cluster_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster modification in readonly mode."""
         result = await modify_db_cluster(
             db_cluster_identifier='test-cluster', backup_retention_period=14
         )
 
-        assert isinstance(result, dict) and 'error' in result
-        assert 'read-only mode' in result['error']
+        assert result['error'] == ERROR_READONLY_MODE
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_with_all_params(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -87,11 +95,6 @@ class TestModifyDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_cluster(
             db_cluster_identifier='test-cluster',
             apply_immediately=True,
@@ -119,7 +122,6 @@ class TestModifyDBCluster:
         assert call_args['EngineVersion'] == '5.7.mysql_aurora.2.10.3'
         assert call_args['AllowMajorVersionUpgrade'] is True
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -141,7 +143,6 @@ class TestModifyDBCluster:
         if 'error_code' in result:
             assert result['error_code'] == 'DBClusterNotFoundFault'
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_no_changes(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -155,11 +156,6 @@ class TestModifyDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_cluster(
             db_cluster_identifier='test-cluster',
             backup_retention_period=7,  # Same as current
@@ -168,7 +164,6 @@ class TestModifyDBCluster:
         assert result['message'] == 'Successfully modified DB cluster test-cluster'
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_minimal_params(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -181,11 +176,6 @@ class TestModifyDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_cluster(
             db_cluster_identifier='test-cluster', backup_retention_period=10
         )
@@ -202,7 +192,6 @@ class TestModifyDBCluster:
         # ApplyImmediately should not be set if not provided
         assert 'ApplyImmediately' not in call_args
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -220,7 +209,6 @@ class TestModifyDBCluster:
         assert isinstance(result, dict) and 'error' in result
         assert 'General error' in result['error']
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_invalid_parameter(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -248,7 +236,6 @@ class TestModifyDBCluster:
         if 'error_code' in result:
             assert result['error_code'] == 'InvalidParameterValue'
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_result_formatting(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -270,11 +257,6 @@ class TestModifyDBCluster:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_cluster(
             db_cluster_identifier='test-cluster',
             backup_retention_period=14,
@@ -306,7 +288,6 @@ class TestModifyDBCluster:
             == 'test-cluster.cluster-ro-123456789012.us-west-2.rds.amazonaws.com'
         )
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_conflicting_parameters(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -335,7 +316,6 @@ class TestModifyDBCluster:
         if 'error_code' in result:
             assert result['error_code'] == 'InvalidParameterCombination'
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_pending_modification(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
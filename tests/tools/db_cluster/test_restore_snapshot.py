@@ -1,6 +1,5 @@
 """Tests for restore_snapshot tool."""
 
-import pytest
 from awslabs.rds_management_mcp_server.tools.db_cluster.restore_snapshot import (
     restore_db_cluster_from_snapshot,
     restore_db_cluster_to_point_in_time,
@@ -10,7 +9,6 @@ from awslabs.rds_management_mcp_server.tools.db_cluster.restore_snapshot import
 class TestRestoreSnapshot:
     """Test cases for restore snapshot functions."""
 
-    @pytest.mark.asyncio
     async def test_restore_from_snapshot_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_cluster
     ):
@@ -19,11 +17,6 @@ class TestRestoreSnapshot:
             'DBCluster': sample_db_cluster
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await restore_db_cluster_from_snapshot(
             db_cluster_identifier='restored-cluster',
             snapshot_identifier='test-snapshot',
@@ -36,7 +29,6 @@ class TestRestoreSnapshot:
         assert result['formatted_cluster']['engine'] == sample_db_cluster['Engine']
         assert 'DBCluster' in result
 
-    @pytest.mark.asyncio
     async def test_restore_from_snapshot_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster restoration in readonly mode."""
         result = await restore_db_cluster_from_snapshot(
@@ -48,7 +40,6 @@ class TestRestoreSnapshot:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_restore_from_snapshot_with_optional_params(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_cluster
     ):
@@ -57,11 +48,6 @@ class TestRestoreSnapshot:
             'DBCluster': sample_db_cluster
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await restore_db_cluster_from_snapshot(
             db_cluster_identifier='restored-cluster',
             snapshot_identifier='test-snapshot',
@@ -78,7 +64,6 @@ class TestRestoreSnapshot:
         assert call_args['AvailabilityZones'] == ['us-east-1a', 'us-east-1b']
         assert call_args['VpcSecurityGroupIds'] == ['sg-123456']
 
-    @pytest.mark.asyncio
     async def test_restore_to_point_in_time_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_cluster
     ):
@@ -87,11 +72,6 @@ class TestRestoreSnapshot:
             'DBCluster': sample_db_cluster
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await restore_db_cluster_to_point_in_time(
             db_cluster_identifier='restored-cluster',
             source_db_cluster_identifier='source-cluster',
@@ -107,7 +87,6 @@ class TestRestoreSnapshot:
         assert result['formatted_cluster']['engine'] == sample_db_cluster['Engine']
         assert 'DBCluster' in result
 
-    @pytest.mark.asyncio
     async def test_restore_to_point_in_time_readonly_mode(self, mock_rds_context_readonly):
         """Test point in time restoration in readonly mode."""
         result = await restore_db_cluster_to_point_in_time(
@@ -119,7 +98,6 @@ class TestRestoreSnapshot:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_restore_to_point_in_time_use_latest(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_cluster
     ):
@@ -128,11 +106,6 @@ class TestRestoreSnapshot:
             'DBCluster': sample_db_cluster
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await restore_db_cluster_to_point_in_time(
             db_cluster_identifier='restored-cluster',
             source_db_cluster_identifier='source-cluster',
@@ -147,7 +120,6 @@ class TestRestoreSnapshot:
         call_args = mock_asyncio_thread.call_args[1]
         assert call_args['UseLatestRestorableTime'] is True
 
-    @pytest.mark.asyncio
     async def test_restore_from_non_existent_snapshot(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -172,7 +144,6 @@ class TestRestoreSnapshot:
         assert result['error_code'] == 'DBSnapshotNotFound'
         assert 'Snapshot not found' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_restore_to_invalid_point_in_time(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -202,7 +173,6 @@ class TestRestoreSnapshot:
         assert result['error_code'] == 'InvalidRestoreTime'
         assert 'Restore time is out of range' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_restore_with_invalid_engine_version(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -228,7 +198,6 @@ class TestRestoreSnapshot:
         assert result['error_code'] == 'InvalidParameterValue'
         assert 'Invalid engine version' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_restore_result_formatting(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -248,11 +217,6 @@ class TestRestoreSnapshot:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await restore_db_cluster_from_snapshot(
             db_cluster_identifier='restored-cluster',
             snapshot_identifier='test-snapshot',
@@ -279,7 +243,6 @@ class TestRestoreSnapshot:
         )
         assert 'DBCluster' in result
 
-    @pytest.mark.asyncio
     async def test_restore_general_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -1,6 +1,9 @@
 """Tests for db_cluster utils."""
 
-from awslabs.rds_management_mcp_server.tools.db_cluster.utils import format_cluster_info
+from awslabs.rds_management_mcp_server.tools.db_cluster.utils import (
+    format_cluster_info,
+    format_cluster_response,
+)
 
 
 class TestDBClusterUtils:
@@ -126,3 +129,19 @@ class TestDBClusterUtils:
         assert len(result['vpc_security_groups']) == 3
         assert result['vpc_security_groups'][0]['id'] == 'sg-11111111'
         assert result['vpc_security_groups'][2]['status'] == 'adding'
+
+    def test_format_cluster_response(self, sample_db_cluster):
+        """Test building a tool result from a DBCluster response."""
+        response = {'DBCluster': sample_db_cluster, 'ResponseMetadata': {'RequestId': 'abc'}}
+
+        result = format_cluster_response(response, 'done')
+
+        assert 'ResponseMetadata' not in result
+        assert result['message'] == 'done'
+        assert result['formatted_cluster']['cluster_id'] == 'test-db-cluster'
+
+    def test_format_cluster_response_without_formatted_cluster(self, sample_db_cluster):
+        """Test the formatted cluster summary can be left out."""
+        result = format_cluster_response({'DBCluster': sample_db_cluster}, 'done', False)
+
+        assert 'formatted_cluster' not in result
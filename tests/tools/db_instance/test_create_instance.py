@@ -14,7 +14,6 @@
 
 """Tests for create_instance tool."""
 
-import pytest
 from awslabs.rds_management_mcp_server.tools.db_instance.create_instance import create_db_instance
 from botocore.exceptions import ClientError
 
@@ -22,7 +21,6 @@ from botocore.exceptions import ClientError
 class TestCreateDBInstance:
     """Test cases for create_db_instance function."""
 
-    @pytest.mark.asyncio
     async def test_create_instance_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -49,11 +47,6 @@ class TestCreateDBInstance:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_instance(
             db_instance_identifier='test-instance',
             db_instance_class='db.t3.micro',
@@ -68,7 +61,6 @@ class TestCreateDBInstance:
         assert 'DBInstance' in result
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_instance_readonly_mode(self, mock_rds_context_readonly):
         """Test instance creation in readonly mode."""
         result = await create_db_instance(
@@ -78,7 +70,6 @@ class TestCreateDBInstance:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_create_instance_with_all_params(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -105,11 +96,6 @@ class TestCreateDBInstance:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_instance(
             db_instance_identifier='test-instance',
             db_instance_class='db.t3.micro',
@@ -152,7 +138,6 @@ class TestCreateDBInstance:
         assert call_args['PubliclyAccessible'] is True
         assert call_args['BackupRetentionPeriod'] == 14
 
-    @pytest.mark.asyncio
     async def test_create_instance_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -181,7 +166,6 @@ class TestCreateDBInstance:
         assert result['error_code'] == 'DBInstanceAlreadyExistsFault'
         assert result['operation'] == 'create_db_instance'
 
-    @pytest.mark.asyncio
     async def test_create_instance_adds_mcp_tags(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -194,11 +178,6 @@ class TestCreateDBInstance:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         await create_db_instance(
             db_instance_identifier='test-instance', db_instance_class='db.t3.micro', engine='mysql'
         )
@@ -211,7 +190,6 @@ class TestCreateDBInstance:
         assert 'mcp_server_version' in tag_keys
         assert 'created_by' in tag_keys
 
-    @pytest.mark.asyncio
     async def test_create_instance_minimal_params(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -224,11 +202,6 @@ class TestCreateDBInstance:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_instance(
             db_instance_identifier='test-instance', db_instance_class='db.t3.micro', engine='mysql'
         )
@@ -240,7 +213,6 @@ class TestCreateDBInstance:
         assert call_args['DBInstanceClass'] == 'db.t3.micro'
         assert call_args['Engine'] == 'mysql'
 
-    @pytest.mark.asyncio
     async def test_create_instance_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -258,7 +230,6 @@ class TestCreateDBInstance:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert result['operation'] == 'create_db_instance'
 
-    @pytest.mark.asyncio
     async def test_create_instance_manage_master_password(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -271,11 +242,6 @@ class TestCreateDBInstance:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         await create_db_instance(
             db_instance_identifier='test-instance',
             db_instance_class='db.t3.micro',
@@ -1,25 +1,23 @@
 """Tests for describe_instances tool."""
 
-import pytest
+from awslabs.rds_management_mcp_server.common.context import RDSContext
 from awslabs.rds_management_mcp_server.tools.db_instance.describe_instances import (
     describe_db_instances,
 )
+from unittest.mock import call
 
 
 class TestDescribeInstances:
     """Test cases for describe_db_instances function."""
 
-    @pytest.mark.asyncio
     async def test_describe_instances_all_success(
         self, mock_rds_client, mock_asyncio_thread, sample_db_instance
     ):
         """Test successful description of all instances."""
-        mock_rds_client.describe_db_instances.return_value = {'DBInstances': [sample_db_instance]}
-
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
+        mock_paginator = mock_rds_client.get_paginator.return_value
+        mock_paginator.paginate.return_value.build_full_result.return_value = {
+            'DBInstances': [sample_db_instance]
+        }
 
         result = await describe_db_instances()
 
@@ -27,19 +25,18 @@ class TestDescribeInstances:
         assert len(result['formatted_instances']) == 1
         assert result['formatted_instances'][0]['instance_id'] == 'test-db-instance'
         assert 'DBInstances' in result
+        mock_rds_client.get_paginator.assert_called_once_with('describe_db_instances')
+        mock_rds_client.get_paginator.return_value.paginate.assert_called_once_with(
+            PaginationConfig={'MaxItems': RDSContext.max_items()}
+        )
+        mock_rds_client.describe_db_instances.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_describe_instances_specific_instance(
         self, mock_rds_client, mock_asyncio_thread, sample_db_instance
     ):
         """Test description of a specific instance."""
         mock_rds_client.describe_db_instances.return_value = {'DBInstances': [sample_db_instance]}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_db_instances(db_instance_identifier='test-instance')
 
         assert (
@@ -49,18 +46,12 @@ class TestDescribeInstances:
         call_args = mock_asyncio_thread.call_args[1]
         assert call_args['DBInstanceIdentifier'] == 'test-instance'
 
-    @pytest.mark.asyncio
     async def test_describe_instances_with_filters(
         self, mock_rds_client, mock_asyncio_thread, sample_db_instance
     ):
         """Test description of instances with filters."""
         mock_rds_client.describe_db_instances.return_value = {'DBInstances': [sample_db_instance]}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_db_instances(
             filters=[{'Name': 'engine', 'Values': ['mysql']}], max_records=50
         )
@@ -71,22 +62,16 @@ class TestDescribeInstances:
         assert call_args['Filters'] == [{'Name': 'engine', 'Values': ['mysql']}]
         assert call_args['MaxRecords'] == 50
 
-    @pytest.mark.asyncio
     async def test_describe_instances_empty_result(self, mock_rds_client, mock_asyncio_thread):
         """Test description when no instances are found."""
-        mock_rds_client.describe_db_instances.return_value = {'DBInstances': []}
-
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
+        mock_paginator = mock_rds_client.get_paginator.return_value
+        mock_paginator.paginate.return_value.build_full_result.return_value = {'DBInstances': []}
 
         result = await describe_db_instances()
 
         assert result['message'] == 'Successfully retrieved information for 0 DB instances'
         assert len(result['formatted_instances']) == 0
 
-    @pytest.mark.asyncio
     async def test_describe_instances_with_pagination(
         self, mock_rds_client, mock_asyncio_thread, sample_db_instance
     ):
@@ -96,11 +81,6 @@ class TestDescribeInstances:
             'Marker': 'next-page-marker',
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await describe_db_instances(marker='start-marker', max_records=10)
 
         assert result['message'] == 'Successfully retrieved information for 1 DB instances'
@@ -109,3 +89,46 @@ class TestDescribeInstances:
         call_args = mock_asyncio_thread.call_args[1]
         assert call_args['Marker'] == 'start-marker'
         assert call_args['MaxRecords'] == 10
+
+    async def test_describe_instances_resumes_from_next_token(
+        self, mock_rds_client, mock_asyncio_thread
+    ):
+        """Test a truncated listing returns a NextToken that resumes it, also with max_records."""
+        mock_paginator = mock_rds_client.get_paginator.return_value
+        mock_paginator.paginate.return_value.build_full_result.side_effect = [
+            {'DBInstances': [], 'NextToken': 'resume-token'},
+            {'DBInstances': []},
+        ]
+
+        first = await describe_db_instances()
+        second = await describe_db_instances(next_token=first['NextToken'], max_records=20)
+
+        assert 'Marker' not in first
+        assert 'NextToken' not in second
+        assert mock_paginator.paginate.call_args_list == [
+            call(PaginationConfig={'MaxItems': RDSContext.max_items()}),
+            call(
+                MaxRecords=20, PaginationConfig={'MaxItems': 20, 'StartingToken': 'resume-token'}
+            ),
+        ]
+        mock_rds_client.describe_db_instances.assert_not_called()
+
+    async def test_describe_instances_passes_marker_to_rds(
+        self, mock_rds_client, mock_asyncio_thread
+    ):
+        """Test a Marker from a previous response is sent to RDS as a marker."""
+        mock_rds_client.describe_db_instances.return_value = {'DBInstances': []}
+
+        await describe_db_instances(marker='rds-marker')
+
+        mock_rds_client.describe_db_instances.assert_called_once_with(Marker='rds-marker')
+        mock_rds_client.get_paginator.assert_not_called()
+
+    async def test_describe_instances_rejects_marker_with_next_token(
+        self, mock_rds_client, mock_asyncio_thread
+    ):
+        """Test marker and next_token cannot be combined."""
+        result = await describe_db_instances(marker='rds-marker', next_token='resume-token')
+
+        assert 'error' in result
+        mock_asyncio_thread.assert_not_called()
@@ -1,24 +1,17 @@
 """Tests for modify_instance tool."""
 
-import pytest
 from awslabs.rds_management_mcp_server.tools.db_instance.modify_instance import modify_db_instance
 
 
 class TestModifyInstance:
     """Test cases for modify_db_instance function."""
 
-    @pytest.mark.asyncio
     async def test_modify_instance_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_instance
     ):
         """Test successful instance modification."""
         mock_rds_client.modify_db_instance.return_value = {'DBInstance': sample_db_instance}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance(
             db_instance_identifier='test-instance',
             db_instance_class='db.t3.small',
@@ -29,7 +22,6 @@ class TestModifyInstance:
         assert result['formatted_instance']['instance_id'] == 'test-db-instance'
         assert 'DBInstance' in result
 
-    @pytest.mark.asyncio
     async def test_modify_instance_readonly_mode(self, mock_rds_context_readonly):
         """Test instance modification in readonly mode."""
         result = await modify_db_instance(
@@ -39,18 +31,12 @@ class TestModifyInstance:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_modify_instance_with_storage_options(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_instance
     ):
         """Test instance modification with storage options."""
         mock_rds_client.modify_db_instance.return_value = {'DBInstance': sample_db_instance}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance(
             db_instance_identifier='test-instance',
             allocated_storage=100,
@@ -65,18 +51,12 @@ class TestModifyInstance:
         assert call_args['StorageType'] == 'gp3'
         assert call_args['ApplyImmediately'] is False
 
-    @pytest.mark.asyncio
     async def test_modify_instance_with_security_groups(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_instance
     ):
         """Test instance modification with security groups."""
         mock_rds_client.modify_db_instance.return_value = {'DBInstance': sample_db_instance}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance(
             db_instance_identifier='test-instance',
             vpc_security_group_ids=['sg-12345', 'sg-67890'],
@@ -89,18 +69,12 @@ class TestModifyInstance:
         assert call_args['VpcSecurityGroupIds'] == ['sg-12345', 'sg-67890']
         assert call_args['BackupRetentionPeriod'] == 14
 
-    @pytest.mark.asyncio
     async def test_modify_instance_with_maintenance_windows(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_instance
     ):
         """Test instance modification with maintenance windows."""
         mock_rds_client.modify_db_instance.return_value = {'DBInstance': sample_db_instance}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance(
             db_instance_identifier='test-instance',
             preferred_backup_window='03:00-04:00',
@@ -113,18 +87,12 @@ class TestModifyInstance:
         assert call_args['PreferredBackupWindow'] == '03:00-04:00'
         assert call_args['PreferredMaintenanceWindow'] == 'sun:04:00-sun:05:00'
 
-    @pytest.mark.asyncio
     async def test_modify_instance_with_version_upgrade(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread, sample_db_instance
     ):
         """Test instance modification with version upgrade."""
         mock_rds_client.modify_db_instance.return_value = {'DBInstance': sample_db_instance}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance(
             db_instance_identifier='test-instance',
             engine_version='8.0.36',
@@ -29,6 +29,23 @@ class TestDBInstanceUtils:
         assert isinstance(result, dict)
         assert result['endpoint'] == {}
 
+    def test_format_instance_info_with_endpoint_dict(self):
+        """Test format_instance_info with a structured endpoint."""
+        instance_data = {
+            'Endpoint': {'Address': 'test.rds.amazonaws.com', 'Port': 3306, 'HostedZoneId': 'Z1'}
+        }
+        result = format_instance_info(instance_data)
+        assert result['endpoint'] == {
+            'address': 'test.rds.amazonaws.com',
+            'port': 3306,
+            'hosted_zone_id': 'Z1',
+        }
+
+    def test_format_instance_info_with_endpoint_string(self):
+        """Test format_instance_info with a plain endpoint address."""
+        result = format_instance_info({'Endpoint': 'test.rds.amazonaws.com'})
+        assert result['endpoint'] == {'address': 'test.rds.amazonaws.com'}
+
     def test_format_instance_info_with_tags(self):
         """Test format_instance_info with tags."""
         instance_data = {
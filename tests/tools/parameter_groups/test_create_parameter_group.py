@@ -14,7 +14,6 @@
 
 """Tests for create_parameter_group tool."""
 
-import pytest
 from awslabs.rds_management_mcp_server.tools.parameter_groups.create_parameter_group import (
     create_db_cluster_parameter_group,
     create_db_instance_parameter_group,
@@ -25,7 +24,6 @@ from botocore.exceptions import ClientError
 class TestCreateDBClusterParameterGroup:
     """Test cases for create_db_cluster_parameter_group function."""
 
-    @pytest.mark.asyncio
     async def test_create_cluster_parameter_group_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -39,11 +37,6 @@ class TestCreateDBClusterParameterGroup:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster_parameter_group(
             db_cluster_parameter_group_name='test-cluster-param-group',
             db_parameter_group_family='aurora-mysql5.7',
@@ -58,7 +51,6 @@ class TestCreateDBClusterParameterGroup:
         assert 'DBClusterParameterGroup' in result
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_cluster_parameter_group_with_tags(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -71,11 +63,6 @@ class TestCreateDBClusterParameterGroup:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_cluster_parameter_group(
             db_cluster_parameter_group_name='test-cluster-param-group',
             db_parameter_group_family='aurora-mysql5.7',
@@ -96,7 +83,6 @@ class TestCreateDBClusterParameterGroup:
             {'Key': 'created_by', 'Value': 'rds-management-mcp-server'},
         ]
 
-    @pytest.mark.asyncio
     async def test_create_cluster_parameter_group_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster parameter group creation in readonly mode."""
         result = await create_db_cluster_parameter_group(
@@ -108,7 +94,6 @@ class TestCreateDBClusterParameterGroup:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_create_cluster_parameter_group_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -137,7 +122,6 @@ class TestCreateDBClusterParameterGroup:
         assert result['error_code'] == 'DBParameterGroupAlreadyExistsFault'
         assert result['operation'] == 'create_db_cluster_parameter_group'
 
-    @pytest.mark.asyncio
     async def test_create_cluster_parameter_group_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -161,7 +145,6 @@ class TestCreateDBClusterParameterGroup:
 class TestCreateDBInstanceParameterGroup:
     """Test cases for create_db_instance_parameter_group function."""
 
-    @pytest.mark.asyncio
     async def test_create_instance_parameter_group_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -175,11 +158,6 @@ class TestCreateDBInstanceParameterGroup:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_instance_parameter_group(
             db_parameter_group_name='test-instance-param-group',
             db_parameter_group_family='mysql8.0',
@@ -194,7 +172,6 @@ class TestCreateDBInstanceParameterGroup:
         assert 'DBParameterGroup' in result
         mock_asyncio_thread.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_instance_parameter_group_with_tags(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -207,11 +184,6 @@ class TestCreateDBInstanceParameterGroup:
             }
         }
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await create_db_instance_parameter_group(
             db_parameter_group_name='test-instance-param-group',
             db_parameter_group_family='mysql8.0',
@@ -232,7 +204,6 @@ class TestCreateDBInstanceParameterGroup:
             {'Key': 'created_by', 'Value': 'rds-management-mcp-server'},
         ]
 
-    @pytest.mark.asyncio
     async def test_create_instance_parameter_group_readonly_mode(self, mock_rds_context_readonly):
         """Test instance parameter group creation in readonly mode."""
         result = await create_db_instance_parameter_group(
@@ -244,7 +215,6 @@ class TestCreateDBInstanceParameterGroup:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_create_instance_parameter_group_client_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -273,7 +243,6 @@ class TestCreateDBInstanceParameterGroup:
         assert result['error_code'] == 'DBParameterGroupAlreadyExistsFault'
         assert result['operation'] == 'create_db_instance_parameter_group'
 
-    @pytest.mark.asyncio
     async def test_create_instance_parameter_group_exception_handling(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -1,6 +1,5 @@
 """Tests for describe_parameters tool."""
 
-import pytest
 from awslabs.rds_management_mcp_server.tools.parameter_groups.describe_cluster_parameter_groups import (
     describe_db_cluster_parameter_groups,
 )
@@ -12,7 +11,6 @@ from awslabs.rds_management_mcp_server.tools.parameter_groups.describe_instance_
 class TestDescribeParameterGroups:
     """Test cases for describe parameter group functions."""
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_parameter_group_success(
         self, mock_rds_client, sample_cluster_parameter_group
     ):
@@ -32,7 +30,6 @@ class TestDescribeParameterGroups:
             == 'Test cluster parameter group'
         )
 
-    @pytest.mark.asyncio
     async def test_describe_instance_parameter_group_success(
         self, mock_rds_client, sample_parameter_group
     ):
@@ -49,7 +46,6 @@ class TestDescribeParameterGroups:
         assert result['formatted_parameter_groups'][0]['family'] == 'mysql8.0'
         assert result['formatted_parameter_groups'][0]['description'] == 'Test parameter group'
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_parameter_group_not_found(self, mock_rds_client):
         """Test when cluster parameter group is not found."""
         mock_rds_client.describe_db_cluster_parameter_groups.return_value = {
@@ -62,7 +58,6 @@ class TestDescribeParameterGroups:
 
         assert result['formatted_parameter_groups'] == []
 
-    @pytest.mark.asyncio
     async def test_describe_instance_parameter_group_not_found(self, mock_rds_client):
         """Test when instance parameter group is not found."""
         mock_rds_client.describe_db_parameter_groups.return_value = {'DBParameterGroups': []}
@@ -73,7 +68,6 @@ class TestDescribeParameterGroups:
 
         assert result['formatted_parameter_groups'] == []
 
-    @pytest.mark.asyncio
     async def test_describe_cluster_parameter_group_error(self, mock_rds_client):
         """Test error handling in describe cluster parameter group."""
         mock_rds_client.describe_db_cluster_parameter_groups.side_effect = Exception('Test error')
@@ -85,7 +79,6 @@ class TestDescribeParameterGroups:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'Test error' in result['error_message']
 
-    @pytest.mark.asyncio
     async def test_describe_instance_parameter_group_error(self, mock_rds_client):
         """Test error handling in describe instance parameter group."""
         mock_rds_client.describe_db_parameter_groups.side_effect = Exception('Test error')
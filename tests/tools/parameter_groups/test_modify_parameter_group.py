@@ -1,6 +1,5 @@
 """Tests for modify_parameter_group tool."""
 
-import pytest
 from awslabs.rds_management_mcp_server.tools.parameter_groups.modify_parameter_group import (
     modify_db_cluster_parameter_group,
     modify_db_instance_parameter_group,
@@ -10,7 +9,6 @@ from awslabs.rds_management_mcp_server.tools.parameter_groups.modify_parameter_g
 class TestModifyParameterGroups:
     """Test cases for modify parameter group functions."""
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_parameter_group_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -20,11 +18,6 @@ class TestModifyParameterGroups:
         }
         mock_rds_client.describe_db_cluster_parameters.return_value = {'Parameters': []}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_cluster_parameter_group(
             db_cluster_parameter_group_name='test-cluster-parameter-group',
             parameters=[
@@ -43,7 +36,6 @@ class TestModifyParameterGroups:
         assert 'parameters_modified' in result
         assert 'formatted_parameters' in result
 
-    @pytest.mark.asyncio
     async def test_modify_instance_parameter_group_success(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -53,11 +45,6 @@ class TestModifyParameterGroups:
         }
         mock_rds_client.describe_db_parameters.return_value = {'Parameters': []}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance_parameter_group(
             db_parameter_group_name='test-parameter-group',
             parameters=[
@@ -81,7 +68,6 @@ class TestModifyParameterGroups:
         assert 'parameters_modified' in result
         assert 'formatted_parameters' in result
 
-    @pytest.mark.asyncio
     async def test_modify_cluster_parameter_group_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster parameter group modification in readonly mode."""
         result = await modify_db_cluster_parameter_group(
@@ -92,7 +78,6 @@ class TestModifyParameterGroups:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_modify_instance_parameter_group_readonly_mode(self, mock_rds_context_readonly):
         """Test instance parameter group modification in readonly mode."""
         result = await modify_db_instance_parameter_group(
@@ -103,7 +88,6 @@ class TestModifyParameterGroups:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_modify_parameter_group_empty_parameters(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
@@ -113,11 +97,6 @@ class TestModifyParameterGroups:
         }
         mock_rds_client.describe_db_parameters.return_value = {'Parameters': []}
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance_parameter_group(
             db_parameter_group_name='test-parameter-group', parameters=[]
         )
@@ -128,18 +107,12 @@ class TestModifyParameterGroups:
             == 'Successfully modified parameters in DB instance parameter group test-parameter-group'
         )
 
-    @pytest.mark.asyncio
     async def test_modify_parameter_group_error(
         self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
     ):
         """Test error handling in parameter group modification."""
         mock_rds_client.modify_db_parameter_group.side_effect = Exception('Test error')
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await modify_db_instance_parameter_group(
             db_parameter_group_name='test-parameter-group',
             parameters=[{'ParameterName': 'max_connections', 'ParameterValue': '150'}],
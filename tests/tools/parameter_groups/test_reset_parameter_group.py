@@ -1,10 +1,5 @@
 """Tests for reset_parameter_group tool."""
 
-import pytest
-import time
-from awslabs.rds_management_mcp_server.common.decorators.require_confirmation import (
-    _pending_operations,
-)
 from awslabs.rds_management_mcp_server.tools.parameter_groups.reset_parameter_group import (
     reset_db_cluster_parameter_group,
     reset_db_instance_parameter_group,
@@ -14,34 +9,28 @@ from awslabs.rds_management_mcp_server.tools.parameter_groups.reset_parameter_gr
 class TestResetParameterGroups:
     """Test cases for reset parameter group functions."""
 
-    @pytest.mark.asyncio
     async def test_reset_cluster_parameter_group_all_success(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test successful reset of all cluster parameter group parameters."""
         mock_rds_client.reset_db_cluster_parameter_group.return_value = {
             'DBClusterParameterGroupName': 'test-cluster-parameter-group'
         }
 
-        # Set up pending operation for confirmation
-        _pending_operations['test-token'] = (
+        token = issue_confirmation_token(
             'ResetDBClusterParameterGroup',
-            {
-                'db_cluster_parameter_group_name': 'test-cluster-parameter-group',
-                'reset_all_parameters': True,
-            },
-            time.time() + 300,  # 5 minutes from now
+            db_cluster_parameter_group_name='test-cluster-parameter-group',
+            reset_all_parameters=True,
         )
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await reset_db_cluster_parameter_group(
             db_cluster_parameter_group_name='test-cluster-parameter-group',
             reset_all_parameters=True,
-            confirmation_token='test-token',
+            confirmation_token=token,
         )
 
         assert (
@@ -50,31 +39,28 @@ class TestResetParameterGroups:
         )
         assert result['parameters_reset'] == 0  # No parameters in mock response
 
-    @pytest.mark.asyncio
     async def test_reset_instance_parameter_group_all_success(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test successful reset of all instance parameter group parameters."""
         mock_rds_client.reset_db_parameter_group.return_value = {
             'DBParameterGroupName': 'test-parameter-group'
         }
 
-        # Set up pending operation for confirmation
-        _pending_operations['test-token'] = (
+        token = issue_confirmation_token(
             'ResetDBInstanceParameterGroup',
-            {'db_parameter_group_name': 'test-parameter-group', 'reset_all_parameters': True},
-            time.time() + 300,  # 5 minutes from now
+            db_parameter_group_name='test-parameter-group',
+            reset_all_parameters=True,
         )
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await reset_db_instance_parameter_group(
             db_parameter_group_name='test-parameter-group',
             reset_all_parameters=True,
-            confirmation_token='test-token',
+            confirmation_token=token,
         )
 
         assert (
@@ -83,34 +69,28 @@ class TestResetParameterGroups:
         )
         assert result['parameters_reset'] == 0  # No parameters in mock response
 
-    @pytest.mark.asyncio
     async def test_reset_cluster_parameter_group_specific_parameters(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test reset of specific cluster parameter group parameters."""
         mock_rds_client.reset_db_cluster_parameter_group.return_value = {
             'DBClusterParameterGroupName': 'test-cluster-parameter-group'
         }
 
-        # Set up pending operation for confirmation
-        _pending_operations['test-token'] = (
+        token = issue_confirmation_token(
             'ResetDBClusterParameterGroup',
-            {
-                'db_cluster_parameter_group_name': 'test-cluster-parameter-group',
-                'reset_all_parameters': False,
-                'parameters': [
-                    {'ParameterName': 'max_connections', 'ApplyMethod': 'immediate'},
-                    {'ParameterName': 'character_set_database', 'ApplyMethod': 'pending-reboot'},
-                ],
-            },
-            time.time() + 300,  # 5 minutes from now
+            db_cluster_parameter_group_name='test-cluster-parameter-group',
+            reset_all_parameters=False,
+            parameters=[
+                {'ParameterName': 'max_connections', 'ApplyMethod': 'immediate'},
+                {'ParameterName': 'character_set_database', 'ApplyMethod': 'pending-reboot'},
+            ],
         )
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await reset_db_cluster_parameter_group(
             db_cluster_parameter_group_name='test-cluster-parameter-group',
             reset_all_parameters=False,
@@ -118,7 +98,7 @@ class TestResetParameterGroups:
                 {'ParameterName': 'max_connections', 'ApplyMethod': 'immediate'},
                 {'ParameterName': 'character_set_database', 'ApplyMethod': 'pending-reboot'},
             ],
-            confirmation_token='test-token',
+            confirmation_token=token,
         )
 
         assert (
@@ -127,7 +107,6 @@ class TestResetParameterGroups:
         )
         assert result['parameters_reset'] == 0  # No parameters in mock response
 
-    @pytest.mark.asyncio
     async def test_reset_parameter_group_requires_confirmation(self, mock_rds_context_allowed):
         """Test reset without confirmation token."""
         result = await reset_db_instance_parameter_group(
@@ -138,7 +117,6 @@ class TestResetParameterGroups:
         assert result['requires_confirmation'] is True
         assert 'confirmation_token' in result
 
-    @pytest.mark.asyncio
     async def test_reset_cluster_parameter_group_readonly_mode(self, mock_rds_context_readonly):
         """Test cluster parameter group reset in readonly mode."""
         result = await reset_db_cluster_parameter_group(
@@ -150,7 +128,6 @@ class TestResetParameterGroups:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'read-only mode' in result['message']
 
-    @pytest.mark.asyncio
     async def test_reset_parameter_group_no_parameters(
         self, mock_rds_client, mock_rds_context_allowed
     ):
@@ -177,29 +154,26 @@ class TestResetParameterGroups:
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)
         assert 'must specify' in result['error']
 
-    @pytest.mark.asyncio
     async def test_reset_parameter_group_error(
-        self, mock_rds_client, mock_rds_context_allowed, mock_asyncio_thread
+        self,
+        mock_rds_client,
+        mock_rds_context_allowed,
+        mock_asyncio_thread,
+        issue_confirmation_token,
     ):
         """Test error handling in parameter group reset."""
         mock_rds_client.reset_db_parameter_group.side_effect = Exception('Test error')
 
-        # Set up pending operation for confirmation
-        _pending_operations['test-token'] = (
+        token = issue_confirmation_token(
             'ResetDBInstanceParameterGroup',
-            {'db_parameter_group_name': 'test-parameter-group', 'reset_all_parameters': True},
-            time.time() + 300,  # 5 minutes from now
+            db_parameter_group_name='test-parameter-group',
+            reset_all_parameters=True,
         )
 
-        async def async_return(func, **kwargs):
-            return func(**kwargs)
-
-        mock_asyncio_thread.side_effect = async_return
-
         result = await reset_db_instance_parameter_group(
             db_parameter_group_name='test-parameter-group',
             reset_all_parameters=True,
-            confirmation_token='test-token',
+            confirmation_token=token,
         )
 
         assert hasattr(result, 'error') or (isinstance(result, dict) and 'error' in result)